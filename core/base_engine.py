@@ -13,6 +13,15 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union, Any
 import hashlib
 import time
+import threading
+
+# የወላጅ ፎልደር መጨመር ለኢምፖርቶች
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.research_ranker import ResearchRanker
+from utils.pipeline_executor import PipelineStep, PipelineExecutor
+from utils.output_store import OutputStore
+from core.image_resolver import ImageResolver
 
 # Logging setup for tracking across all versions
 logging.basicConfig(
@@ -55,6 +64,27 @@ class BaseProfitEngine:
         }
     }
     
+    # Model selection based on version
+    GROQ_MODELS = {
+        'v9': 'llama3-8b-8192',
+        'v10': 'mixtral-8x7b-32768',
+        'v11': 'llama3-70b-8192'
+    }
+    
+    # የሞዴሎቹ context መጠን (prompt + ምላሽ በ tokens)
+    GROQ_CONTEXT_WINDOWS = {
+        'llama3-8b-8192': 8192,
+        'mixtral-8x7b-32768': 32768,
+        'llama3-70b-8192': 8192
+    }
+    
+    # Image service candidates in order of preference
+    IMAGE_SERVICES = [
+        "https://image.pollinations.ai/prompt/{prompt}?width=1200&height=800&nologo=true&seed={seed}",
+        "https://api.placeholder.ai/v1/image?text={short_prompt}&width=1200&height=800",
+        "https://dummyimage.com/1200x800/3498db/ffffff&text={tiny_prompt}"
+    ]
+    
     def __init__(self, version: str = 'v9', config_path: str = 'master_config.json'):
         """
         ማዕከላዊ ሞተር መጀመሪያ አደረጃጀት
@@ -82,6 +112,26 @@ class BaseProfitEngine:
         # Cache for API responses
         self.cache = {}
         
+        # ደረጃዎች በትይዩ ክሮች ስለሚሰሩ ካሽ እና ስታቲስቲክስ በዚህ መቆለፊያ ይጠበቃሉ
+        self._lock = threading.Lock()
+        
+        # BM25 ranker for research results
+        self.research_ranker = ResearchRanker()
+        
+        # Content-addressed output stores (one per version folder)
+        self.output_stores = {}
+        # የማከማቻው መቆለፊያ በአንድ ማከማቻ ውስጥ ብቻ ስለሚሰራ ለአንድ ፎልደር ሁለት ማከማቻ እንዳይፈጠር
+        self._output_stores_lock = threading.Lock()
+        
+        # Image URL validation with per-service health cache
+        image_settings = self.config.get('image_settings', {})
+        self.image_services = image_settings.get('services', self.IMAGE_SERVICES)
+        self.image_resolver = ImageResolver(
+            probe_timeout=image_settings.get('probe_timeout', 3),
+            render_timeout=image_settings.get('render_timeout', 30),
+            cooldown=image_settings.get('cooldown', 300)
+        )
+        
         # Statistics tracking
         self.stats = {
             'api_calls': 0,
@@ -135,7 +185,17 @@ class BaseProfitEngine:
             'content_settings': {
                 'max_length': 2000,
                 'min_length': 300,
-                'language': 'amharic'
+                'language': 'amharic',
+                'batch_size': 4  # generate_ai_content_batch
+            },
+            'storage_settings': {
+                'content_addressed': True,
+                'compression': 'auto'  # zstd ካለ, ካልሆነ gzip
+            },
+            'image_settings': {
+                'validate': True,
+                'probe_timeout': 3,
+                'cooldown': 300  # የወደቀ አገልግሎት የሚዘለልበት ሰከንድ
             },
             'version_overrides': {
                 'v9': {'simple_mode': True},
@@ -164,26 +224,33 @@ class BaseProfitEngine:
     
     def _check_cache(self, cache_key: str) -> Optional[Any]:
         """ካሽ ውስጥ ያለውን ውጤት ያወጣል"""
-        if cache_key in self.cache:
-            cache_entry = self.cache[cache_key]
-            if datetime.now() < cache_entry['expires']:
-                self.logger.debug(f"ካሽ ውጤት ተገኘ: {cache_key}")
-                return cache_entry['data']
-            else:
+        with self._lock:
+            cache_entry = self.cache.get(cache_key)
+            if cache_entry is None:
+                return None
+            if datetime.now() >= cache_entry['expires']:
                 # ያለፈ ካሽ ማጥፋት
                 del self.cache[cache_key]
-        return None
+                return None
+        self.logger.debug(f"ካሽ ውጤት ተገኘ: {cache_key}")
+        return cache_entry['data']
     
     def _save_to_cache(self, cache_key: str, data: Any, duration: int = 3600):
         """ውጤትን በካሽ ውስጥ ያስቀምጣል"""
         expires = datetime.now() + timedelta(seconds=duration)
-        self.cache[cache_key] = {
-            'data': data,
-            'expires': expires,
-            'created': datetime.now()
-        }
+        with self._lock:
+            self.cache[cache_key] = {
+                'data': data,
+                'expires': expires,
+                'created': datetime.now()
+            }
         self.logger.debug(f"ውጤት በካሽ ተቀምጧል: {cache_key}")
     
+    def _increment_stat(self, name: str, amount: int = 1):
+        """ስታቲስቲክስን ከሌሎች ክሮች ጋር ሳይጋጭ ይጨምራል"""
+        with self._lock:
+            self.stats[name] += amount
+    
     def fetch_research_data(self, topic: str, country: str = 'US') -> Dict[str, List]:
         """
         የተዋሃደ ዳሰሳ ዘዴ - ለሶስቱም ስሪቶች
@@ -202,7 +269,7 @@ class BaseProfitEngine:
             return cached_result
         
         self.logger.info(f"🔎 ምርምር እየተካሄደ ነው: {topic} in {country}")
-        self.stats['api_calls'] += 1
+        self._increment_stat('api_calls')
         
         research_data = {
             'news': [],
@@ -214,31 +281,34 @@ class BaseProfitEngine:
         # 1. News API Research (ለሶስቱም ስሪቶች)
         if self.news_key:
             try:
-                url = f"{self.news_url}?q={quote(topic)}&apiKey={self.news_key}&pageSize=10"
+                url = f"{self.news_url}?q={quote(topic)}&apiKey={self.news_key}&pageSize=20"
                 response = requests.get(url, timeout=self.version_config['timeout'])
                 
                 if response.status_code == 200:
                     articles = response.json().get('articles', [])
                     max_articles = self.version_config['max_articles']
                     
-                    for article in articles[:max_articles]:
+                    # BM25 ደረጃ መስጠት እና ተደጋጋሚ ዜናዎችን ማስወገድ
+                    ranked = self.research_ranker.rank(topic, articles, top_k=max_articles)
+                    
+                    for article, score in ranked:
                         research_data['news'].append({
-                            'title': article.get('title', 'No title'),
-                            'source': article.get('source', {}).get('name', 'Unknown'),
-                            'description': article.get('description', '')[:200],
+                            'title': article.get('title') or 'No title',
+                            'source': (article.get('source') or {}).get('name', 'Unknown'),
+                            'description': (article.get('description') or '')[:200],
                             'url': article.get('url', ''),
                             'date': article.get('publishedAt', ''),
-                            'relevance_score': self._calculate_relevance(topic, article.get('title', ''))
+                            'relevance_score': round(score, 4)
                         })
                     
-                    self.stats['articles_fetched'] += len(research_data['news'])
+                    self._increment_stat('articles_fetched', len(research_data['news']))
                     self.logger.info(f"📰 {len(research_data['news'])} ዜናዎች ተገኝተዋል")
                 else:
                     self.logger.warning(f"የዜና ኤፒአይ ስህተት: {response.status_code}")
                     
             except Exception as e:
                 self.logger.error(f"Research error: {e}")
-                self.stats['errors'] += 1
+                self._increment_stat('errors')
         
         # 2. Additional market research for v10 and v11
         if self.version in ['v10', 'v11']:
@@ -284,17 +354,6 @@ class BaseProfitEngine:
         
         return market_data
     
-    def _calculate_relevance(self, topic: str, text: str) -> float:
-        """የጽሁፍ ግንኙነት ደረጃ ያሰላል"""
-        topic_words = set(topic.lower().split())
-        text_words = set(text.lower().split())
-        
-        if not topic_words or not text_words:
-            return 0.0
-        
-        intersection = topic_words.intersection(text_words)
-        return len(intersection) / len(topic_words)
-    
     def _generate_statistics(self, research_data: Dict) -> Dict:
         """ስታቲስቲክስ ይፈጥራል (ለ v11)"""
         stats = {
@@ -339,7 +398,7 @@ class BaseProfitEngine:
             return cached_result
         
         self.logger.info(f"🤖 AI ይዘት እየተፈጠረ ነው ለ: {topic} (ሁነታ: {mode})")
-        self.stats['api_calls'] += 1
+        self._increment_stat('api_calls')
         
         # Prepare prompts based on version and mode
         system_prompt, user_prompt = self._prepare_prompts(topic, context_data, mode)
@@ -349,21 +408,14 @@ class BaseProfitEngine:
             "Content-Type": "application/json"
         }
         
-        # Model selection based on version
-        model_mapping = {
-            'v9': 'llama3-8b-8192',
-            'v10': 'mixtral-8x7b-32768',
-            'v11': 'llama3-70b-8192'
-        }
-        
         payload = {
-            "model": model_mapping.get(self.version, 'llama3-8b-8192'),
+            "model": self.GROQ_MODELS.get(self.version, 'llama3-8b-8192'),
             "messages": [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ],
             "temperature": 0.7 if self.version == 'v9' else 0.5,
-            "max_tokens": 1024 if self.version == 'v9' else 2048 if self.version == 'v10' else 4096
+            "max_tokens": self._content_token_limit()
         }
         
         try:
@@ -376,7 +428,7 @@ class BaseProfitEngine:
                 # Post-process content based on version
                 content = self._post_process_content(content, mode)
                 
-                self.stats['content_generated'] += 1
+                self._increment_stat('content_generated')
                 self.logger.info(f"✅ AI ይዘት ተፈጥሯል ({len(content)} ቁምፊዎች)")
                 
                 # Cache the result
@@ -386,15 +438,178 @@ class BaseProfitEngine:
             else:
                 error_msg = f"API ስህተት: {response.status_code} - {response.text}"
                 self.logger.error(error_msg)
-                self.stats['errors'] += 1
+                self._increment_stat('errors')
                 return error_msg
                 
         except Exception as e:
             error_msg = f"AI ማመንጨት ላይ ስህተት: {e}"
             self.logger.error(error_msg)
-            self.stats['errors'] += 1
+            self._increment_stat('errors')
             return error_msg
     
+    def generate_ai_content_batch(self, topics: List[str], context_map: Optional[Dict[str, Dict]] = None,
+                                  mode: str = None, batch_size: Optional[int] = None) -> Dict[str, str]:
+        """
+        ብዙ አጭር ርዕሶችን በአንድ የ Groq ጥያቄ ያመነጫል (ለ v9-አይነት አጭር ጽሁፎች)
+        
+        Args:
+            topics (List[str]): ርዕሰ ጉዳዮች
+            context_map (Dict[str, Dict], optional): ለእያንዳንዱ ርዕስ የዳሰሳ መረጃ
+            mode (str): የማመንጨት ሁነታ (standard/enhanced/enterprise)
+            batch_size (int, optional): በአንድ ጥያቄ የሚካተቱ ርዕሶች ብዛት
+            
+        Returns:
+            Dict[str, str]: ርዕስ -> የተመነጨው ይዘት
+        """
+        if mode is None:
+            mode = 'enterprise' if self.version == 'v11' else 'standard'
+        
+        if batch_size is None:
+            batch_size = self.config.get('content_settings', {}).get('batch_size', 4)
+        
+        context_map = context_map or {}
+        results = {}
+        pending = []
+        per_topic_tokens = self._content_token_limit()
+        
+        # ካሽ ውስጥ ያሉትን መጀመሪያ መውሰድ
+        for topic in dict.fromkeys(topics):
+            context_data = context_map.get(topic, {})
+            cache_key = self._get_cache_key('ai_content', topic, mode, str(context_data)[:100])
+            cached_result = self._check_cache(cache_key)
+            
+            if cached_result:
+                results[topic] = cached_result
+            else:
+                pending.append((topic, context_data, cache_key))
+        
+        if not self.groq_key:
+            for topic, _, _ in pending:
+                results[topic] = "ስህተት: GROQ_API_KEY አልተገኘም"
+            return results
+        
+        start = 0
+        while start < len(pending):
+            chunk = pending[start:start + max(1, batch_size)]
+            messages = self._batch_messages(chunk, mode)
+            
+            # prompt እና የሁሉም ርዕሶች ምላሽ በሞዴሉ context ውስጥ እስኪገቡ ቡድኑን ማሳነስ
+            while len(chunk) > 1 and not self._fits_context(messages, per_topic_tokens * len(chunk)):
+                chunk = chunk[:-1]
+                messages = self._batch_messages(chunk, mode)
+            start += len(chunk)
+            
+            batch_contents = {}
+            if len(chunk) > 1:
+                batch_contents = self._request_content_batch(
+                    [topic for topic, _, _ in chunk], messages, per_topic_tokens * len(chunk), mode
+                )
+            
+            for topic, context_data, cache_key in chunk:
+                content = batch_contents.get(topic)
+                
+                if content is None:
+                    # የቡድን ምላሽ መከፋፈል ካልተቻለ በተናጠል መጠየቅ
+                    results[topic] = self.generate_ai_content(topic, context_data, mode)
+                    continue
+                
+                content = self._post_process_content(content, mode)
+                self._increment_stat('content_generated')
+                self._save_to_cache(cache_key, content, duration=10800)  # 3 hours
+                results[topic] = content
+        
+        return results
+    
+    def _content_token_limit(self) -> int:
+        """ለአንድ ጽሁፍ የሚፈቀደው ከፍተኛ የምላሽ tokens"""
+        return 1024 if self.version == 'v9' else 2048 if self.version == 'v10' else 4096
+    
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """የ tokens ብዛት ግምት (ASCII ~4 ቁምፊ በ token፣ የግዕዝ እና ሌሎች ቁምፊዎች ~1 token)"""
+        ascii_chars = sum(1 for char in text if char < '\x80')
+        return ascii_chars // 4 + (len(text) - ascii_chars) + 1
+    
+    def _fits_context(self, messages: List[Dict], max_tokens: int) -> bool:
+        """prompt እና የሚጠየቀው ምላሽ በሞዴሉ context ውስጥ እንደሚገቡ ያረጋግጣል"""
+        model = self.GROQ_MODELS.get(self.version, 'llama3-8b-8192')
+        context_window = self.GROQ_CONTEXT_WINDOWS.get(model, 8192)
+        prompt_tokens = sum(self._estimate_tokens(message['content']) for message in messages)
+        # 256: የ chat template እና የ JSON ቅርጽ ትርፍ
+        return prompt_tokens + max_tokens + 256 <= context_window
+    
+    @staticmethod
+    def _topic_key(topic: str) -> str:
+        """ርዕሶችን ለማዛመድ ክፍተትን እና የፊደል መጠንን ያስተካክላል"""
+        return ' '.join(str(topic).split()).casefold()
+    
+    def _batch_messages(self, chunk: List[tuple], mode: str) -> List[Dict]:
+        """ለቡድን ጥያቄ የሚላኩ መልዕክቶችን ያዘጋጃል"""
+        system_prompt = None
+        sections = []
+        for index, (topic, context_data, _) in enumerate(chunk, 1):
+            topic_system_prompt, user_prompt = self._prepare_prompts(topic, context_data, mode)
+            system_prompt = system_prompt or topic_system_prompt
+            sections.append(f"### {index}. {topic}\n{user_prompt}")
+        
+        batch_instructions = (
+            "ለሚከተሉት እያንዳንዱ ርዕሶች የተለየ ጽሁፍ ፍጠር። "
+            "መልሱን በዚህ JSON ቅርጽ ብቻ መልስ: "
+            '{"articles": [{"topic": "<ርዕስ>", "content": "<ጽሁፍ>"}]} '
+            "የ topic ዋጋ ከተሰጠው ርዕስ ጋር በትክክል አንድ ይሁን።\n\n"
+        )
+        
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": batch_instructions + "\n\n".join(sections)}
+        ]
+    
+    def _request_content_batch(self, topics: List[str], messages: List[Dict], max_tokens: int,
+                               mode: str) -> Dict[str, str]:
+        """በአንድ የተዋቀረ (JSON) ጥያቄ ብዙ ርዕሶችን ጠይቆ ምላሹን በርዕስ ይከፋፍላል"""
+        self.logger.info(f"🤖 AI ይዘት በቡድን እየተፈጠረ ነው ለ {len(topics)} ርዕሶች (ሁነታ: {mode})")
+        self._increment_stat('api_calls')
+        
+        payload = {
+            "model": self.GROQ_MODELS.get(self.version, 'llama3-8b-8192'),
+            "messages": messages,
+            "temperature": 0.7 if self.version == 'v9' else 0.5,
+            "max_tokens": max_tokens,
+            "response_format": {"type": "json_object"}
+        }
+        
+        headers = {
+            "Authorization": f"Bearer {self.groq_key}",
+            "Content-Type": "application/json"
+        }
+        
+        try:
+            response = requests.post(self.groq_url, headers=headers, json=payload, timeout=60)
+            
+            if response.status_code != 200:
+                self.logger.warning(f"የቡድን ጥያቄ አልተሳካም: {response.status_code}, በተናጠል እንሞክራለን")
+                return {}
+            
+            raw_content = response.json()['choices'][0]['message']['content']
+            articles = json.loads(raw_content).get('articles', [])
+            
+        except (ValueError, KeyError, IndexError, TypeError, AttributeError, requests.RequestException) as e:
+            self.logger.warning(f"የቡድን ምላሽ መከፋፈል አልተቻለም: {e}, በተናጠል እንሞክራለን")
+            return {}
+        
+        # ውጤቶች በርዕስ ብቻ ይዛመዳሉ - ያልተዛመዱ ርዕሶች በተናጠል ይጠየቃሉ
+        topics_by_key = {self._topic_key(topic): topic for topic in topics}
+        contents = {}
+        for article in articles:
+            if not isinstance(article, dict) or not isinstance(article.get('content'), str):
+                continue
+            
+            topic = topics_by_key.get(self._topic_key(article.get('topic', '')))
+            if topic is not None and article['content'].strip():
+                contents.setdefault(topic, article['content'])
+        
+        return contents
+    
     def _prepare_prompts(self, topic: str, context_data: Dict, mode: str) -> tuple:
         """ለተለያዩ ሁነታዎች የሚሆን ፕሮምፕት ያዘጋጃል"""
         
@@ -461,13 +676,14 @@ class BaseProfitEngine:
         
         return content
     
-    def generate_image_url(self, topic: str, style: str = None) -> str:
+    def generate_image_url(self, topic: str, style: str = None, budget: float = None) -> str:
         """
         ምስል የሚያመነጭ አገልግሎት ይጠቅማል
         
         Args:
             topic (str): የሚፈለገው ርዕሰ ጉዳይ
             style (str): የምስል ዘይቤ (ምርጫ)
+            budget (float): ለፍተሻው የሚፈቀደው ከፍተኛ ሰከንድ (ምርጫ)
             
         Returns:
             str: የምስሉ URL
@@ -476,7 +692,7 @@ class BaseProfitEngine:
             style = self.version_config['image_style']
         
         self.logger.info(f"🎨 ምስል እየተፈጠረ ነው ለ: {topic} (ዘይቤ: {style})")
-        self.stats['images_created'] += 1
+        self._increment_stat('images_created')
         
         # Prepare image prompt based on version and style
         image_prompts = {
@@ -496,12 +712,26 @@ class BaseProfitEngine:
         
         # Use multiple image service options for fallback
         image_services = [
-            f"https://image.pollinations.ai/prompt/{quote(prompt)}?width=1200&height=800&nologo=true&seed={seed}",
-            f"https://api.placeholder.ai/v1/image?text={quote(prompt[:50])}&width=1200&height=800",
-            f"https://dummyimage.com/1200x800/3498db/ffffff&text={quote(prompt[:30])}"
+            template.format(
+                prompt=quote(prompt),
+                short_prompt=quote(prompt[:50]),
+                tiny_prompt=quote(prompt[:30]),
+                seed=seed
+            )
+            for template in self.image_services
         ]
         
-        return image_services[0]  # Return primary service
+        if not self.config.get('image_settings', {}).get('validate', True):
+            return image_services[0]  # Return primary service
+        
+        # በትይዩ መፈተሽ እና የመጀመሪያውን የሚሰራ መምረጥ
+        image_url = self.image_resolver.resolve(image_services, timeout=budget)
+        
+        if image_url is None:
+            self.logger.warning("⚠️ ምንም የሚሰራ የምስል አገልግሎት አልተገኘም, የመጨረሻውን አማራጭ እየተጠቀምን ነው")
+            image_url = image_services[-1]
+        
+        return image_url
     
     def save_output(self, filename: str, data: str, version_folder: str = None) -> Dict:
         """
@@ -524,6 +754,10 @@ class BaseProfitEngine:
         # Clean filename
         safe_filename = self._clean_filename(filename)
         
+        storage_settings = self.config.get('storage_settings', {})
+        if storage_settings.get('content_addressed', True):
+            return self._save_to_store(safe_filename, data, version_folder, storage_settings)
+        
         # Add timestamp and extension
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         final_filename = f"{safe_filename}_{timestamp}.txt"
@@ -546,7 +780,7 @@ class BaseProfitEngine:
             
         except Exception as e:
             self.logger.error(f"ፋይል ማስቀመጥ አልተቻለም: {e}")
-            self.stats['errors'] += 1
+            self._increment_stat('errors')
             
             return {
                 'success': False,
@@ -554,6 +788,43 @@ class BaseProfitEngine:
                 'path': path
             }
     
+    def _save_to_store(self, name: str, data: str, version_folder: str, storage_settings: Dict) -> Dict:
+        """ውጤቱን በይዘት ሃሽ በተጨመቀ ማከማቻ ውስጥ ያስቀምጣል (ተመሳሳይ ይዘት አንድ ጊዜ ብቻ)"""
+        try:
+            with self._output_stores_lock:
+                store = self.output_stores.get(version_folder)
+                if store is None:
+                    store = OutputStore(version_folder, storage_settings.get('compression', 'auto'))
+                    self.output_stores[version_folder] = store
+            
+            stored = store.put(data, topic=name, version=self.version, name=name)
+            
+            if stored['deduplicated']:
+                self.logger.info(f"♻️ ተመሳሳይ ይዘት ቀድሞ ተቀምጧል: {stored['hash'][:12]}")
+            else:
+                self.logger.info(f"✅ ፋይል ተቀምጧል: {stored['path']}")
+            
+            return {
+                'success': True,
+                'path': stored['path'],
+                'filename': os.path.basename(stored['path']),
+                'hash': stored['hash'],
+                'size': stored['size'],
+                'stored_size': stored['stored_size'],
+                'deduplicated': stored['deduplicated'],
+                'timestamp': stored['timestamp']
+            }
+            
+        except Exception as e:
+            self.logger.error(f"ፋይል ማስቀመጥ አልተቻለም: {e}")
+            self._increment_stat('errors')
+            
+            return {
+                'success': False,
+                'error': str(e),
+                'path': version_folder
+            }
+    
     def save_json_output(self, filename: str, data: Dict, version_folder: str = None) -> Dict:
         """
         JSON ውሂብን ያስቀምጣል
@@ -587,6 +858,30 @@ class BaseProfitEngine:
         
         return filename
     
+    def _pipeline_mode(self) -> str:
+        """የሙሉው ሂደት የይዘት ማመንጨት ሁነታ"""
+        return 'enterprise' if self.version == 'v11' else 'enhanced' if self.version == 'v10' else 'standard'
+    
+    def run_batch_pipeline(self, topics: List[str], country: str = 'US') -> List[Dict]:
+        """
+        ብዙ ርዕሶችን ያስፈጽማል - የ AI ይዘቱ በ generate_ai_content_batch በጥቂት ጥያቄዎች ተመንጭቶ
+        በካሽ ይቀመጣል፣ ከዚያ እያንዳንዱ ርዕስ በ run_complete_pipeline ያለ ተጨማሪ የ Groq ጥሪ ይጠናቀቃል
+        
+        Args:
+            topics (List[str]): ርዕሰ ጉዳዮች
+            country (str): ሀገር
+            
+        Returns:
+            List[Dict]: የእያንዳንዱ ርዕስ የሙሉ ሂደት ውጤት
+        """
+        topics = list(dict.fromkeys(topics))
+        
+        # የዳሰሳ ውጤቶቹ በካሽ ስለሚቀመጡ የይዘቱ የካሽ ቁልፍ ከ run_complete_pipeline ጋር አንድ ይሆናል
+        context_map = {topic: self.fetch_research_data(topic, country) for topic in topics}
+        self.generate_ai_content_batch(topics, context_map, self._pipeline_mode())
+        
+        return [self.run_complete_pipeline(topic, country) for topic in topics]
+    
     def run_complete_pipeline(self, topic: str, country: str = 'US') -> Dict:
         """
         ሙሉውን የስራ ሂደት ያስፈጽማል
@@ -612,49 +907,91 @@ class BaseProfitEngine:
             'statistics': self.stats.copy()
         }
         
+        mode = self._pipeline_mode()
+        step_timeout = self.version_config['timeout']
+        # Pollinations ምስሉን እስኪሰራ ከደረጃው ጊዜ በላይ እንዳይጠበቅ፣ ፍተሻው ከደረጃው ጊዜ በፊት ያልቃል
+        image_budget = step_timeout * 0.8
+        
+        # የደረጃዎች ጥገኝነት ግራፍ - ምስል እና የዳሰሳ ማስቀመጥ በይዘት ማመንጨት ላይ አይጠብቁም
+        steps = [
+            PipelineStep('research', lambda deps: self.fetch_research_data(topic, country),
+                         timeout=step_timeout * 2, retries=1),
+            PipelineStep('content_generation',
+                         lambda deps: self.generate_ai_content(topic, deps['research'], mode),
+                         depends_on=['research'], timeout=60, retries=1),
+            PipelineStep('image_generation',
+                         lambda deps: self.generate_image_url(topic, budget=image_budget),
+                         timeout=step_timeout, retries=1, required=False),
+            PipelineStep('saving', lambda deps: self.save_output(topic, deps['content_generation']),
+                         depends_on=['content_generation'], timeout=30)
+        ]
+        
+        # Save Research Data (for v10 and v11)
+        if self.version in ['v10', 'v11']:
+            steps.append(PipelineStep(
+                'research_saving',
+                lambda deps: self.save_json_output(f"{topic}_research", deps['research']),
+                depends_on=['research'], timeout=30, required=False
+            ))
+        
+        # Generate report for v11
+        if self.version == 'v11':
+            def build_report(deps: Dict) -> Dict:
+                report = self._generate_comprehensive_report(
+                    topic, deps['content_generation'], deps['research'], deps.get('image_generation')
+                )
+                return self.save_output(f"{topic}_comprehensive_report", report)
+            
+            steps.append(PipelineStep(
+                'report', build_report,
+                depends_on=['research', 'content_generation'],
+                # ምስል ባይገኝም ሪፖርቱ ይሰራል
+                optional_depends_on=['image_generation'],
+                timeout=30, required=False
+            ))
+        
         try:
-            # Step 1: Research
-            result['pipeline_steps']['research'] = 'started'
-            research_data = self.fetch_research_data(topic, country)
-            result['pipeline_steps']['research'] = 'completed'
-            result['research_summary'] = {
-                'news_count': len(research_data.get('news', [])),
-                'market_data': len(research_data.get('market_data', [])),
-                'trends': len(research_data.get('trends', []))
-            }
+            executor = PipelineExecutor(steps, max_workers=4, logger=self.logger)
+            run = executor.run(status=result['pipeline_steps'])
+            outputs = run['results']
+            
+            if 'research' in outputs:
+                research_data = outputs['research']
+                result['research_summary'] = {
+                    'news_count': len(research_data.get('news', [])),
+                    'market_data': len(research_data.get('market_data', [])),
+                    'trends': len(research_data.get('trends', []))
+                }
             
-            # Step 2: Content Generation
-            result['pipeline_steps']['content_generation'] = 'started'
-            mode = 'enterprise' if self.version == 'v11' else 'enhanced' if self.version == 'v10' else 'standard'
-            content = self.generate_ai_content(topic, research_data, mode)
-            result['pipeline_steps']['content_generation'] = 'completed'
-            result['outputs']['content'] = content[:500] + "..." if len(content) > 500 else content
-            
-            # Step 3: Image Generation
-            result['pipeline_steps']['image_generation'] = 'started'
-            image_url = self.generate_image_url(topic)
-            result['pipeline_steps']['image_generation'] = 'completed'
-            result['outputs']['image_url'] = image_url
-            
-            # Step 4: Save Content
-            result['pipeline_steps']['saving'] = 'started'
-            save_result = self.save_output(topic, content)
-            result['pipeline_steps']['saving'] = 'completed'
-            result['outputs']['saved_file'] = save_result
-            
-            # Step 5: Save Research Data (for v10 and v11)
-            if self.version in ['v10', 'v11']:
-                research_save = self.save_json_output(f"{topic}_research", research_data)
-                result['outputs']['research_file'] = research_save
-            
-            # Step 6: Generate report for v11
-            if self.version == 'v11':
-                report = self._generate_comprehensive_report(topic, content, research_data, image_url)
-                report_save = self.save_output(f"{topic}_comprehensive_report", report)
-                result['outputs']['comprehensive_report'] = report_save
-            
-            result['pipeline_steps']['overall'] = 'completed'
-            result['success'] = True
+            if 'content_generation' in outputs:
+                content = outputs['content_generation']
+                result['outputs']['content'] = content[:500] + "..." if len(content) > 500 else content
+            
+            if 'image_generation' in outputs:
+                result['outputs']['image_url'] = outputs['image_generation']
+            
+            if 'saving' in outputs:
+                result['outputs']['saved_file'] = outputs['saving']
+            
+            if 'research_saving' in outputs:
+                result['outputs']['research_file'] = outputs['research_saving']
+            
+            if 'report' in outputs:
+                result['outputs']['comprehensive_report'] = outputs['report']
+            
+            result['step_durations'] = run['durations']
+            if run['errors']:
+                result['errors'] = run['errors']
+            
+            if not run['success']:
+                result['pipeline_steps']['overall'] = 'failed'
+                result['success'] = False
+                result['error'] = '; '.join(f"{name}: {error}" for name, error in run['errors'].items())
+                self.logger.error(f"❌ ፋይል ሂደቱ አልተሳካም: {result['error']}")
+            else:
+                # አስፈላጊ ያልሆኑ ደረጃዎች ብቻ ካልተሳኩ ሂደቱ በከፊል ተጠናቋል
+                result['pipeline_steps']['overall'] = 'partial' if run['errors'] else 'completed'
+                result['success'] = True
             
             elapsed_time = time.time() - start_time
             result['execution_time'] = f"{elapsed_time:.2f} ሰከንድ"
@@ -669,8 +1006,10 @@ class BaseProfitEngine:
         
         return result
     
-    def _generate_comprehensive_report(self, topic: str, content: str, research_data: Dict, image_url: str) -> str:
+    def _generate_comprehensive_report(self, topic: str, content: str, research_data: Dict,
+                                       image_url: Optional[str]) -> str:
         """ለ v11 ዝርዝር ሪፖርት ይፈጥራል"""
+        image_section = f"![Business Strategy]({image_url})" if image_url else "_ምስል አልተገኘም_"
         report = f"""# የቢዝነስ ስትራቴጂ ሪፖርት
 ## ርዕሰ ጉዳይ: {topic}
 ## የተፈጠረበት ቀን: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
@@ -691,7 +1030,7 @@ class BaseProfitEngine:
 ---
 
 ## 3. የምስል ማጣቀሻ
-![Business Strategy]({image_url})
+{image_section}
 
 ---
 
@@ -712,14 +1051,15 @@ class BaseProfitEngine:
         return {
             'version': self.version,
             'timestamp': datetime.now().isoformat(),
-            'statistics': self.stats,
+            'statistics': dict(self.stats),
             'cache_size': len(self.cache),
             'config_version': self.config.get('version', '1.0')
         }
     
     def clear_cache(self):
         """ካሽ ያጽዳል"""
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
         self.logger.info("✅ ካሽ ተጽድቋል")
 
 # Utility function for easy import
@@ -736,19 +1076,24 @@ def create_engine(version: str = 'v9', config_path: str = 'master_config.json')
     """
     return BaseProfitEngine(version=version, config_path=config_path)
 
-# Example usage
+# Example usage: python -m core.base_engine [ርዕስ ...]
 if __name__ == "__main__":
     # Test the engine
     engine = BaseProfitEngine(version='v11')
     
-    # Run complete pipeline
-    result = engine.run_complete_pipeline("የኢትዮጵያ የቴክ ኢንዱስትሪ", country="ET")
+    # ከአንድ በላይ ርዕሶች ሲሰጡ ይዘታቸው በቡድን የ Groq ጥያቄዎች ይመነጫል
+    topics = sys.argv[1:] or ["የኢትዮጵያ የቴክ ኢንዱስትሪ"]
+    if len(topics) > 1:
+        results = engine.run_batch_pipeline(topics, country="ET")
+    else:
+        results = [engine.run_complete_pipeline(topics[0], country="ET")]
     
-    print(f"ስሪት: {result['version']}")
-    print(f"ርዕሰ ጉዳይ: {result['topic']}")
-    print(f"ሁኔታ: {'✅ ተሳክቷል' if result.get('success') else '❌ አልተሳካም'}")
-    print(f"ሰዓት: {result.get('execution_time', 'N/A')}")
-    print(f"የዜናዎች ብዛት: {result.get('research_summary', {}).get('news_count', 0)}")
+    for result in results:
+        print(f"ስሪት: {result['version']}")
+        print(f"ርዕሰ ጉዳይ: {result['topic']}")
+        print(f"ሁኔታ: {'✅ ተሳክቷል' if result.get('success') else '❌ አልተሳካም'}")
+        print(f"ሰዓት: {result.get('execution_time', 'N/A')}")
+        print(f"የዜናዎች ብዛት: {result.get('research_summary', {}).get('news_count', 0)}")
     
     # Get statistics
     stats = engine.get_statistics()
@@ -5,7 +5,8 @@
 import os
 import sys
 import json
-from typing import Dict, List, Optional
+import time
+from typing import Callable, Dict, Iterable, List, Optional
 from datetime import datetime
 
 # የወላጅ ፎልደር መጨመር ለኢምፖርቶች
@@ -16,6 +17,8 @@ from utils import get_logger, get_file_manager, get_validator
 from utils.logger import ProfitLogger
 from utils.file_manager import FileManager
 from utils.validators import Validators
+from utils.batch_executor import BatchExecutor
+from utils.batch_archive import BatchArchive
 
 # ሌሎች ኢምፖርቶች
 from templates.version_templates import get_template_for_version
@@ -39,6 +42,7 @@ class EnhancedUnifiedEngine:
             raise ValueError(f"ስሪት ማረጋገጫ አልተቻለም: {message}")
         
         self.version = version.lower()
+        self.config_path = config_path
         
         # መሰረታዊ ቅንብሮች
         self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -60,6 +64,9 @@ class EnhancedUnifiedEngine:
         from utils.api_client import APIClient
         self.api_client = APIClient(self.version, self.config)
         
+        # በቡድን ሂደት ጊዜ ውጤቶች የሚታሸጉበት ማህደር (pack_batch_outputs)
+        self.batch_archive: Optional[BatchArchive] = None
+        
         self.logger.info(f"🚀 {self.version.upper()} እንጂን ተጀምሯል")
     
     def _load_config(self, config_path: str) -> Dict:
@@ -127,7 +134,8 @@ class EnhancedUnifiedEngine:
             "system_settings": {
                 "auto_backup": True,
                 "cleanup_days": 7,
-                "max_file_size": "10MB"
+                "max_file_size": "10MB",
+                "pack_batch_outputs": False
             }
         }
     
@@ -221,7 +229,10 @@ class EnhancedUnifiedEngine:
     # ... (ሌሎች ዘዴዎች ከቀድሞ ኮድ ጋር ተመሳሳይ ናቸው)
     
     def save_outputs(self, topic: str, outputs: Dict) -> List[str]:
-        """ሁሉንም ውጤቶች ይቀምጣል"""
+        """ሁሉንም ውጤቶች ይቀምጣል (የቡድን ማህደር ካለ በአንድ መዝገብ ይታሸጋሉ)"""
+        if self.batch_archive is not None:
+            return self._save_to_batch_archive(topic, outputs)
+        
         saved_files = []
         
         for output_type, content in outputs.items():
@@ -265,10 +276,64 @@ class EnhancedUnifiedEngine:
         
         return saved_files
     
-    def batch_process(self, topics: List[str], country: str = "ET") -> Dict:
+    def _save_to_batch_archive(self, topic: str, outputs: Dict) -> List[str]:
+        """ሁሉንም ውጤቶች በቡድኑ ማህደር ውስጥ እንደ አንድ መዝገብ ያስቀምጣል"""
+        packed = {key: value for key, value in outputs.items() if key != "image_url"}
+        
+        try:
+            entry = self.batch_archive.append(topic, packed, {
+                "version": self.version,
+                "image_url": outputs.get("image_url")
+            })
+            self.logger.info(f"ውጤቶች ታሽገዋል: {entry['path']} (offset {entry['offset']})")
+            return [entry["path"]]
+        except Exception as e:
+            self.logger.error(f"ውጤቶችን ማሸግ አልተቻለም {topic}: {e}")
+            return []
+    
+    def _packing_enabled(self) -> bool:
+        """ውጤቶችን በቡድን ማህደር ማሸግ መፈቀዱን ያረጋግጣል"""
+        return bool(self.config.get("system_settings", {}).get("pack_batch_outputs", False))
+    
+    def _open_batch_archive(self, batch_results: Dict) -> Optional[str]:
+        """ለቡድኑ ማህደር ይከፍታል (ከተፈቀደ) እና መንገዱን ይመልሳል"""
+        if not self._packing_enabled():
+            return None
+        
+        archive_path = os.path.join(
+            self.file_manager.base_dir, self.version.upper(), "batch_archives",
+            f"{batch_results['batch_id']}.jsonl"
+        )
+        self.batch_archive = BatchArchive(archive_path)
+        batch_results["archive_file"] = archive_path
+        return archive_path
+    
+    def batch_process(self, topics: List[str], country: str = "ET", workers: int = 1,
+                      task_timeout: Optional[float] = None, ordered: bool = True,
+                      progress_callback: Optional[Callable[[Dict], None]] = None,
+                      use_processes: bool = True) -> Dict:
         """
         ብዙ ርዕሰ ጉዳዮችን በቡድን ያካሂዳል
+        
+        Args:
+            topics (List[str]): ርዕሰ ጉዳዮች
+            country (str): ሀገር
+            workers (int): ከ 1 በላይ ከሆነ በ worker pool በትይዩ ይካሄዳል (የብዛት ገደብ የለም)
+            task_timeout (float, optional): ለአንድ ርዕሰ ጉዳይ የሚፈቀደው ከፍተኛ ሰከንድ (ለትይዩ ሂደት)
+            ordered (bool): ውጤቶችን በግብዓት ቅደም ተከተል መመዝገብ (ለትይዩ ሂደት)
+            progress_callback (Callable, optional): እያንዳንዱ ርዕሰ ጉዳይ ሲጠናቀቅ የሚጠራ
+            use_processes (bool): processes (True) ወይም threads (False) መጠቀም
+            
+        Returns:
+            Dict: የቡድን ማጠቃለያ
         """
+        if workers > 1:
+            return self.batch_process_parallel(
+                topics, country, workers=workers, task_timeout=task_timeout,
+                ordered=ordered, progress_callback=progress_callback,
+                use_processes=use_processes
+            )
+        
         # የቡድን ግብዓት ማረጋገጫ
         is_valid, message, valid_topics = self.validator.validate_batch_input(topics)
         
@@ -282,14 +347,8 @@ class EnhancedUnifiedEngine:
         
         self.logger.info(f"📦 የቡድን ሂደት እየተካሄደ ነው ለ {len(valid_topics)} ርዕሰ ጉዳዮች")
         
-        batch_results = {
-            "batch_id": f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            "version": self.version,
-            "total_topics": len(valid_topics),
-            "processed": 0,
-            "failed": 0,
-            "results": []
-        }
+        batch_results = self._new_batch_summary(len(valid_topics))
+        self._open_batch_archive(batch_results)
         
         for index, topic in enumerate(valid_topics, 1):
             self.logger.info(f"📝 እየሰራሁ ነው ({index}/{len(valid_topics)}): {topic}")
@@ -311,6 +370,8 @@ class EnhancedUnifiedEngine:
             if index % 5 == 0:
                 self.file_manager.backup_files(f"batch_backup_{index}")
         
+        self.batch_archive = None
+        
         # የቡድን ማጠቃለያ ማስቀመጥ
         summary_file = self.file_manager.save_json(
             f"batch_summary_{batch_results['batch_id']}",
@@ -321,3 +382,222 @@ class EnhancedUnifiedEngine:
         self.logger.info(f"📊 ቡድን ሂደት ተጠናቋል: {batch_results['processed']} ተሳክተዋል, {batch_results['failed']} አልተሳኩም")
         
         return batch_results
+    
+    def batch_process_parallel(self, topics: List[str], country: str = "ET", workers: int = 4,
+                               task_timeout: Optional[float] = None, ordered: bool = True,
+                               progress_callback: Optional[Callable[[Dict], None]] = None,
+                               use_processes: bool = True) -> Dict:
+        """
+        ብዙ ርዕሰ ጉዳዮችን በ worker pool በትይዩ ያካሂዳል
+        ማጠቃለያው ውጤቶች ሲደርሱ ይገነባል፣ ሙሉ ይዘት ሳይሆን የፋይል መንገዶች ብቻ ይያዛሉ
+        
+        Args:
+            topics (List[str]): ርዕሰ ጉዳዮች
+            country (str): ሀገር
+            workers (int): የ worker ብዛት
+            task_timeout (float, optional): ለአንድ ርዕሰ ጉዳይ የሚፈቀደው ከፍተኛ ሰከንድ
+            ordered (bool): ውጤቶችን በግብዓት ቅደም ተከተል መመዝገብ
+            progress_callback (Callable, optional): እያንዳንዱ ርዕሰ ጉዳይ ሲጠናቀቅ የሚጠራ
+            use_processes (bool): processes (True) ወይም threads (False) መጠቀም
+            
+        Returns:
+            Dict: የቡድን ማጠቃለያ
+        """
+        is_valid, message, valid_topics = self.validator.validate_batch_input(topics, enforce_limit=False)
+        
+        if not valid_topics:
+            self.logger.error(f"የቡድን ግብዓት ማረጋገጫ አልተቻለም: {message}")
+            return {
+                "status": "failed",
+                "error": message,
+                "valid_topics": valid_topics
+            }
+        
+        if not is_valid:
+            # ትክክለኛ ያልሆኑት ይዘለላሉ፣ ሌሎቹ ይቀጥላሉ
+            self.logger.warning(message)
+        
+        self.logger.info(f"📦 ትይዩ የቡድን ሂደት ለ {len(valid_topics)} ርዕሰ ጉዳዮች ({workers} workers)")
+        
+        batch_results = self._new_batch_summary(len(valid_topics))
+        
+        self._run_batch_executor(
+            ((topic, country) for topic in valid_topics), batch_results,
+            workers=workers, task_timeout=task_timeout, ordered=ordered,
+            progress_callback=progress_callback, use_processes=use_processes
+        )
+        
+        self.logger.info(f"📊 ትይዩ ቡድን ሂደት ተጠናቋል: {batch_results['processed']} ተሳክተዋል, {batch_results['failed']} አልተሳኩም ({batch_results['duration']} ሰከንድ)")
+        
+        return batch_results
+    
+    def batch_process_stream(self, source: Iterable[str], country: str = "ET", workers: int = 4,
+                             task_timeout: Optional[float] = None, ordered: bool = False,
+                             progress_callback: Optional[Callable[[Dict], None]] = None,
+                             use_processes: bool = True) -> Dict:
+        """
+        ከ TopicSource (ወይም ከማንኛውም iterable) የሚመጡ ርዕሰ ጉዳዮችን ያካሂዳል
+        ግብዓቱ በ back-pressure ይነበባል፣ የእያንዳንዱ ርዕሰ ጉዳይ ውጤት ወደ JSONL ፋይል ይጻፋል
+        
+        Args:
+            source (Iterable[str]): ርዕሰ ጉዳዮች (ለምሳሌ utils.topic_source.TopicSource)
+            country (str): ሀገር
+            workers (int): የ worker ብዛት
+            task_timeout (float, optional): ለአንድ ርዕሰ ጉዳይ የሚፈቀደው ከፍተኛ ሰከንድ
+            ordered (bool): ውጤቶችን በግብዓት ቅደም ተከተል መመዝገብ
+            progress_callback (Callable, optional): እያንዳንዱ ርዕሰ ጉዳይ ሲጠናቀቅ የሚጠራ
+            use_processes (bool): processes (True) ወይም threads (False) መጠቀም
+            
+        Returns:
+            Dict: የቡድን ማጠቃለያ (ዝርዝር ውጤቶቹ በ results_file ውስጥ)
+        """
+        batch_results = self._new_batch_summary(None)
+        
+        results_dir = os.path.join(self.file_manager.base_dir, self.version.upper(), "batch_summaries")
+        os.makedirs(results_dir, exist_ok=True)
+        results_path = os.path.join(results_dir, f"{batch_results['batch_id']}_results.jsonl")
+        batch_results["results_file"] = results_path
+        
+        # ያለፉ ሩጫዎችን ለመቀጠል TopicSource የተካሄዱትን ይመዘግባል
+        mark_processed = getattr(source, "mark_processed", None)
+        
+        self.logger.info(f"📦 የዥረት ቡድን ሂደት ተጀምሯል ({workers} workers)")
+        
+        with open(results_path, 'a', encoding='utf-8') as results_file:
+            def write_entry(entry: Dict):
+                results_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                results_file.flush()
+                if mark_processed and entry["status"] == "completed":
+                    mark_processed(entry["topic"])
+            
+            self._run_batch_executor(
+                ((topic, country) for topic in source), batch_results,
+                workers=workers, task_timeout=task_timeout, ordered=ordered,
+                progress_callback=progress_callback, use_processes=use_processes,
+                entry_sink=write_entry
+            )
+        
+        batch_results["total_topics"] = batch_results["processed"] + batch_results["failed"]
+        if hasattr(source, "stats"):
+            batch_results["source_stats"] = dict(source.stats)
+        
+        self.logger.info(f"📊 የዥረት ቡድን ሂደት ተጠናቋል: {batch_results['processed']} ተሳክተዋል, {batch_results['failed']} አልተሳኩም ({batch_results['duration']} ሰከንድ)")
+        
+        return batch_results
+    
+    def _run_batch_executor(self, tasks: Iterable, batch_results: Dict, workers: int,
+                            task_timeout: Optional[float], ordered: bool,
+                            progress_callback: Optional[Callable[[Dict], None]],
+                            use_processes: bool, entry_sink: Optional[Callable[[Dict], None]] = None):
+        """(topic, country) ስራዎችን በ BatchExecutor ያካሂዳል እና ማጠቃለያውን ያስቀምጣል"""
+        batch_results["workers"] = workers
+        archive_path = self._open_batch_archive(batch_results)
+        
+        if use_processes:
+            executor = BatchExecutor(
+                _process_topic_worker, max_workers=workers, use_processes=True,
+                task_timeout=task_timeout, ordered=ordered,
+                initializer=_init_batch_worker, initargs=(self.version, self.config_path, archive_path),
+                progress_callback=progress_callback, logger=self.logger.logger
+            )
+        else:
+            executor = BatchExecutor(
+                lambda task: _summarize_topic_result(self.process_topic(*task)),
+                max_workers=workers, use_processes=False,
+                task_timeout=task_timeout, ordered=ordered,
+                progress_callback=progress_callback, logger=self.logger.logger
+            )
+        
+        started_at = time.time()
+        
+        try:
+            for outcome in executor.run(tasks):
+                self._record_batch_outcome(batch_results, outcome, entry_sink)
+                
+                done = batch_results["processed"] + batch_results["failed"]
+                if done % 5 == 0:
+                    self.file_manager.backup_files(f"batch_backup_{done}")
+        finally:
+            self.batch_archive = None
+        
+        batch_results["duration"] = round(time.time() - started_at, 3)
+        
+        self.file_manager.save_json(
+            f"batch_summary_{batch_results['batch_id']}",
+            batch_results,
+            "batch_summaries"
+        )
+    
+    def _new_batch_summary(self, total_topics: Optional[int]) -> Dict:
+        """ባዶ የቡድን ማጠቃለያ ይፈጥራል"""
+        return {
+            "batch_id": f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            "version": self.version,
+            "total_topics": total_topics,
+            "processed": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "results": []
+        }
+    
+    def _record_batch_outcome(self, batch_results: Dict, outcome: Dict,
+                              entry_sink: Optional[Callable[[Dict], None]] = None):
+        """የአንድን ርዕሰ ጉዳይ ውጤት ወደ ማጠቃለያው (ወይም ወደ entry_sink) ይጨምራል"""
+        topic = outcome["item"][0]
+        
+        if outcome["status"] == "completed":
+            entry = outcome["result"]
+        else:
+            entry = {
+                "topic": topic,
+                "status": outcome["status"],
+                "error": outcome["error"],
+                "file_paths": []
+            }
+        
+        entry["duration"] = outcome["duration"]
+        
+        if entry_sink:
+            entry_sink(entry)
+        else:
+            batch_results["results"].append(entry)
+        
+        if entry["status"] == "completed":
+            batch_results["processed"] += 1
+        else:
+            batch_results["failed"] += 1
+            if outcome["status"] == "timeout":
+                batch_results["timed_out"] += 1
+            self.logger.error(f"በቡድን ሂደት ላይ ስህተት ለ {topic}: {entry.get('error')}")
+
+
+# =================== ለትይዩ ቡድን ሂደት የ worker ተግባራት ===================
+
+# በእያንዳንዱ worker process ውስጥ አንድ እንጂን ብቻ ይፈጠራል
+_WORKER_ENGINE: Optional[EnhancedUnifiedEngine] = None
+
+
+def _init_batch_worker(version: str, config_path: str, archive_path: Optional[str] = None):
+    """በ worker process መጀመሪያ እንጂኑን ይፈጥራል"""
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = EnhancedUnifiedEngine(version, config_path)
+    
+    if archive_path:
+        _WORKER_ENGINE.batch_archive = BatchArchive(archive_path)
+
+
+def _summarize_topic_result(result: Dict) -> Dict:
+    """ለማጠቃለያ የሚያስፈልጉትን ብቻ ይይዛል (ሙሉ ይዘቱ በፋይሎች ውስጥ ነው)"""
+    return {
+        "topic": result.get("topic"),
+        "status": result.get("status"),
+        "timestamp": result.get("timestamp"),
+        "file_paths": result.get("file_paths", []),
+        "error": result.get("error")
+    }
+
+
+def _process_topic_worker(task) -> Dict:
+    """በ worker process ውስጥ አንድ ርዕሰ ጉዳይ ያካሂዳል"""
+    topic, country = task
+    return _summarize_topic_result(_WORKER_ENGINE.process_topic(topic, country))
@@ -0,0 +1,165 @@
+"""
+Core/image_resolver.py - የምስል አገልግሎቶችን በትይዩ የሚፈትሽ እና የሚሰራውን የሚመርጥ ሞጁል
+የማይሰሩ አገልግሎቶች ለተወሰነ ጊዜ (cooldown) ይዘለላሉ
+"""
+
+import time
+import logging
+import threading
+import concurrent.futures
+from urllib.parse import urlparse
+from typing import Dict, Iterable, List, Optional
+
+import requests
+
+
+class ImageResolver:
+    """የምስል URL እጩዎችን በ HEAD/partial GET የሚፈትሽ"""
+
+    # ምስሉን በጥያቄው ጊዜ የሚሰሩ አገልግሎቶች (የመጀመሪያው ምላሽ ብዙ ሰከንድ ሊወስድ ይችላል)
+    GENERATE_ON_REQUEST = ('image.pollinations.ai',)
+
+    def __init__(self, probe_timeout: float = 3.0, cooldown: float = 300.0,
+                 max_workers: int = 4, session: Optional[requests.Session] = None,
+                 render_timeout: float = 30.0,
+                 generate_on_request: Iterable[str] = GENERATE_ON_REQUEST):
+        """
+        የፈታሹ አደረጃጀት
+
+        Args:
+            probe_timeout (float): ለእያንዳንዱ ፍተሻ የሚፈቀደው ሰከንድ
+            cooldown (float): የወደቀ አገልግሎት የሚዘለልበት ሰከንድ
+            max_workers (int): በአንድ ጊዜ የሚፈተሹ ከፍተኛ እጩዎች
+            session (requests.Session, optional): የሚጠቀመው የ HTTP ሴሽን
+            render_timeout (float): ምስል በጥያቄ ለሚሰሩ አገልግሎቶች ምላሽ የሚጠበቅበት ሰከንድ
+            generate_on_request (Iterable[str]): ምስል በጥያቄ የሚሰሩ አገልግሎቶች (host)
+        """
+        self.probe_timeout = probe_timeout
+        self.render_timeout = render_timeout
+        self.generate_on_request = set(generate_on_request)
+        self.cooldown = cooldown
+        self.max_workers = max_workers
+        self.session = session or requests.Session()
+        self.logger = logging.getLogger("ImageResolver")
+
+        # አገልግሎት (host) -> የጤና ሁኔታ
+        self.service_health: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def service_name(url: str) -> str:
+        """የ URL ን አገልግሎት (host:port) ይመልሳል"""
+        return urlparse(url).netloc
+
+    def is_service_down(self, service: str) -> bool:
+        """አገልግሎቱ በ cooldown ውስጥ መሆኑን ያረጋግጣል"""
+        with self._lock:
+            health = self.service_health.get(service)
+            return bool(health and not health['healthy'] and time.time() < health['down_until'])
+
+    def _record_health(self, service: str, healthy: bool, detail: str = ''):
+        """የአገልግሎቱን የፍተሻ ውጤት ይመዘግባል"""
+        now = time.time()
+        with self._lock:
+            self.service_health[service] = {
+                'healthy': healthy,
+                'checked_at': now,
+                'down_until': 0 if healthy else now + self.cooldown,
+                'detail': detail
+            }
+
+    def probe(self, url: str) -> bool:
+        """
+        አንድን የምስል URL ይፈትሻል
+
+        Args:
+            url (str): የሚፈተሸው URL
+
+        Returns:
+            bool: URL ምስል የሚመልስ ከሆነ True
+        """
+        service = self.service_name(url)
+        # ምስል በጥያቄ የሚሰሩ አገልግሎቶች: ግንኙነቱ በ probe_timeout፣ ምላሹ በ render_timeout
+        if service in self.generate_on_request:
+            timeout = (self.probe_timeout, self.render_timeout)
+        else:
+            timeout = self.probe_timeout
+
+        try:
+            response = self.session.head(url, timeout=timeout, allow_redirects=True)
+
+            # HEAD የማይደግፉ አገልግሎቶች: የመጀመሪያውን ባይት ብቻ መጠየቅ
+            if response.status_code in (403, 405, 501):
+                response = self.session.get(
+                    url, timeout=timeout, stream=True,
+                    headers={'Range': 'bytes=0-0'}
+                )
+                response.close()
+
+            content_type = response.headers.get('Content-Type', '')
+            healthy = response.status_code < 400 and (not content_type or content_type.startswith('image/'))
+            detail = f"HTTP {response.status_code} {content_type}".strip()
+
+        except requests.RequestException as e:
+            healthy = False
+            detail = str(e)
+
+        self._record_health(service, healthy, detail)
+
+        if not healthy:
+            self.logger.warning(f"⚠️ የምስል አገልግሎት አይሰራም: {service} ({detail})")
+
+        return healthy
+
+    def resolve(self, candidates: List[str], timeout: Optional[float] = None) -> Optional[str]:
+        """
+        እጩዎችን በትይዩ ፈትሾ በቅድሚያ ቅደም ተከተል የመጀመሪያውን የሚሰራ ይመልሳል
+
+        Args:
+            candidates (List[str]): የምስል URL እጩዎች (በምርጫ ቅደም ተከተል)
+            timeout (float, optional): ከፍተኛው የመጠበቂያ ሰከንድ፤ ካለፈ ቀድሞ ከመለሱት
+                የሚሰሩ እጩዎች በምርጫ ቅደም ተከተል የመጀመሪያው ይመረጣል
+
+        Returns:
+            Optional[str]: የሚሰራ URL ወይም None
+        """
+        live_candidates = [url for url in candidates if not self.is_service_down(self.service_name(url))]
+
+        if not live_candidates:
+            return None
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(live_candidates))
+        )
+        try:
+            futures = [executor.submit(self.probe, url) for url in live_candidates]
+            deadline = None if timeout is None else time.monotonic() + timeout
+
+            # ሁሉም በትይዩ ይሰራሉ፣ ውጤቱ ግን በምርጫ ቅደም ተከተል ይታያል
+            for url, future in zip(live_candidates, futures):
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    if future.result(timeout=remaining):
+                        return url
+                except concurrent.futures.TimeoutError:
+                    self.logger.warning(f"⚠️ የምስል ፍተሻ ጊዜው አልፏል ({timeout}s): {self.service_name(url)}")
+                    return self._first_answered(live_candidates, futures)
+                except Exception as e:
+                    self.logger.debug(f"ፍተሻ አልተሳካም {url}: {e}")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return None
+
+    @staticmethod
+    def _first_answered(candidates: List[str], futures: List[concurrent.futures.Future]) -> Optional[str]:
+        """ጊዜው ሲያልቅ አስቀድመው ከመለሱት የሚሰሩ እጩዎች የመጀመሪያውን ይመልሳል"""
+        for url, future in zip(candidates, futures):
+            if future.done() and not future.cancelled() and future.exception() is None and future.result():
+                return url
+        return None
+
+    def get_health_report(self) -> Dict[str, Dict]:
+        """የአገልግሎቶችን የጤና ሁኔታ ያሳያል"""
+        with self._lock:
+            return {service: dict(health) for service, health in self.service_health.items()}
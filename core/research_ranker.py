@@ -0,0 +1,173 @@
+"""
+Core/research_ranker.py - የዳሰሳ ውጤቶችን በ BM25 የሚያደራጅ ሞጁል
+ለ fetch_research_data የዜና ውጤቶች ደረጃ መስጠት፣ ተደጋጋሚዎችን ማስወገድ እና top-k መምረጥ
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+# ቃላትን ለመለየት (ለአማርኛም ይሰራል)
+TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+# NewsAPI ርዕሶች መጨረሻ ላይ ያለው " - ምንጭ" ክፍል
+SOURCE_SUFFIX_PATTERN = re.compile(r'\s+[-|\u2013\u2014]\s+[^-|\u2013\u2014]+$')
+
+# በዜና ርዕሶች ውስጥ ተደጋጋሚ የሆኑ ትርጉም የሌላቸው ቃላት
+STOP_WORDS = {
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'be', 'as', 'it', 'its', 'from'
+}
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    ጽሁፍን ወደ ቃላት ይከፋፍላል
+
+    Args:
+        text (str): የሚከፋፈለው ጽሁፍ
+
+    Returns:
+        List[str]: ትንሽ ፊደል የሆኑ ቃላት
+    """
+    if not text:
+        return []
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOP_WORDS]
+
+
+class ResearchRanker:
+    """የዜና ውጤቶችን ከርዕሰ ጉዳዩ ጋር በ BM25 የሚያወዳድር"""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75,
+                 title_weight: float = 2.0, dedup_threshold: float = 0.8):
+        """
+        የደረጃ ሰጪ አደረጃጀት
+
+        Args:
+            k1 (float): የ BM25 የቃል ድግግሞሽ ሙሌት
+            b (float): የ BM25 የርዝመት ማስተካከያ
+            title_weight (float): የርዕስ ቃላት ክብደት ከመግለጫ አንጻር
+            dedup_threshold (float): ተመሳሳይ ዜናዎችን ለመለየት የ Jaccard ገደብ
+        """
+        self.k1 = k1
+        self.b = b
+        self.title_weight = title_weight
+        self.dedup_threshold = dedup_threshold
+
+    def rank(self, topic: str, articles: List[Dict], top_k: Optional[int] = None,
+             normalize: bool = True) -> List[Tuple[Dict, float]]:
+        """
+        ዜናዎችን በውጤት ቅደም ተከተል ያደራጃል
+
+        Args:
+            topic (str): የሚፈለገው ርዕሰ ጉዳይ
+            articles (List[Dict]): ከ NewsAPI የመጡ ዜናዎች (title, description)
+            top_k (int, optional): የሚመለሱ ከፍተኛ ዜናዎች ብዛት
+            normalize (bool): ውጤቱን ወደ [0, 1] መቀየር (False: ጥሬ BM25 ውጤት)
+
+        Returns:
+            List[Tuple[Dict, float]]: (ዜና, ውጤት) ከከፍተኛ ወደ ዝቅተኛ
+        """
+        query_terms = set(tokenize(topic))
+        if not articles:
+            return []
+
+        # እያንዳንዱን ዜና አንድ ጊዜ ብቻ መከፋፈል
+        documents = []
+        for article in articles:
+            title_tokens = tokenize(article.get('title'))
+            description_tokens = tokenize(article.get('description'))
+
+            term_freq = Counter()
+            for token in title_tokens:
+                term_freq[token] += self.title_weight
+            for token in description_tokens:
+                term_freq[token] += 1
+
+            length = len(title_tokens) * self.title_weight + len(description_tokens)
+            # ለተደጋጋሚ ማጣሪያ የምንጩን ስም ሳይጨምር
+            dedup_tokens = set(tokenize(SOURCE_SUFFIX_PATTERN.sub('', article.get('title') or '')))
+            documents.append((article, term_freq, length, dedup_tokens))
+
+        scores, upper_bound = self._score_documents(query_terms, documents)
+        if normalize and upper_bound > 0:
+            # ቅደም ተከተሉ አይቀየርም፣ ውጤቱ ግን በጥያቄዎች መካከል የሚወዳደር 0-1 ይሆናል
+            scores = [score / upper_bound for score in scores]
+
+        order = sorted(range(len(documents)), key=lambda i: scores[i], reverse=True)
+
+        ranked = []
+        kept_titles: List[Set[str]] = []
+        for index in order:
+            article, _, _, title_tokens = documents[index]
+
+            if self._is_duplicate(title_tokens, kept_titles):
+                continue
+
+            kept_titles.append(title_tokens)
+            ranked.append((article, scores[index]))
+
+            if top_k is not None and len(ranked) >= top_k:
+                break
+
+        return ranked
+
+    def _score_documents(self, query_terms: Set[str], documents: List[Tuple]) -> Tuple[List[float], float]:
+        """ለእያንዳንዱ ዜና የ BM25 ውጤት እና የጥያቄውን ከፍተኛ ወሰን ያሰላል"""
+        total_docs = len(documents)
+        avg_length = sum(doc[2] for doc in documents) / total_docs or 1.0
+
+        # የሰነድ ድግግሞሽ (document frequency) ለጥያቄ ቃላት ብቻ
+        doc_freq = {term: 0 for term in query_terms}
+        for _, term_freq, _, _ in documents:
+            for term in query_terms:
+                if term in term_freq:
+                    doc_freq[term] += 1
+
+        idf = {
+            term: math.log(1 + (total_docs - freq + 0.5) / (freq + 0.5))
+            for term, freq in doc_freq.items()
+        }
+
+        scores = []
+        for _, term_freq, length, _ in documents:
+            norm = self.k1 * (1 - self.b + self.b * length / avg_length)
+            score = 0.0
+            for term in query_terms:
+                freq = term_freq.get(term)
+                if freq:
+                    score += idf[term] * freq * (self.k1 + 1) / (freq + norm)
+            scores.append(score)
+
+        # freq * (k1 + 1) / (freq + norm) < k1 + 1፣ ስለዚህ ማንኛውም ውጤት ከዚህ ወሰን ያንሳል
+        upper_bound = sum(idf.values()) * (self.k1 + 1)
+
+        return scores, upper_bound
+
+    def _is_duplicate(self, title_tokens: Set[str], kept_titles: List[Set[str]]) -> bool:
+        """ርዕሱ ቀደም ሲል ከተመረጡት ጋር ተመሳሳይ መሆኑን ያረጋግጣል"""
+        if not title_tokens:
+            return False
+
+        for kept in kept_titles:
+            union = len(title_tokens | kept)
+            if union and len(title_tokens & kept) / union >= self.dedup_threshold:
+                return True
+
+        return False
+
+
+def rank_research_articles(topic: str, articles: List[Dict], top_k: Optional[int] = None) -> List[Tuple[Dict, float]]:
+    """
+    ዜናዎችን ለማደራጀት ቀላል ተግባር
+
+    Args:
+        topic (str): የሚፈለገው ርዕሰ ጉዳይ
+        articles (List[Dict]): የዜናዎች ዝርዝር
+        top_k (int, optional): የሚመለሱ ዜናዎች ብዛት
+
+    Returns:
+        List[Tuple[Dict, float]]: (ዜና, ውጤት) ጥንዶች
+    """
+    return ResearchRanker().rank(topic, articles, top_k)
@@ -0,0 +1,72 @@
+"""
+የ affiliate ማስገቢያን በቀድሞው (split/insert/join) ዘዴ እና በ SafeAffiliateManager.embed_affiliate_links_in_document
+(ArticleDocument) የሚለካ benchmark
+
+    python tests/benchmark_affiliate_insertion.py [--words 50000] [--stages 4] [--runs 50]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# የፕሮጀክቱ ስር ፎልደር (ለ v10 እና utils ኢምፖርቶች) እና ይህ ፎልደር (ለማጣቀሻው)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from test_affiliate_insertion import LINKS, build_content, legacy_embed  # noqa: E402
+from test_content_formatter import Config  # noqa: E402
+from utils.article_document import ArticleDocument  # noqa: E402
+from v10.v10_features import SafeAffiliateManager  # noqa: E402
+
+
+def measure(func, runs: int) -> float:
+    """በአንድ ሩጫ የወሰደው ሚሊሰከንድ"""
+    func()
+    started = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - started) / runs * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Affiliate insertion benchmark")
+    parser.add_argument('--words', type=int, default=50000)
+    parser.add_argument('--stages', type=int, default=4)
+    parser.add_argument('--runs', type=int, default=50)
+    args = parser.parse_args()
+
+    manager = SafeAffiliateManager(Config())
+    content = build_content(max(10, args.words // 50))
+    parsed = ArticleDocument.parse(content)
+
+    def legacy(stages: int) -> str:
+        html = content
+        for _ in range(stages):
+            html = '\n\n'.join(legacy_embed(manager, html, LINKS)[0])
+        return html
+
+    def document(stages: int) -> str:
+        article = ArticleDocument.parse(content)
+        for _ in range(stages):
+            manager.embed_affiliate_links_in_document(article, 'Topic', 'business', LINKS)
+        return article.to_html()
+
+    def insert_only():
+        # በሙሉው ሂደት ውስጥ ሰነዱ አንድ ጊዜ ይተነተናል፤ የአንድ ደረጃ ተጨማሪ ወጪ ማስገባቱ ብቻ ነው
+        manager.embed_affiliate_links_in_document(ArticleDocument(list(parsed.blocks)), 'Topic', 'business', LINKS)
+
+    cases = [
+        ("1 stage", lambda: legacy(1), lambda: document(1)),
+        (f"{args.stages} stages", lambda: legacy(args.stages), lambda: document(args.stages))
+    ]
+
+    print(f"{args.words} words, {len(parsed)} blocks, {len(LINKS)} links per stage")
+    for label, legacy_func, document_func in cases:
+        print(f"{label}: legacy {measure(legacy_func, args.runs):.2f} ms, "
+              f"document {measure(document_func, args.runs):.2f} ms")
+    print(f"insert only (parsed once): {measure(insert_only, args.runs):.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+generate_ai_content (አንድ በአንድ) እና generate_ai_content_batch ን በአካባቢያዊ stub የ chat completion
+አገልጋይ (በአንድ ጥያቄ ቋሚ መዘግየት) ላይ የሚለካ benchmark
+
+    python tests/benchmark_content_batch.py [--topics 16] [--batch-size 8] [--latency 0.3]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# የፕሮጀክቱ ስር ፎልደር (ለ core ኢምፖርቶች) እና ይህ ፎልደር (ለ stub አገልጋዩ)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from test_content_batch import batch_payloads, create_engine, start_completion_server  # noqa: E402
+
+
+def run(label: str, mode: str, latency: float, generate) -> None:
+    """አዲስ ሞተር እና አገልጋይ ፈጥሮ አንድ ዘዴ ይለካል"""
+    server = start_completion_server(mode, latency)
+    try:
+        engine = create_engine(server)
+        started = time.perf_counter()
+        results = generate(engine)
+        elapsed = time.perf_counter() - started
+        print(f"{label}: {elapsed:.2f} s, {len(server.payloads)} requests "
+              f"({len(batch_payloads(server))} batch), {len(results)} articles")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched Groq generation benchmark")
+    parser.add_argument('--topics', type=int, default=16)
+    parser.add_argument('--batch-size', type=int, default=8)
+    parser.add_argument('--latency', type=float, default=0.3)
+    args = parser.parse_args()
+
+    topics = [f"Business topic {index}" for index in range(args.topics)]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # ሞተሩ የሚፈጥራቸው ፋይሎች በጊዜያዊ ፎልደር ውስጥ ይቀራሉ
+        os.chdir(workdir)
+
+        run("one by one", 'batch', args.latency,
+            lambda engine: {topic: engine.generate_ai_content(topic, {}) for topic in topics})
+        run(f"batch_size={args.batch_size}", 'batch', args.latency,
+            lambda engine: engine.generate_ai_content_batch(topics, batch_size=args.batch_size))
+        run(f"batch_size={args.batch_size}, unparseable batch response", 'invalid', args.latency,
+            lambda engine: engine.generate_ai_content_batch(topics, batch_size=args.batch_size))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+AdvancedContentFormatter ን ከቀድሞው ትግበራ ጋር በ 50k ቃላት ጽሁፎች ላይ የሚለካ benchmark
+
+    python tests/benchmark_content_formatter.py [--words 50000] [--runs 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# የፕሮጀክቱ ስር ፎልደር (ለ v10 እና utils ኢምፖርቶች) እና ይህ ፎልደር (ለማጣቀሻው)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from test_content_formatter import Config, LegacyContentFormatter, build_article  # noqa: E402
+from v10.v10_features import AdvancedContentFormatter  # noqa: E402
+
+
+def measure(formatter, content: str, runs: int) -> float:
+    """በአንድ ሩጫ የወሰደው ሚሊሰከንድ"""
+    started = time.perf_counter()
+    for _ in range(runs):
+        formatter.format_content(content, 'Topic')
+    return (time.perf_counter() - started) / runs * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AdvancedContentFormatter benchmark")
+    parser.add_argument('--words', type=int, default=50000)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    config = Config()
+    formatters = [('legacy', LegacyContentFormatter(config)), ('current', AdvancedContentFormatter(config))]
+    cases = [
+        (f"{args.words} words", build_article(args.words), args.runs),
+        (f"{args.words} words, <H2> conclusion", build_article(args.words, '<H2>Conclusion</H2>'), args.runs),
+        # የቀድሞው ትግበራ እዚህ ከእያንዳንዱ እጩ ርዕስ ጀምሮ እንደገና ይቃኛል
+        (f"{args.words} words + 3000 unclosed <H2>Conclusion",
+         build_article(args.words) + '\n' + '\n'.join('<H2>Conclusion notes' for _ in range(3000)), 1)
+    ]
+
+    for label, content, runs in cases:
+        timings = ', '.join(f"{name} {measure(formatter, content, runs):.2f} ms" for name, formatter in formatters)
+        print(f"{label}: {timings}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,8 @@
+"""
+የሙከራዎች የጋራ አደረጃጀት - የፕሮጀክቱን ስር ፎልደር ለኢምፖርቶች ይጨምራል
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
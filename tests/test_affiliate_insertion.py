@@ -0,0 +1,102 @@
+"""
+SafeAffiliateManager.embed_affiliate_links_in_document የሚያስቀምጣቸውን ቦታዎች ከቀድሞው
+(split፣ list.insert በሚቀያየር offset፣ join) ህግ ጋር የሚያወዳድሩ ሙከራዎች
+"""
+
+import random
+import re
+
+import pytest
+
+from test_content_formatter import Config
+from utils.article_document import ArticleDocument
+from v10.v10_features import SafeAffiliateManager
+
+LINKS = [
+    {'url': f'https://example.com/product/{i}', 'anchor_text': f'Product {i}',
+     'network': 'amazon', 'rel': 'nofollow sponsored'}
+    for i in range(3)
+]
+
+
+def legacy_embed(manager, content, links):
+    """
+    የቀድሞው SafeAffiliateManager.embed_affiliate_links የቦታ ህግ
+
+    Returns:
+        Tuple[List[str], List[int]]: አንቀጾቹ (ከሊንኮቹ ጋር) እና የሊንኮቹ ቦታዎች
+    """
+    paragraphs = re.split(r'\n\s*\n', content)
+    if len(paragraphs) < 10:
+        return paragraphs, []
+
+    total_paragraphs = len(paragraphs)
+    min_spacing = max(3, total_paragraphs // len(links))
+    positions = [min((i + 1) * min_spacing, total_paragraphs - 2) for i in range(len(links))]
+
+    inserted = []
+    for i, pos in enumerate(positions):
+        insert_pos = pos + len(inserted)
+        if insert_pos < len(paragraphs):
+            paragraphs.insert(insert_pos, manager._create_affiliate_html(links[i]))
+            inserted.append(insert_pos)
+
+    return paragraphs, inserted
+
+
+def build_content(paragraphs, seed=0):
+    """ርዕሶች እና ያልተለመዱ የአንቀጽ መለያዎች ያሉት የሙከራ ጽሁፍ"""
+    rng = random.Random(seed)
+    parts = []
+    for index in range(paragraphs):
+        if index % 12 == 0:
+            parts.append(f"<h2>Section {index // 12 + 1}</h2>")
+        else:
+            parts.append(' '.join(f"word{rng.randrange(997)}" for _ in range(50)))
+    return ''.join(part + rng.choice(['\n\n', '\n \n', '\n\n\n']) for part in parts).rstrip('\n ')
+
+
+@pytest.mark.parametrize('paragraphs', [10, 11, 13, 29, 200, 1000])
+@pytest.mark.parametrize('links', [1, 2, 3])
+def test_placements_match_legacy_rule(paragraphs, links):
+    manager = SafeAffiliateManager(Config())
+    content = build_content(paragraphs, seed=paragraphs)
+
+    random.seed(0)
+    legacy_blocks, legacy_positions = legacy_embed(manager, content, LINKS[:links])
+    random.seed(0)
+    document = ArticleDocument.parse(content)
+    inserted = manager.embed_affiliate_links_in_document(document, 'Topic', 'business', LINKS[:links])
+
+    assert inserted == links
+    assert [index for index, block in enumerate(document) if block.source == 'affiliate'] == legacy_positions
+    # ArticleDocument የገቡትን ክፍሎች በዙሪያቸው ካሉ ባዶ መስመሮች ያጸዳቸዋል
+    assert [block.html for block in document] == [block.strip('\n') for block in legacy_blocks]
+
+
+def test_repeated_stages_match_legacy_rule():
+    manager = SafeAffiliateManager(Config())
+    content = build_content(300)
+
+    random.seed(0)
+    expected = content
+    for _ in range(4):
+        blocks, _ = legacy_embed(manager, expected, LINKS)
+        expected = '\n\n'.join(blocks)
+
+    random.seed(0)
+    document = ArticleDocument.parse(content)
+    for _ in range(4):
+        manager.embed_affiliate_links_in_document(document, 'Topic', 'business', LINKS)
+
+    assert [block.html for block in document] == [block.html for block in ArticleDocument.parse(expected)]
+    assert document.count('affiliate') == 4 * len(LINKS)
+
+
+def test_short_documents_are_left_unchanged():
+    manager = SafeAffiliateManager(Config())
+    content = build_content(9)
+    document = ArticleDocument.parse(content)
+
+    assert manager.embed_affiliate_links_in_document(document, 'Topic', 'business', LINKS) == 0
+    assert document.to_html() == '\n\n'.join(legacy_embed(manager, content, LINKS)[0])
@@ -0,0 +1,167 @@
+"""
+BaseProfitEngine.generate_ai_content_batch ን በአካባቢያዊ stub የ chat completion አገልጋይ የሚፈትሹ ሙከራዎች
+"""
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.base_engine import BaseProfitEngine
+
+BATCH_TOPIC = re.compile(r'^### \d+\. (.*)$', re.MULTILINE)
+
+
+class StubCompletionHandler(BaseHTTPRequestHandler):
+    """
+    የ Groq chat completions ን የሚመስል stub
+
+    የቡድን ጥያቄዎች (response_format ያላቸው) በ server.mode መሠረት ይመለሳሉ:
+    'batch' - ሁሉም ርዕሶች (በተገላቢጦሽ ቅደም ተከተል እና በተቀየረ አጻጻፍ)፣
+    'partial' - የመጨረሻው ርዕስ ይጎድላል፣ 'invalid' - JSON ያልሆነ ጽሁፍ
+    """
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.server.payloads.append(payload)
+        time.sleep(self.server.latency)
+
+        if 'response_format' not in payload:
+            content = "single article"
+        elif self.server.mode == 'invalid':
+            content = "Here are your articles: ..."
+        else:
+            topics = BATCH_TOPIC.findall(payload['messages'][-1]['content'])
+            if self.server.mode == 'partial':
+                topics = topics[:-1]
+            articles = [{'topic': f"  {topic.upper()} ", 'content': f"batch article about {topic}"}
+                        for topic in reversed(topics)]
+            content = json.dumps({'articles': articles})
+
+        body = json.dumps({'choices': [{'message': {'content': content}}]}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_completion_server(mode: str = 'batch', latency: float = 0.0) -> ThreadingHTTPServer:
+    """stub አገልጋዩን በነጻ port ላይ ያስጀምራል"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubCompletionHandler)
+    server.mode = mode
+    server.latency = latency
+    server.payloads = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def create_engine(server: ThreadingHTTPServer, version: str = 'v9') -> BaseProfitEngine:
+    """ጥያቄዎቹን ወደ stub አገልጋዩ የሚልክ ሞተር"""
+    engine = BaseProfitEngine(version=version, config_path='missing_config.json')
+    engine.groq_key = 'test-key'
+    engine.groq_url = f"http://127.0.0.1:{server.server_address[1]}/openai/v1/chat/completions"
+    return engine
+
+
+@pytest.fixture
+def completion_server(tmp_path, monkeypatch):
+    """የ stub አገልጋይ factory (ሞተሩ የሚፈጥራቸው ፋይሎች በ tmp_path ውስጥ ይቀራሉ)"""
+    monkeypatch.chdir(tmp_path)
+    servers = []
+
+    def start(mode: str = 'batch') -> ThreadingHTTPServer:
+        server = start_completion_server(mode)
+        servers.append(server)
+        return server
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def batch_payloads(server):
+    return [payload for payload in server.payloads if 'response_format' in payload]
+
+
+TOPICS = ['Coffee Export', 'Mobile  Money', 'Solar Farms']
+
+
+def test_batch_response_is_split_per_topic(completion_server):
+    server = completion_server('batch')
+    results = create_engine(server).generate_ai_content_batch(TOPICS, batch_size=8)
+
+    # የተገላቢጦሽ ቅደም ተከተል እና የተቀየረ አጻጻፍ ቢኖርም እያንዳንዱ ጽሁፍ ወደ ርዕሱ ይሄዳል
+    assert results == {topic: f"batch article about {topic}" for topic in TOPICS}
+    assert len(server.payloads) == 1
+
+
+def test_unmatched_topic_is_requested_individually(completion_server):
+    server = completion_server('partial')
+    results = create_engine(server).generate_ai_content_batch(TOPICS, batch_size=8)
+
+    assert results[TOPICS[0]] == f"batch article about {TOPICS[0]}"
+    assert results[TOPICS[1]] == f"batch article about {TOPICS[1]}"
+    assert results[TOPICS[2]] == "single article"
+    assert len(batch_payloads(server)) == 1
+    assert len(server.payloads) == 2
+
+
+def test_unparseable_batch_response_falls_back_to_single_requests(completion_server):
+    server = completion_server('invalid')
+    results = create_engine(server).generate_ai_content_batch(TOPICS, batch_size=8)
+
+    assert results == {topic: "single article" for topic in TOPICS}
+    assert len(batch_payloads(server)) == 1
+    assert len(server.payloads) == 1 + len(TOPICS)
+
+
+def test_batch_results_are_shared_with_single_topic_cache(completion_server):
+    server = completion_server('batch')
+    engine = create_engine(server)
+    engine.generate_ai_content_batch(TOPICS, batch_size=8)
+
+    assert engine.generate_ai_content(TOPICS[0], {}) == f"batch article about {TOPICS[0]}"
+    assert engine.generate_ai_content_batch(TOPICS, batch_size=8) == {
+        topic: f"batch article about {topic}" for topic in TOPICS
+    }
+    assert len(server.payloads) == 1
+
+
+def test_batches_shrink_to_fit_model_context(completion_server):
+    server = completion_server('batch')
+    engine = create_engine(server)
+    topics = [f"topic {index}" for index in range(8)]
+    context_map = {topic: {'news': [{'title': 'x' * 3000}]} for topic in topics}
+
+    results = engine.generate_ai_content_batch(topics, context_map, batch_size=8)
+
+    assert set(results) == set(topics)
+    window = engine.GROQ_CONTEXT_WINDOWS[engine.GROQ_MODELS['v9']]
+    for payload in batch_payloads(server):
+        prompt_tokens = sum(engine._estimate_tokens(message['content']) for message in payload['messages'])
+        assert prompt_tokens + payload['max_tokens'] <= window
+    assert len(batch_payloads(server)) > 1
+
+
+def test_batch_pipeline_generates_content_in_one_request(completion_server):
+    server = completion_server('batch')
+    engine = create_engine(server)
+    engine.fetch_research_data = lambda topic, country: {'news': [], 'topic': topic}
+    engine.generate_image_url = lambda topic, style=None, budget=None: 'https://example.com/image.png'
+
+    results = engine.run_batch_pipeline(TOPICS)
+
+    # የእያንዳንዱ ርዕስ ሂደት ይዘቱን ከካሽ ይወስዳል
+    assert [result['outputs']['content'] for result in results] == [
+        f"batch article about {topic}" for topic in TOPICS
+    ]
+    assert len(server.payloads) == 1
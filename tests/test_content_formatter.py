@@ -0,0 +1,235 @@
+"""
+AdvancedContentFormatter ን ከቀድሞው (ባለ አራት ዙር) ትግበራ ጋር የሚያወዳድሩ የ regression ሙከራዎች
+ውጤቱ በባይት ደረጃ አንድ መሆን አለበት
+"""
+
+import random
+import re
+import time
+
+import pytest
+
+from utils.article_document import ArticleDocument
+from v10.v10_features import (AdvancedContentFormatter, SafeAffiliateManager, VisualAIEngine,
+                              YouTubeEmbedder)
+
+
+class Config(dict):
+    """ለ ConfigManager ምትክ (get ብቻ)"""
+
+    def get(self, key, default=None):
+        return super().get(key, default)
+
+
+class LegacyContentFormatter:
+    """የቀድሞው AdvancedContentFormatter (እያንዳንዱ ደረጃ ሙሉውን ጽሁፍ በተናጠል ያልፋል) - እንደ ማጣቀሻ"""
+
+    def __init__(self, config):
+        self.config = config
+
+    def format_content(self, content, topic, include_toc=None, include_takeaways=None):
+        if include_toc is None:
+            include_toc = self.config.get('INCLUDE_TABLE_OF_CONTENTS', True)
+        if include_takeaways is None:
+            include_takeaways = self.config.get('INCLUDE_KEY_TAKEAWAYS', True)
+
+        formatted = content
+        if include_toc:
+            formatted = self._add_table_of_contents(formatted, topic)
+        formatted = self._style_headings(formatted)
+        if include_takeaways:
+            formatted = self._add_key_takeaways(formatted)
+        return self._style_conclusion(formatted)
+
+    def _add_table_of_contents(self, content, topic):
+        headings = re.findall(r'<h[2-3][^>]*>(.*?)</h[2-3]>', content)
+        if len(headings) < 3:
+            return content
+
+        toc_items = []
+        for heading in headings[:6]:
+            clean_heading = re.sub(r'<[^>]+>', '', heading)
+            slug = re.sub(r'[^a-z0-9]+', '-', clean_heading.lower()).strip('-')
+            toc_items.append(f'<li><a href="#{slug}" style="color: #4a5568; text-decoration: none;">{clean_heading}</a></li>')
+
+        toc_html = f'''
+<div class="table-of-contents" style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 25px; border-radius: 12px; margin: 30px 0; box-shadow: 0 10px 30px rgba(0,0,0,0.1);">
+<h3 style="margin-top: 0; color: white;">📑 In This Article: {topic[:50]}</h3>
+<ul style="columns: 2; column-gap: 40px; list-style: none; padding-left: 0;">
+{toc_items}
+</ul>
+<p style="font-size: 0.9em; opacity: 0.9; margin-top: 15px;">
+<em>Use the links above to navigate to specific sections.</em>
+</p>
+</div>
+'''
+
+        lines = content.split('\n')
+        for i, line in enumerate(lines):
+            if '<h1' in line or '<h2' in line:
+                lines.insert(i + 1, toc_html)
+                break
+        return '\n'.join(lines)
+
+    def _style_headings(self, content):
+        content = re.sub(
+            r'<h2>(.*?)</h2>',
+            r'<h2 style="border-bottom: 2px solid #4a5568; padding-bottom: 10px; margin-top: 40px; color: #2d3748;">\1</h2>',
+            content
+        )
+        return re.sub(
+            r'<h3>(.*?)</h3>',
+            r'<h3 style="border-left: 4px solid #667eea; padding-left: 15px; margin-top: 30px; color: #4a5568;">\1</h3>',
+            content
+        )
+
+    def _add_key_takeaways(self, content):
+        takeaways = [
+            "Start with clear, measurable goals",
+            "Implement step by step, don't rush",
+            "Track your progress regularly",
+            "Adjust based on results and feedback",
+            "Scale what works, discard what doesn't"
+        ]
+        takeaways_html = '\n'.join([f'<li>{takeaway}</li>' for takeaway in takeaways])
+        takeaways_section = f'''
+<div class="key-takeaways" style="background: #f0fff4; border: 2px solid #9ae6b4; padding: 25px; border-radius: 12px; margin: 40px 0; box-shadow: 0 5px 15px rgba(0,0,0,0.05);">
+<h3 style="margin-top: 0; color: #2f855a;">🎯 Key Takeaways</h3>
+<ul style="margin: 15px 0; padding-left: 20px; color: #2d3748;">
+{takeaways_html}
+</ul>
+<p style="color: #718096; font-style: italic; margin-top: 15px;">
+Remember: Consistency and continuous improvement are key to success.
+</p>
+</div>
+'''
+
+        if 'Conclusion' in content or 'conclusion' in content.lower():
+            lines = content.split('\n')
+            for i, line in enumerate(lines):
+                if 'Conclusion' in line or 'conclusion' in line.lower():
+                    lines.insert(i, takeaways_section)
+                    break
+            return '\n'.join(lines)
+        return content
+
+    def _style_conclusion(self, content):
+        conclusion_html = '''
+<div class="conclusion" style="background: linear-gradient(135deg, #f6d365 0%, #fda085 100%); padding: 30px; border-radius: 12px; margin: 40px 0; box-shadow: 0 10px 30px rgba(0,0,0,0.1);">
+<h3 style="margin-top: 0; color: #2d3748;">✨ Final Thoughts</h3>
+<p style="color: #2d3748; font-size: 1.1em;">
+The journey of a thousand miles begins with a single step. Start implementing these strategies today, and track your progress over time.
+</p>
+<p style="margin-top: 20px;">
+<strong>🎯 Your Action Plan:</strong><br>
+1. Choose one strategy to implement today<br>
+2. Set up tracking and measurement<br>
+3. Review progress weekly<br>
+4. Scale successful approaches
+</p>
+</div>
+'''
+        return re.sub(
+            r'<h[2-3]>Conclusion.*?</h[2-3]>.*?(?=<h|$)',
+            conclusion_html,
+            content,
+            flags=re.DOTALL | re.IGNORECASE
+        )
+
+
+CONFIGS = [
+    Config(),
+    Config(INCLUDE_TABLE_OF_CONTENTS=False),
+    Config(INCLUDE_KEY_TAKEAWAYS=False),
+    Config(INCLUDE_TABLE_OF_CONTENTS=False, INCLUDE_KEY_TAKEAWAYS=False)
+]
+
+# የተሳሳቱ/ያልተለመዱ መለያዎች፣ ባለ ብዙ መስመር attributes፣ ያልተዘጉ የመደምደሚያ ርዕሶች...
+FRAGMENTS = [
+    '<h1>Title</h1>', '<h2>Intro</h2>', '<h3>Detail</h3>', '<h2>Conclusion</h2>', '<H2>Conclusion</H2>',
+    '<h3>conclusion and more</h3>', '<h2>Conclusion', '</h2>', '<h3>CONCLUSION</h3>', '<h2 class="x">Attr</h2>',
+    '<h2\nclass="y">Multi</h2>', '<p>text</p>', '<p>in conclusion, yes</p>', '<h2>a</h3>', '<h3>b</h2>',
+    '<h2><b>Bold</b> heading</h2>', '<hr>', '<header>', '<h2>x<h2>y</h2>', '\n', '\n\n', '', '  ',
+    '<h4>four</h4>', "<h2>It's \"quoted\"</h2>", '<h3>Conclusion</h3>\n<p>tail</p>',
+    '<H3>Conclusion</h2> tail <h', '<p>Conclusion here</p>', '<h2>Conclusiſn</h2>', '<H2>conclusioN</H3>'
+]
+
+TOPICS = [
+    'Topic', 'How to Make Money Online in 2024: Complete Guide Extra long title text',
+    'Conclusion topic', '<h2>Conclusion</h2> topic', 'Ünïcode ✨'
+]
+
+
+def random_documents(count, seed=7):
+    rng = random.Random(seed)
+    for _ in range(count):
+        parts = [rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 25))]
+        content = ''.join(part + rng.choice(['\n', '\n\n', '', ' ']) for part in parts)
+        if rng.random() < 0.3:
+            content += '\n'
+        yield content, rng.choice(TOPICS)
+
+
+def build_article(words, conclusion='<h2>Conclusion</h2>'):
+    """በርዕሶች እና አንቀጾች የተዋቀረ የሙከራ ጽሁፍ"""
+    parts = ['<h1>Title</h1>']
+    written = 0
+    index = 0
+    while written < words:
+        if index % 6 == 0:
+            parts.append(f'<h2>Section {index}</h2>')
+        elif index % 6 == 3:
+            parts.append(f'<h3>Sub {index}</h3>')
+        else:
+            parts.append(f"<p>{'lorem ipsum dolor sit amet ' * 10}</p>")
+            written += 50
+        index += 1
+    parts += [conclusion, '<p>bye</p>']
+    return '\n\n'.join(parts)
+
+
+def test_random_corpus_matches_legacy_formatter():
+    mismatches = []
+    for content, topic in random_documents(3000):
+        for config in CONFIGS:
+            expected = LegacyContentFormatter(config).format_content(content, topic)
+            actual = AdvancedContentFormatter(config).format_content(content, topic)
+            if actual != expected:
+                mismatches.append((content, topic, dict(config)))
+    assert not mismatches, mismatches[:3]
+
+
+@pytest.mark.parametrize('words', [300, 2000, 8000])
+@pytest.mark.parametrize('conclusion', ['<h2>Conclusion</h2>', '<H2>Conclusion</H2>', '<h3>Conclusion</h3>', ''])
+def test_pipeline_output_matches_legacy_formatter(words, conclusion):
+    config = Config(AMAZON_AFFILIATE_ID='a-20', CLICKBANK_AFFILIATE_ID='cb', SHAREASALE_AFFILIATE_ID='sa')
+    images = [{'url': f'https://example.com/{i}.png', 'alt': 'alt', 'caption': 'caption', 'source': 'test'}
+              for i in range(4)]
+
+    # ከፊተኛዎቹ ደረጃዎች (ምስል፣ ቪዲዮ፣ affiliate) በኋላ ያለ ጽሁፍ
+    random.seed(words)
+    document = ArticleDocument.parse(build_article(words, conclusion))
+    VisualAIEngine().embed_images_in_document(document, images)
+    YouTubeEmbedder().embed_video_in_document(document, {'embed_url': 'embed', 'watch_url': 'watch'})
+    SafeAffiliateManager(config).embed_affiliate_links_in_document(document, 'Topic', 'business')
+    content = document.to_html()
+
+    assert (AdvancedContentFormatter(config).format_content(content, 'Topic')
+            == LegacyContentFormatter(config).format_content(content, 'Topic'))
+
+
+def test_unclosed_conclusion_headings_match_legacy_formatter():
+    content = build_article(2000) + '\n' + '\n'.join('<H2>Conclusion notes' for _ in range(200))
+    config = Config()
+    assert (AdvancedContentFormatter(config).format_content(content, 'Topic')
+            == LegacyContentFormatter(config).format_content(content, 'Topic'))
+
+
+def test_unclosed_conclusion_headings_format_in_linear_time():
+    # የቀድሞው ትግበራ ለዚህ ጽሁፍ ~1.7 ሰከንድ ይወስዳል (ከእያንዳንዱ እጩ ርዕስ ጀምሮ እንደገና ይቃኛል)
+    content = build_article(50000) + '\n' + '\n'.join('<H2>Conclusion notes' for _ in range(3000))
+    formatter = AdvancedContentFormatter(Config())
+
+    started = time.perf_counter()
+    formatter.format_content(content, 'Topic')
+    assert time.perf_counter() - started < 0.5
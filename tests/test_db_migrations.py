@@ -0,0 +1,80 @@
+"""
+የ v10 እና v11 ማሻሻያዎችን በጊዜያዊ ዳታቤዝ ላይ ፈጽሞ ተደጋጋሚ ጥያቄዎቹ ኢንዴክስ መጠቀማቸውን የሚያረጋግጡ ሙከራዎች
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from utils.db_access import DatabaseConnection
+from utils.db_migrations import (Migration, apply_migrations, check_query_plans,
+                                 get_schema_version, uses_index)
+from v10.v10_features import PersistentDatabaseManager
+from v11.god_mode_features import ProfitMachineV11
+
+
+def assert_plans_use_indexes(report):
+    for name, entry in report.items():
+        full_scans = [detail for detail in entry['plan']
+                      if detail.startswith('SCAN ') and ' USING ' not in detail]
+        assert not full_scans, f"{name}: {entry['plan']}"
+        assert entry['uses_index'], f"{name}: {entry['plan']}"
+
+
+@pytest.fixture
+def v10_database(tmp_path, monkeypatch):
+    # PersistentDatabaseManager ፋይሉን በ ./data ውስጥ ይፈጥራል
+    monkeypatch.chdir(tmp_path)
+    manager = PersistentDatabaseManager('test_v10.db')
+    yield manager
+    manager.db.close()
+
+
+@pytest.fixture
+def v11_database(tmp_path):
+    db = DatabaseConnection(str(tmp_path / 'test_v11.db'))
+    # ሙሉውን ProfitMachineV11 ሳይጀምር የስኪማ ዝግጅቱን ብቻ ያስኬዳል
+    machine = SimpleNamespace(db=db, DB_MIGRATIONS=ProfitMachineV11.DB_MIGRATIONS)
+    ProfitMachineV11._init_database(machine)
+    yield machine
+    db.close()
+
+
+def test_v10_migrations_reach_latest_version(v10_database):
+    latest = max(migration.version for migration in PersistentDatabaseManager.MIGRATIONS)
+    assert v10_database.schema_version == latest
+    assert get_schema_version(v10_database.db) == latest
+
+
+def test_v10_hot_queries_use_indexes(v10_database):
+    report = v10_database.check_indexes()
+    assert set(report) == set(PersistentDatabaseManager.HOT_QUERIES)
+    assert_plans_use_indexes(report)
+
+
+def test_v11_hot_queries_use_indexes(v11_database):
+    latest = max(migration.version for migration in ProfitMachineV11.DB_MIGRATIONS)
+    assert v11_database.schema_version == latest
+
+    report = check_query_plans(v11_database.db, ProfitMachineV11.DB_HOT_QUERIES)
+    assert_plans_use_indexes(report)
+
+
+def test_migrations_are_applied_once(tmp_path):
+    db = DatabaseConnection(str(tmp_path / 'once.db'))
+    migrations = [
+        Migration(1, "table", ["CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"]),
+        Migration(2, "index", ["CREATE INDEX idx_items_name ON items (name)"])
+    ]
+
+    assert apply_migrations(db, migrations) == 2
+    # ሁለተኛ ሩጫ ምንም አይፈጽምም (CREATE TABLE ቢደገም ይወድቅ ነበር)
+    assert apply_migrations(db, migrations) == 2
+    db.close()
+
+
+def test_uses_index_rejects_full_scans_and_temp_sorts():
+    assert not uses_index(["SCAN articles"])
+    assert not uses_index(["SCAN articles USING INDEX idx_a", "USE TEMP B-TREE FOR ORDER BY"])
+    assert uses_index(["SCAN articles USING INDEX idx_articles_created_at"])
+    assert uses_index(["SEARCH social_posts USING INDEX idx_social_posts_article (article_id=?)"])
@@ -0,0 +1,143 @@
+"""
+ImageResolver ን በአካባቢያዊ stub HTTP አገልጋዮች የሚፈትሹ ሙከራዎች
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.image_resolver import ImageResolver
+
+RENDER_SECONDS = 0.5
+
+
+class StubImageHandler(BaseHTTPRequestHandler):
+    """ምስል አገልግሎቶችን የሚመስል stub"""
+
+    def _respond(self, status: int, content_type: str, body: bytes = b''):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command == 'GET':
+            self.wfile.write(body)
+
+    def _route(self):
+        if self.path.startswith('/render'):
+            # እንደ Pollinations: ምስሉ በጥያቄው ጊዜ ይሰራል
+            time.sleep(RENDER_SECONDS)
+            self._respond(200, 'image/png', b'\x89PNG')
+        elif self.path.startswith('/image'):
+            self._respond(200, 'image/png', b'\x89PNG')
+        elif self.path.startswith('/html'):
+            self._respond(200, 'text/html', b'<html></html>')
+        elif self.path.startswith('/nohead') and self.command == 'HEAD':
+            self._respond(405, 'text/plain')
+        elif self.path.startswith('/nohead'):
+            self._respond(206, 'image/png', b'\x89')
+        else:
+            self._respond(404, 'text/plain')
+
+    do_HEAD = _route
+    do_GET = _route
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """ብዙ የተለያዩ አገልግሎቶችን (host:port) ለመፍጠር የሚያገለግል factory"""
+    servers = []
+
+    def start() -> str:
+        server = ThreadingHTTPServer(('127.0.0.1', 0), StubImageHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_generate_on_request_service_gets_render_timeout(stub_server):
+    base = stub_server()
+    resolver = ImageResolver(probe_timeout=0.2, render_timeout=5,
+                             generate_on_request=[ImageResolver.service_name(base)])
+
+    assert resolver.probe(f"{base}/render/prompt") is True
+    assert not resolver.is_service_down(ImageResolver.service_name(base))
+
+
+def test_slow_service_without_render_timeout_goes_into_cooldown(stub_server):
+    base = stub_server()
+    resolver = ImageResolver(probe_timeout=0.2, cooldown=60, generate_on_request=())
+
+    assert resolver.probe(f"{base}/render/prompt") is False
+    assert resolver.is_service_down(ImageResolver.service_name(base))
+
+
+def test_pollinations_is_generate_on_request_by_default():
+    resolver = ImageResolver()
+    assert 'image.pollinations.ai' in resolver.generate_on_request
+
+
+def test_resolve_keeps_preference_order_and_skips_broken_services(stub_server):
+    broken, html, working, fallback = stub_server(), stub_server(), stub_server(), stub_server()
+    resolver = ImageResolver(probe_timeout=2)
+
+    candidates = [f"{broken}/missing", f"{html}/html", f"{working}/image", f"{fallback}/image"]
+    assert resolver.resolve(candidates) == f"{working}/image"
+
+    health = resolver.get_health_report()
+    assert health[ImageResolver.service_name(broken)]['healthy'] is False
+    assert health[ImageResolver.service_name(html)]['healthy'] is False
+
+
+def test_services_in_cooldown_are_not_probed_again(stub_server):
+    base = stub_server()
+    resolver = ImageResolver(probe_timeout=2, cooldown=60)
+
+    assert resolver.resolve([f"{base}/missing"]) is None
+    # ተመሳሳይ አገልግሎት አሁን ቢሰራም በ cooldown ውስጥ ስለሆነ ይዘለላል
+    assert resolver.resolve([f"{base}/image"]) is None
+
+
+def test_head_not_allowed_falls_back_to_ranged_get(stub_server):
+    base = stub_server()
+    resolver = ImageResolver(probe_timeout=2)
+
+    assert resolver.probe(f"{base}/nohead") is True
+
+
+def test_resolve_budget_falls_back_to_service_that_already_answered(stub_server):
+    slow, fallback = stub_server(), stub_server()
+    resolver = ImageResolver(probe_timeout=2, render_timeout=5,
+                             generate_on_request=[ImageResolver.service_name(slow)])
+
+    started = time.monotonic()
+    result = resolver.resolve([f"{slow}/render/prompt", f"{fallback}/image"], timeout=0.2)
+
+    assert result == f"{fallback}/image"
+    assert time.monotonic() - started < RENDER_SECONDS
+
+
+def test_resolve_without_budget_waits_for_preferred_service(stub_server):
+    slow, fallback = stub_server(), stub_server()
+    resolver = ImageResolver(probe_timeout=2, render_timeout=5,
+                             generate_on_request=[ImageResolver.service_name(slow)])
+
+    assert resolver.resolve([f"{slow}/render/prompt", f"{fallback}/image"]) == f"{slow}/render/prompt"
+
+
+def test_resolve_budget_returns_none_when_nothing_answered(stub_server):
+    slow = stub_server()
+    resolver = ImageResolver(probe_timeout=2, render_timeout=5,
+                             generate_on_request=[ImageResolver.service_name(slow)])
+
+    assert resolver.resolve([f"{slow}/render/prompt"], timeout=0.1) is None
@@ -0,0 +1,73 @@
+"""
+PipelineExecutor ን በአስገዳጅ እና በአማራጭ ጥገኝነቶች የሚፈትሹ ሙከራዎች
+"""
+
+import time
+
+import pytest
+
+from utils.pipeline_executor import (STATUS_COMPLETED, STATUS_FAILED, STATUS_SKIPPED, STATUS_TIMEOUT,
+                                     PipelineExecutor, PipelineStep)
+
+
+def fail(deps):
+    raise RuntimeError("image service down")
+
+
+def slow_image(deps):
+    time.sleep(0.2)
+    return 'image.png'
+
+
+def test_optional_dependency_failure_does_not_skip_step():
+    steps = [
+        PipelineStep('content', lambda deps: 'content'),
+        PipelineStep('image', fail, required=False),
+        PipelineStep('report', lambda deps: dict(deps), depends_on=['content'],
+                     optional_depends_on=['image'])
+    ]
+    run = PipelineExecutor(steps).run()
+
+    assert run['status']['image'] == STATUS_FAILED
+    assert run['status']['report'] == STATUS_COMPLETED
+    assert run['results']['report'] == {'content': 'content'}
+    assert run['success'] is True
+
+
+def test_optional_dependency_result_is_waited_for_and_passed():
+    steps = [
+        PipelineStep('content', lambda deps: 'content'),
+        PipelineStep('image', slow_image, required=False),
+        PipelineStep('report', lambda deps: dict(deps), depends_on=['content'],
+                     optional_depends_on=['image'])
+    ]
+    run = PipelineExecutor(steps).run()
+
+    assert run['results']['report'] == {'content': 'content', 'image': 'image.png'}
+
+
+def test_optional_dependency_timeout_does_not_skip_step():
+    steps = [
+        PipelineStep('image', slow_image, timeout=0.05, required=False),
+        PipelineStep('report', lambda deps: dict(deps), optional_depends_on=['image'])
+    ]
+    run = PipelineExecutor(steps).run()
+
+    assert run['status']['image'] == STATUS_TIMEOUT
+    assert run['results']['report'] == {}
+
+
+def test_required_dependency_failure_skips_step():
+    steps = [
+        PipelineStep('image', fail, required=False),
+        PipelineStep('report', lambda deps: dict(deps), depends_on=['image'])
+    ]
+    run = PipelineExecutor(steps).run()
+
+    assert run['status']['report'] == STATUS_SKIPPED
+    assert run['success'] is False
+
+
+def test_unknown_optional_dependency_is_rejected():
+    with pytest.raises(ValueError):
+        PipelineExecutor([PipelineStep('report', lambda deps: None, optional_depends_on=['image'])])
@@ -0,0 +1,50 @@
+"""
+TopicSource ን (ተደጋጋሚ ማጣሪያ እና የተካሄዱ ርዕሶች መዝገብ) የሚፈትሹ ሙከራዎች
+"""
+
+import json
+
+from utils.topic_source import TopicSource
+
+
+def write_jsonl(path, topics):
+    path.write_text(''.join(json.dumps({'topic': topic}) + '\n' for topic in topics), encoding='utf-8')
+    return str(path)
+
+
+def test_duplicates_are_skipped_ignoring_case_and_spacing(tmp_path):
+    path = write_jsonl(tmp_path / 'topics.jsonl',
+                       ['Coffee Export', 'coffee   export', 'የቡና ንግድ', 'Solar Farms', 'የቡና  ንግድ', 'x'])
+    source = TopicSource(path)
+
+    assert list(source) == ['Coffee Export', 'የቡና ንግድ', 'Solar Farms']
+    assert source.stats == {'read': 6, 'yielded': 3, 'invalid': 1, 'duplicates': 2}
+
+
+def test_processed_topics_are_skipped_on_next_run(tmp_path):
+    path = write_jsonl(tmp_path / 'topics.jsonl', ['Coffee Export', 'Solar Farms', 'Mobile Money'])
+    log = str(tmp_path / 'processed.log')
+
+    first = TopicSource(path, processed_log=log)
+    for topic in first:
+        if topic != 'Mobile Money':
+            first.mark_processed(topic)
+    first.close()
+
+    assert list(TopicSource(path, processed_log=log)) == ['Mobile Money']
+
+
+def test_keys_above_signed_64_bit_range_round_trip(tmp_path):
+    topics = [f"Topic number {index}" for index in range(200)]
+    # ግማሽ ያህሉ ሃሾች ከ 2**63 በላይ ናቸው (SQLite INTEGER signed ነው)
+    assert any(TopicSource.topic_key(topic) >= 1 << 63 for topic in topics)
+
+    path = write_jsonl(tmp_path / 'topics.jsonl', topics + topics)
+    log = str(tmp_path / 'processed.log')
+
+    source = TopicSource(path, processed_log=log)
+    assert list(source) == topics
+    for topic in topics:
+        source.mark_processed(topic)
+
+    assert list(TopicSource(path, processed_log=log)) == []
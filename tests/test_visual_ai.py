@@ -0,0 +1,153 @@
+"""
+VisualAIEngine.prepare_images ን በአካባቢያዊ stub HTTP አገልጋይ የሚፈትሹ ሙከራዎች:
+የምንጭ fallback፣ የዲስክ ካሽ እና አንድ ጊዜ ብቻ መጫን (upload)
+"""
+
+import io
+import json
+import threading
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+Image = pytest.importorskip('PIL.Image')
+
+from v10.v10_features import VisualAIEngine, WordPressPublisher  # noqa: E402
+
+
+def png_bytes(name: str) -> bytes:
+    """ለእያንዳንዱ ስም የተለየ ቀለም ያለው PNG"""
+    color = zlib.crc32(name.encode()) & 0xFFFFFF
+    buffer = io.BytesIO()
+    Image.new('RGB', (1000, 600), color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+class StubMediaHandler(BaseHTTPRequestHandler):
+    """የምስል ምንጮችን እና የ WordPress media API ን የሚመስል stub"""
+
+    def _respond(self, status: int, content_type: str, body: bytes = b''):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        with self.server.lock:
+            self.server.hits[path] += 1
+
+        if path.startswith('/image/'):
+            self._respond(200, 'image/png', png_bytes(path))
+        elif path.startswith('/html'):
+            self._respond(200, 'text/html; charset=utf-8', b'<html>not an image</html>')
+        else:
+            self._respond(404, 'text/plain', b'missing')
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        if not self.path.startswith('/wp-json/wp/v2/media'):
+            self._respond(404, 'text/plain')
+            return
+
+        with self.server.lock:
+            self.server.uploads.append(body)
+            media_id = len(self.server.uploads)
+        host = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._respond(201, 'application/json',
+                      json.dumps({'id': media_id, 'source_url': f"{host}/uploads/{media_id}"}).encode())
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def media_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubMediaHandler)
+    server.hits = Counter()
+    server.uploads = []
+    server.lock = threading.Lock()
+    server.base = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def make_image(base: str, position: int, paths, prompt: str = 'coffee export, professional') -> dict:
+    candidates = [{'source': f"source {index}", 'url': f"{base}{path}"} for index, path in enumerate(paths)]
+    return {
+        'url': candidates[0]['url'], 'alt': 'alt', 'caption': 'caption', 'source': candidates[0]['source'],
+        'position': position, 'type': 'hero', 'prompt': prompt, 'width': 800, 'height': 450,
+        'keywords': ['coffee'], 'candidates': candidates
+    }
+
+
+def test_fetch_falls_back_to_next_candidate(media_server, tmp_path):
+    image = make_image(media_server.base, 0, ['/missing', '/html', '/image/a.png'])
+
+    prepared = VisualAIEngine(cache_dir=str(tmp_path)).prepare_images([image])[0]
+
+    assert prepared['source'] == 'source 2'
+    assert prepared['original']['url'] == f"{media_server.base}/image/a.png"
+    with open(prepared['original']['path'], 'rb') as f:
+        assert f.read() == png_bytes('/image/a.png')
+    assert prepared['variants']
+
+
+def test_all_candidates_failing_falls_back_to_placeholder(media_server, tmp_path):
+    image = make_image(media_server.base, 0, ['/missing', '/html'])
+
+    prepared = VisualAIEngine(cache_dir=str(tmp_path)).prepare_images([image])[0]
+
+    assert prepared['type'] == 'placeholder'
+    assert prepared['original']['content_type'] == 'image/png'
+
+
+def test_original_is_fetched_once_and_reused_from_disk(media_server, tmp_path):
+    image = make_image(media_server.base, 0, ['/image/a.png'])
+
+    first = VisualAIEngine(cache_dir=str(tmp_path)).prepare_images([image])[0]
+    # አዲስ ሞተር ተመሳሳዩን የካሽ ፎልደር ሲጠቀም ምስሉ እንደገና አይወርድም
+    second = VisualAIEngine(cache_dir=str(tmp_path)).prepare_images([image])[0]
+
+    assert first['original']['cached'] is False
+    assert second['original']['cached'] is True
+    assert second['original']['path'] == first['original']['path']
+    assert media_server.hits['/image/a.png'] == 1
+
+
+def test_slots_with_same_prompt_and_size_keep_their_own_images(media_server, tmp_path):
+    # የምስል አይነቶች በየ 5 ቦታው ስለሚደገሙ ቦታ 0 እና 5 ተመሳሳይ prompt እና መጠን ሊኖራቸው ይችላል
+    images = [make_image(media_server.base, 0, ['/image/a.png']),
+              make_image(media_server.base, 5, ['/image/b.png'])]
+
+    first, second = VisualAIEngine(cache_dir=str(tmp_path)).prepare_images(images)
+
+    assert first['original']['path'] != second['original']['path']
+    with open(second['original']['path'], 'rb') as f:
+        assert f.read() == png_bytes('/image/b.png')
+
+
+def test_identical_files_are_uploaded_once(media_server, tmp_path):
+    wordpress = WordPressPublisher(media_server.base, 'user', 'password')
+    # ሁለት ቦታዎች አንድ አይነት ባይቶች ያገኛሉ፤ በትይዩ ቢዘጋጁም እያንዳንዱ ፋይል አንድ ጊዜ ብቻ ይጫናል
+    images = [make_image(media_server.base, position, ['/image/a.png']) for position in (0, 5)]
+
+    first, second = VisualAIEngine(cache_dir=str(tmp_path)).prepare_images(images, wordpress=wordpress)
+
+    assert len(media_server.uploads) == len(first['variants'])
+    assert ([variant['url'] for variant in first['variants']] ==
+            [variant['url'] for variant in second['variants']])
+    assert sum(1 for image in (first, second) for variant in image['variants'] if variant['uploaded']) \
+        == len(media_server.uploads)
+
+    # የተጫኑት ፋይሎች መዝገብ በዲስክ ላይ ስለሚቀመጥ አዲስ ሞተርም እንደገና አይጭንም
+    again = VisualAIEngine(cache_dir=str(tmp_path)).prepare_images(images[:1], wordpress=wordpress)[0]
+    assert len(media_server.uploads) == len(first['variants'])
+    assert not any(variant['uploaded'] for variant in again['variants'])
@@ -0,0 +1,112 @@
+"""
+VoiceAIEngine ን በ StubTTSBackend (ያለ ኔትወርክ) የሚፈትሹ ሙከራዎች: ትይዩ ማመንጨት፣ ካሽ እና base64
+"""
+
+import base64
+import os
+import threading
+import time
+import wave
+
+from v10.v10_features import StubTTSBackend, VoiceAIEngine
+
+ARTICLE = (
+    "<h1>Coffee Export</h1>\n\n"
+    "<p>Ethiopian coffee exports grew again this year. Prices held steady.</p>\n\n"
+    "<p>Smallholder farmers benefit from direct trade. Cooperatives expanded.</p>\n\n"
+    "<p>Logistics remain the main bottleneck.</p>"
+)
+
+LANGUAGES = ['en', 'de', 'fr', 'es']
+
+
+class SlowStubBackend(StubTTSBackend):
+    """በአንድ ጊዜ የሚሰሩ ጥሪዎችን የሚቆጥር እና የሚዘገይ stub"""
+
+    def __init__(self, delay: float = 0.2):
+        super().__init__()
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._active_lock = threading.Lock()
+
+    def synthesize(self, text, language, voice, path):
+        with self._active_lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            super().synthesize(text, language, voice, path)
+        finally:
+            with self._active_lock:
+                self.active -= 1
+
+
+def test_languages_are_synthesized_concurrently(tmp_path):
+    backend = SlowStubBackend(delay=0.2)
+    engine = VoiceAIEngine(backend=backend, cache_dir=str(tmp_path), max_workers=4)
+
+    started = time.monotonic()
+    results = engine.create_audio_summaries(ARTICLE, LANGUAGES)
+    elapsed = time.monotonic() - started
+
+    assert all(result['success'] for result in results.values())
+    assert backend.calls == len(LANGUAGES)
+    assert backend.max_active > 1
+    assert elapsed < backend.delay * len(LANGUAGES)
+    for result in results.values():
+        with wave.open(result['audio_file']['filename'], 'rb') as audio:
+            assert audio.getnframes() > 0
+
+
+def test_second_run_is_served_from_cache(tmp_path):
+    backend = StubTTSBackend()
+    engine = VoiceAIEngine(backend=backend, cache_dir=str(tmp_path))
+
+    first = engine.create_audio_summaries(ARTICLE, LANGUAGES)
+    calls = backend.calls
+    # አዲስ ሞተር ተመሳሳዩን የካሽ ፎልደር ሲጠቀምም ፋይሎቹ እንደገና አይፈጠሩም
+    second = VoiceAIEngine(backend=backend, cache_dir=str(tmp_path)).create_audio_summaries(ARTICLE, LANGUAGES)
+
+    assert calls == len(LANGUAGES)
+    assert backend.calls == calls
+    assert not any(result['audio_file']['cached'] for result in first.values())
+    assert all(result['audio_file']['cached'] for result in second.values())
+    assert ([result['audio_file']['filename'] for result in first.values()] ==
+            [result['audio_file']['filename'] for result in second.values()])
+
+
+def test_changed_text_is_synthesized_again(tmp_path):
+    backend = StubTTSBackend()
+    engine = VoiceAIEngine(backend=backend, cache_dir=str(tmp_path))
+
+    engine.create_audio_summary(ARTICLE, 'en')
+    result = engine.create_audio_summary(ARTICLE.replace('grew', 'fell'), 'en')
+
+    assert backend.calls == 2
+    assert result['audio_file']['cached'] is False
+
+
+def test_cache_keys_differ_per_voice(tmp_path):
+    backend = StubTTSBackend()
+    engine = VoiceAIEngine(backend=backend, cache_dir=str(tmp_path))
+
+    # ሁለቱም የ 'en' ቋንቋ ናቸው፣ ድምጻቸው ግን (com እና co.uk) የተለያየ ነው
+    results = engine.create_audio_summaries(ARTICLE, ['en', 'en-uk'])
+
+    us, uk = results['en']['audio_file'], results['en-uk']['audio_file']
+    assert (us['voice'], uk['voice']) == ('com', 'co.uk')
+    assert us['filename'] != uk['filename']
+    assert backend.calls == 2
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_include_base64_returns_file_contents(tmp_path):
+    engine = VoiceAIEngine(backend=StubTTSBackend(), cache_dir=str(tmp_path))
+
+    plain = engine.create_audio_summary(ARTICLE, 'en')
+    encoded = engine.create_audio_summary(ARTICLE, 'en', include_base64=True)
+
+    assert 'base64' not in plain['audio_file']
+    with open(encoded['audio_file']['filename'], 'rb') as f:
+        assert base64.b64decode(encoded['audio_file']['base64']) == f.read()
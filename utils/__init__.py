@@ -5,6 +5,18 @@
 from .logger import ProfitLogger, get_logger, global_logger
 from .file_manager import FileManager, get_file_manager
 from .validators import Validators, get_validator, quick_validate_topic, quick_validate_version
+from .pipeline_executor import PipelineStep, PipelineExecutor
+from .output_store import OutputStore, get_output_store
+from .batch_executor import BatchExecutor
+from .topic_source import TopicSource, get_topic_source
+from .batch_archive import BatchArchive, get_batch_archive
+from .db_access import DatabaseConnection, get_connection
+from .db_migrations import Migration, apply_migrations, check_query_plans
+from .db_export import StreamingExporter, export_table_jsonl
+from .db_backup import DatabaseBackup
+from .article_document import ArticleBlock, ArticleDocument
+from .article_styles import ArticleStyles, get_article_styles
+from .html_minifier import HtmlMinifier, get_html_minifier
 
 __all__ = [
     'ProfitLogger',
@@ -15,7 +27,30 @@ __all__ = [
     'Validators',
     'get_validator',
     'quick_validate_topic',
-    'quick_validate_version'
+    'quick_validate_version',
+    'PipelineStep',
+    'PipelineExecutor',
+    'OutputStore',
+    'get_output_store',
+    'BatchExecutor',
+    'TopicSource',
+    'get_topic_source',
+    'BatchArchive',
+    'get_batch_archive',
+    'DatabaseConnection',
+    'get_connection',
+    'Migration',
+    'apply_migrations',
+    'check_query_plans',
+    'StreamingExporter',
+    'export_table_jsonl',
+    'DatabaseBackup',
+    'ArticleBlock',
+    'ArticleDocument',
+    'ArticleStyles',
+    'get_article_styles',
+    'HtmlMinifier',
+    'get_html_minifier'
 ]
 
 __version__ = "1.0.0"
@@ -0,0 +1,170 @@
+"""
+አንድ ጊዜ ወደ ብሎኮች የሚተነተን የጽሁፍ ሰነድ (ርዕሶች፣ አንቀጾች እና የተጨመሩ ክፍሎች)
+ምስል፣ ቪዲዮ፣ affiliate እና ውስጣዊ ሊንኮች በቦታው ይጨመራሉ፣ በመጨረሻ አንድ ጊዜ ወደ HTML ይቀየራል
+"""
+
+import re
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+class ArticleBlock:
+    """የሰነዱ አንድ ብሎክ (በባዶ መስመር የተለየ)"""
+
+    __slots__ = ('html', 'kind', 'level', 'text', 'source')
+
+    def __init__(self, html: str, kind: str = 'paragraph', level: int = 0,
+                 text: str = '', source: Optional[str] = None):
+        self.html = html
+        self.kind = kind        # 'heading'፣ 'paragraph' ወይም 'embed'
+        self.level = level      # ለርዕሶች 1-6
+        self.text = text        # ለርዕሶች ከመለያዎች የጸዳ ጽሁፍ
+        self.source = source    # ብሎኩን የጨመረው ደረጃ (ለምሳሌ 'image'፣ 'affiliate')
+
+    def __repr__(self) -> str:
+        return f"ArticleBlock({self.kind}, {self.html[:40]!r})"
+
+
+class ArticleDocument:
+    """በብሎኮች የተከፋፈለ የጽሁፍ ሰነድ"""
+
+    BLOCK_BREAK = re.compile(r'\n\s*\n')
+    HEADING = re.compile(r'\s*<h([1-6])\b[^>]*>(.*?)</h\1>', re.IGNORECASE | re.DOTALL)
+    TAG = re.compile(r'<[^>]+>')
+
+    def __init__(self, blocks: Optional[List[ArticleBlock]] = None):
+        """
+        የሰነዱ አደረጃጀት
+
+        Args:
+            blocks (List[ArticleBlock], optional): የመጀመሪያ ብሎኮች
+        """
+        self.blocks: List[ArticleBlock] = blocks or []
+
+    @classmethod
+    def parse(cls, html: str) -> 'ArticleDocument':
+        """
+        HTML ን በባዶ መስመሮች ወደ ብሎኮች ይከፍላል (አንድ ጊዜ ብቻ)
+
+        Args:
+            html (str): የጽሁፉ ይዘት
+
+        Returns:
+            ArticleDocument: የተተነተነው ሰነድ
+        """
+        return cls([cls._classify(part) for part in cls.BLOCK_BREAK.split(html)])
+
+    @classmethod
+    def _classify(cls, html: str, source: Optional[str] = None) -> ArticleBlock:
+        """ብሎኩ ርዕስ መሆኑን ይለያል"""
+        match = cls.HEADING.match(html)
+        if match:
+            text = cls.TAG.sub('', match.group(2)).strip()
+            return ArticleBlock(html, 'heading', int(match.group(1)), text, source)
+        return ArticleBlock(html, 'paragraph', source=source)
+
+    @staticmethod
+    def _embed(html: str, source: Optional[str]) -> ArticleBlock:
+        # የተጨመሩ ክፍሎች በዙሪያቸው አንድ ባዶ መስመር ብቻ እንዲኖራቸው
+        return ArticleBlock(html.strip('\n'), 'embed', source=source)
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+    def __iter__(self) -> Iterator[ArticleBlock]:
+        return iter(self.blocks)
+
+    def __getitem__(self, index: int) -> ArticleBlock:
+        return self.blocks[index]
+
+    def insert(self, index: int, html: str, source: Optional[str] = None) -> ArticleBlock:
+        """
+        የተዘጋጀ ክፍል (ምስል፣ ቪዲዮ፣ ሊንክ...) ከ index ብሎክ በፊት ያስገባል
+
+        Args:
+            index (int): ቦታ (እንደ list.insert)
+            html (str): የሚገባው HTML
+            source (str, optional): የጨመረው ደረጃ
+
+        Returns:
+            ArticleBlock: የገባው ብሎክ
+        """
+        block = self._embed(html, source)
+        self.blocks.insert(index, block)
+        return block
+
+    def insert_many(self, placements: Iterable[Tuple[int, str]], source: Optional[str] = None) -> int:
+        """
+        ብዙ ክፍሎችን በአንድ ዙር ያስገባል፤ ቦታዎቹ አሁን ያሉትን ብሎኮች ያመለክታሉ
+
+        Args:
+            placements (Iterable[Tuple[int, str]]): (ከዚህ ብሎክ በፊት, HTML)፣ አንድ ቦታ ያላቸው በተሰጡበት ቅደም ተከተል
+            source (str, optional): የጨመረው ደረጃ
+
+        Returns:
+            int: የገቡ ክፍሎች ብዛት
+        """
+        ordered = sorted(placements, key=lambda placement: placement[0])
+        if not ordered:
+            return 0
+
+        blocks = []
+        previous = 0
+        for index, html in ordered:
+            index = max(0, min(index, len(self.blocks)))
+            blocks.extend(self.blocks[previous:index])
+            blocks.append(self._embed(html, source))
+            previous = index
+        blocks.extend(self.blocks[previous:])
+
+        self.blocks = blocks
+        return len(ordered)
+
+    def append(self, html: str, source: Optional[str] = None) -> ArticleBlock:
+        """ክፍል በሰነዱ መጨረሻ ይጨምራል"""
+        return self.insert(len(self.blocks), html, source)
+
+    def replace(self, index: int, html: str):
+        """የአንድን ብሎክ HTML ይቀይራል (አይነቱ እንደገና ይለያል)"""
+        previous = self.blocks[index]
+        if previous.kind == 'embed':
+            self.blocks[index] = self._embed(html, previous.source)
+        else:
+            self.blocks[index] = self._classify(html, previous.source)
+
+    def headings(self, levels: Sequence[int] = (1, 2, 3, 4, 5, 6)) -> List[Tuple[int, ArticleBlock]]:
+        """
+        የሰነዱ ርዕሶች (የተጨመሩ ክፍሎች ውስጥ ያሉ ርዕሶች አይቆጠሩም)
+
+        Args:
+            levels (Sequence[int]): የሚፈለጉ የርዕስ ደረጃዎች
+
+        Returns:
+            List[Tuple[int, ArticleBlock]]: (ቦታ, ብሎክ)
+        """
+        return [(index, block) for index, block in enumerate(self.blocks)
+                if block.kind == 'heading' and block.level in levels]
+
+    def find_heading(self, text: str, levels: Sequence[int] = (2, 3)) -> Optional[int]:
+        """
+        ጽሁፉ text የያዘ የመጀመሪያውን ርዕስ ቦታ ይመልሳል (ፊደል መጠን አይለይም)
+
+        Args:
+            text (str): የሚፈለገው ጽሁፍ (ለምሳሌ 'conclusion')
+            levels (Sequence[int]): የርዕስ ደረጃዎች
+
+        Returns:
+            Optional[int]: የርዕሱ ቦታ ወይም None
+        """
+        needle = text.lower()
+        for index, block in self.headings(levels):
+            if needle in block.text.lower():
+                return index
+        return None
+
+    def count(self, source: str) -> int:
+        """በአንድ ደረጃ የተጨመሩ ብሎኮች ብዛት"""
+        return sum(1 for block in self.blocks if block.source == source)
+
+    def to_html(self) -> str:
+        """ሰነዱን ወደ HTML ይቀይራል (በብሎኮች መካከል አንድ ባዶ መስመር)"""
+        return '\n\n'.join(block.html for block in self.blocks)
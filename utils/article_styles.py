@@ -0,0 +1,190 @@
+"""
+ለጽሁፍ ክፍሎች (TOC፣ ቁልፍ ነጥቦች፣ መደምደሚያ፣ affiliate፣ ምስል፣ ቪዲዮ፣ ውስጣዊ ሊንክ፣ ማስታወቂያ ማሳሰቢያ) የሚጋራ የስታይል መዝገብ
+"inline" ሁነታ ቀድሞ የነበረውን style="..." ያወጣል፣ "class" ሁነታ ክፍሎችን እና አንድ የጋራ stylesheet ይጠቀማል
+"""
+
+import os
+from typing import Dict, Optional, Tuple
+
+# ስም -> (የክፍሉ semantic class ወይም None, CSS declarations)
+ARTICLE_STYLES: Dict[str, Tuple[Optional[str], str]] = {
+    # ርዕሶች (AdvancedContentFormatter)
+    'heading-2': (None, "border-bottom: 2px solid #4a5568; padding-bottom: 10px; margin-top: 40px; color: #2d3748;"),
+    'heading-3': (None, "border-left: 4px solid #667eea; padding-left: 15px; margin-top: 30px; color: #4a5568;"),
+
+    # የይዘት ማውጫ
+    'toc': ('table-of-contents', "background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 25px; border-radius: 12px; margin: 30px 0; box-shadow: 0 10px 30px rgba(0,0,0,0.1);"),
+    'toc-title': (None, "margin-top: 0; color: white;"),
+    'toc-list': (None, "columns: 2; column-gap: 40px; list-style: none; padding-left: 0;"),
+    'toc-link': (None, "color: #4a5568; text-decoration: none;"),
+    'toc-note': (None, "font-size: 0.9em; opacity: 0.9; margin-top: 15px;"),
+
+    # ቁልፍ ነጥቦች
+    'takeaways': ('key-takeaways', "background: #f0fff4; border: 2px solid #9ae6b4; padding: 25px; border-radius: 12px; margin: 40px 0; box-shadow: 0 5px 15px rgba(0,0,0,0.05);"),
+    'takeaways-title': (None, "margin-top: 0; color: #2f855a;"),
+    'takeaways-list': (None, "margin: 15px 0; padding-left: 20px; color: #2d3748;"),
+    'takeaways-note': (None, "color: #718096; font-style: italic; margin-top: 15px;"),
+
+    # መደምደሚያ
+    'conclusion': ('conclusion', "background: linear-gradient(135deg, #f6d365 0%, #fda085 100%); padding: 30px; border-radius: 12px; margin: 40px 0; box-shadow: 0 10px 30px rgba(0,0,0,0.1);"),
+    'conclusion-title': (None, "margin-top: 0; color: #2d3748;"),
+    'conclusion-text': (None, "color: #2d3748; font-size: 1.1em;"),
+    'conclusion-plan': (None, "margin-top: 20px;"),
+
+    # Affiliate ሳጥን
+    'affiliate': ('affiliate-disclosure', "background: #f8f9fa; border-left: 4px solid #4a5568; padding: 15px; margin: 20px 0; border-radius: 0 8px 8px 0;"),
+    'affiliate-text': (None, "margin: 0; font-style: italic; color: #4a5568;"),
+    'affiliate-link': (None, "color: #2d3748; font-weight: bold; text-decoration: none;"),
+    'affiliate-note': (None, "margin: 10px 0 0 0; font-size: 0.9em; color: #718096;"),
+
+    # ምስል
+    'image': ('article-image', "margin: 30px 0; text-align: center;"),
+    'image-img': (None, "max-width: 100%; height: auto; border-radius: 12px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); border: 1px solid #e2e8f0;"),
+    'image-caption': (None, "font-style: italic; color: #666; margin-top: 10px; font-size: 0.9em;"),
+
+    # YouTube ቪዲዮ
+    'video': ('youtube-embed', "margin: 40px 0; background: #f8f9fa; padding: 25px; border-radius: 10px; border-left: 5px solid #ff0000; box-shadow: 0 5px 15px rgba(0,0,0,0.05);"),
+    'video-title': (None, "margin-top: 0; color: #333;"),
+    'video-frame': (None, "position: relative; padding-bottom: 56.25%; height: 0; overflow: hidden; margin: 20px 0; border-radius: 8px;"),
+    'video-iframe': (None, "position: absolute; top: 0; left: 0; width: 100%; height: 100%; border: none; border-radius: 8px;"),
+    'video-actions': (None, "text-align: center; margin-top: 15px;"),
+    'video-button': (None, "background: #ff0000; color: white; padding: 10px 20px; border-radius: 6px; text-decoration: none; font-weight: bold;"),
+
+    # ውስጣዊ ሊንክ ካርድ (v11)
+    'internal-link': ('internal-link', "background: #f0f9ff; border-left: 4px solid #3182ce; padding: 15px; margin: 20px 0; border-radius: 0 8px 8px 0;"),
+    'internal-link-text': (None, "margin: 0; color: #2d3748;"),
+    'internal-link-anchor': (None, "color: #2b6cb0; font-weight: bold; text-decoration: none;"),
+    'internal-link-excerpt': (None, "margin: 10px 0 0 0; font-size: 0.9em; color: #718096;"),
+
+    # AdSense ማሳሰቢያ (v11)
+    'disclaimer': ('adsense-disclaimer', "background: #fff3cd; border: 1px solid #ffeaa7; padding: 20px; border-radius: 8px; margin-bottom: 30px; font-size: 0.9em;"),
+    'disclaimer-title': (None, "margin-top: 0; color: #856404;"),
+    'disclaimer-text': (None, "margin: 10px 0; color: #856404;"),
+}
+
+
+class ArticleStyles:
+    """የጽሁፍ ክፍሎችን የስታይል attributes እና የጋራ stylesheet የሚሰጥ"""
+
+    MODES = ('inline', 'class')
+    STYLE_TAG_ID = "pm-article-styles"
+
+    def __init__(self, mode: str = 'inline', prefix: str = 'pm-',
+                 embed_stylesheet: bool = True, styles: Optional[Dict[str, Tuple[Optional[str], str]]] = None):
+        """
+        የስታይሎቹ አደረጃጀት
+
+        Args:
+            mode (str): "inline" (style="...") ወይም "class" (class + stylesheet)
+            prefix (str): semantic class ለሌላቸው ክፍሎች የሚሰጥ class መጀመሪያ
+            embed_stylesheet (bool): በ class ሁነታ stylesheet በጽሁፉ ውስጥ አንድ ጊዜ ይገባል (False: በ theme ውስጥ ተመዝግቧል)
+            styles (Dict, optional): ከነባሪው መዝገብ ላይ የሚጨመሩ/የሚቀየሩ ስታይሎች
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"ያልታወቀ የስታይል ሁነታ: {mode} (ከ {self.MODES} አንዱ)")
+
+        self.mode = mode
+        self.prefix = prefix
+        self.embed_stylesheet = embed_stylesheet
+        self.styles = {**ARTICLE_STYLES, **(styles or {})}
+
+        # attributes አንድ ጊዜ ይዘጋጃሉ (በእያንዳንዱ ክፍል አይደገምም)
+        self._attrs = {name: self._build_attrs(name) for name in self.styles}
+
+    def _class_name(self, name: str) -> str:
+        semantic_class, _ = self.styles[name]
+        return semantic_class or f"{self.prefix}{name}"
+
+    def _build_attrs(self, name: str) -> str:
+        semantic_class, css = self.styles[name]
+        if self.mode == 'class':
+            return f'class="{self._class_name(name)}"'
+        if semantic_class:
+            return f'class="{semantic_class}" style="{css}"'
+        return f'style="{css}"'
+
+    def attrs(self, name: str) -> str:
+        """
+        የአንድ ክፍል attributes (inline: class/style="..."፣ class: class="...")
+
+        Args:
+            name (str): በመዝገቡ ውስጥ ያለ የክፍል ስም (ለምሳሌ 'toc'፣ 'affiliate-link')
+
+        Returns:
+            str: በመለያው ውስጥ የሚገባ attribute ጽሁፍ
+        """
+        return self._attrs[name]
+
+    def stylesheet(self, html: Optional[str] = None) -> str:
+        """
+        የጋራ CSS ይመልሳል
+
+        Args:
+            html (str, optional): ከተሰጠ በዚህ ጽሁፍ ውስጥ ጥቅም ላይ የዋሉ classes ብቻ
+
+        Returns:
+            str: CSS rules (አንድ በመስመር)
+        """
+        rules = []
+        for name, (_, css) in self.styles.items():
+            class_name = self._class_name(name)
+            if html is not None and f'class="{class_name}"' not in html:
+                continue
+            # "property: value; " -> "property:value;"
+            compact = css.replace(': ', ':').replace('; ', ';')
+            rules.append(f".{class_name}{{{compact}}}")
+        return '\n'.join(rules)
+
+    def style_tag(self, html: Optional[str] = None) -> str:
+        """stylesheet ን በ <style> መለያ ውስጥ ይመልሳል"""
+        return f'<style id="{self.STYLE_TAG_ID}">\n{self.stylesheet(html)}\n</style>'
+
+    def attach_stylesheet(self, html: str) -> str:
+        """
+        በ class ሁነታ stylesheet ን በጽሁፉ መጀመሪያ አንድ ጊዜ ያስገባል (በ inline ሁነታ ምንም አይቀይርም)
+
+        Args:
+            html (str): የተቀረጸው ጽሁፍ
+
+        Returns:
+            str: stylesheet ያለው ጽሁፍ
+        """
+        if self.mode != 'class' or not self.embed_stylesheet or self.STYLE_TAG_ID in html:
+            return html
+        # በዚህ ጽሁፍ ውስጥ ያሉ classes ብቻ ይገባሉ
+        css = self.stylesheet(html)
+        if not css:
+            return html
+        return f'<style id="{self.STYLE_TAG_ID}">\n{css}\n</style>\n{html}'
+
+    def write_stylesheet(self, path: str) -> str:
+        """
+        stylesheet ን በ theme ውስጥ ለመመዝገብ ወደ ፋይል ይጽፋል
+
+        Args:
+            path (str): የ .css ፋይል መንገድ
+
+        Returns:
+            str: የተጻፈው ፋይል መንገድ
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.stylesheet() + '\n')
+        return path
+
+
+def get_article_styles(mode: str = 'inline', prefix: str = 'pm-',
+                       embed_stylesheet: bool = True) -> ArticleStyles:
+    """
+    የጽሁፍ ስታይል አገልግሎት ይመልሳል
+
+    Args:
+        mode (str): "inline" ወይም "class"
+        prefix (str): የ class መጀመሪያ
+        embed_stylesheet (bool): stylesheet በጽሁፉ ውስጥ ይግባ
+
+    Returns:
+        ArticleStyles: የስታይል አገልግሎት
+    """
+    return ArticleStyles(mode, prefix, embed_stylesheet)
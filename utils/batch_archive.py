@@ -0,0 +1,158 @@
+"""
+የአንድ ቡድን ሁሉንም ውጤቶች በአንድ append-only JSONL ፋይል የሚያስቀምጥ ማህደር
+ከኢንዴክሱ (topic -> offset, length) በመነሳት እያንዳንዱ ርዕሰ ጉዳይ በ O(1) ይነበባል
+"""
+
+import os
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+
+class BatchArchive:
+    """ለብዙ processes የሚጋራ append-only የቡድን ውጤቶች ማህደር"""
+
+    INDEX_SUFFIX = ".idx"
+
+    def __init__(self, path: str):
+        """
+        የማህደሩ አደረጃጀት
+
+        Args:
+            path (str): የመረጃ ፋይሉ መንገድ (.jsonl)፣ ኢንዴክሱ በ path + ".idx" ይቀመጣል
+        """
+        self.path = path
+        self.index_path = path + self.INDEX_SUFFIX
+        self.logger = logging.getLogger("BatchArchive")
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        # ርዕሰ ጉዳይ -> (offset, length) (ተመሳሳይ ርዕሰ ጉዳይ ሲደገም የመጨረሻው ያሸንፋል)
+        self._index: Dict[str, tuple] = {}
+        self._index_size = 0
+
+    def _refresh_index(self):
+        """ከሌሎች processes የተጨመሩ የኢንዴክስ መስመሮችን ብቻ ያነባል"""
+        if not os.path.exists(self.index_path):
+            return
+
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            f.seek(self._index_size)
+            for line in f:
+                if not line.endswith("\n"):
+                    # ገና ሙሉ ያልተጻፈ መስመር
+                    break
+                self._index_size += len(line.encode('utf-8'))
+                entry = json.loads(line)
+                self._index[entry['topic']] = (entry['offset'], entry['length'])
+
+    def append(self, topic: str, outputs: Dict, metadata: Optional[Dict] = None) -> Dict:
+        """
+        የአንድን ርዕሰ ጉዳይ ውጤቶች ይጨምራል
+
+        Args:
+            topic (str): ርዕሰ ጉዳይ
+            outputs (Dict): የውጤት አይነት -> ይዘት
+            metadata (Dict, optional): ተጨማሪ መረጃ (ስሪት፣ ጊዜ...)
+
+        Returns:
+            Dict: topic፣ offset፣ length እና path
+        """
+        record = {
+            'topic': topic,
+            'timestamp': datetime.now().isoformat(),
+            'outputs': {key: str(value) for key, value in outputs.items()}
+        }
+        if metadata:
+            record.update(metadata)
+
+        data = (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+
+        with self._lock:
+            with open(self.path, 'ab') as data_file:
+                # ብዙ worker processes በአንድ ጊዜ እንዳይጽፉ
+                if FCNTL_AVAILABLE:
+                    fcntl.flock(data_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    data_file.seek(0, os.SEEK_END)
+                    offset = data_file.tell()
+                    data_file.write(data)
+                    data_file.flush()
+
+                    entry = {'topic': topic, 'offset': offset, 'length': len(data)}
+                    with open(self.index_path, 'a', encoding='utf-8') as index_file:
+                        index_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                finally:
+                    if FCNTL_AVAILABLE:
+                        fcntl.flock(data_file.fileno(), fcntl.LOCK_UN)
+
+            self._index[topic] = (offset, len(data))
+
+        return {**entry, 'path': self.path}
+
+    def read(self, topic: str) -> Optional[Dict]:
+        """
+        የአንድን ርዕሰ ጉዳይ መዝገብ በኢንዴክሱ በኩል ያነባል
+
+        Args:
+            topic (str): ርዕሰ ጉዳይ
+
+        Returns:
+            Optional[Dict]: የተቀመጠው መዝገብ ወይም None
+        """
+        with self._lock:
+            if topic not in self._index:
+                self._refresh_index()
+            location = self._index.get(topic)
+
+        if location is None:
+            return None
+
+        offset, length = location
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.read(length).decode('utf-8'))
+
+    def topics(self) -> List[str]:
+        """በማህደሩ ውስጥ ያሉትን ርዕሰ ጉዳዮች ይመልሳል"""
+        with self._lock:
+            self._refresh_index()
+            return list(self._index.keys())
+
+    def __iter__(self) -> Iterator[Dict]:
+        """ሁሉንም መዝገቦች በተጻፉበት ቅደም ተከተል ይመልሳል"""
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def __contains__(self, topic: str) -> bool:
+        with self._lock:
+            if topic not in self._index:
+                self._refresh_index()
+            return topic in self._index
+
+
+def get_batch_archive(path: str) -> BatchArchive:
+    """
+    የቡድን ማህደር አገልግሎት ይመልሳል
+
+    Args:
+        path (str): የማህደሩ ፋይል መንገድ
+
+    Returns:
+        BatchArchive: የቡድን ማህደር
+    """
+    return BatchArchive(path)
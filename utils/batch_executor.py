@@ -0,0 +1,217 @@
+"""
+ብዙ ስራዎችን በ worker pool (process ወይም thread) የሚያካሂድ አገልግሎት
+በጊዜ ገደብ፣ በቅደም ተከተል ወይም በተጠናቀቀበት ቅደም ተከተል ውጤት፣ እና በ back-pressure
+"""
+
+import time
+import logging
+import concurrent.futures
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+
+class BatchExecutor:
+    """ግብዓቶችን በ worker pool የሚያካሂድ እና ውጤቶችን አንድ በአንድ የሚመልስ"""
+
+    def __init__(self, worker: Callable[[Any], Any], max_workers: int = 4,
+                 use_processes: bool = True, task_timeout: Optional[float] = None,
+                 ordered: bool = False, max_in_flight: Optional[int] = None,
+                 initializer: Optional[Callable] = None, initargs: Tuple = (),
+                 progress_callback: Optional[Callable[[Dict], None]] = None,
+                 logger: Optional[logging.Logger] = None):
+        """
+        የአስፈጻሚ አደረጃጀት
+
+        Args:
+            worker (Callable): ለእያንዳንዱ ግብዓት የሚጠራ ተግባር (ለ process pool በሞጁል ደረጃ መሆን አለበት)
+            max_workers (int): የ worker ብዛት
+            use_processes (bool): True ከሆነ ProcessPoolExecutor, አለበለዚያ ThreadPoolExecutor
+            task_timeout (float, optional): ለአንድ ስራ የሚፈቀደው ከፍተኛ ሰከንድ። ሲሰጥ ስራ የሚላከው
+                ነጻ worker ሲኖር ብቻ ነው (ጊዜው ከስራው መጀመሪያ ይቆጠራል)። ጊዜው ያለፈበት ስራ ሊቋረጥ
+                ስለማይችል worker ውን እስኪያልቅ ይይዛል፤ ሁሉም workers እንደዚህ ከተያዙ pool ይታደሳል
+            ordered (bool): ውጤቶችን በግብዓት ቅደም ተከተል መመለስ
+            max_in_flight (int, optional): በአንድ ጊዜ የሚላኩ ከፍተኛ ስራዎች (back-pressure)
+            initializer (Callable, optional): በእያንዳንዱ worker መጀመሪያ የሚጠራ ተግባር
+            initargs (Tuple): ለ initializer የሚሰጡ ግብዓቶች
+            progress_callback (Callable, optional): እያንዳንዱ ስራ ሲጠናቀቅ የሚጠራ ተግባር
+            logger (logging.Logger, optional): ሎገር
+        """
+        self.worker = worker
+        self.max_workers = max(1, max_workers)
+        self.use_processes = use_processes
+        self.task_timeout = task_timeout
+        self.ordered = ordered
+        self.max_in_flight = max_in_flight or self.max_workers * 2
+        self.initializer = initializer
+        self.initargs = initargs
+        self.progress_callback = progress_callback
+        self.logger = logger or logging.getLogger("BatchExecutor")
+
+        self.progress = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'timed_out': 0
+        }
+
+    def _create_pool(self):
+        """የ worker pool ይፈጥራል"""
+        pool_class = (concurrent.futures.ProcessPoolExecutor if self.use_processes
+                      else concurrent.futures.ThreadPoolExecutor)
+        return pool_class(
+            max_workers=self.max_workers,
+            initializer=self.initializer,
+            initargs=self.initargs
+        )
+
+    def run(self, items: Iterable[Any]) -> Iterator[Dict]:
+        """
+        ግብዓቶችን ያካሂዳል፣ ግብዓቱ በሰነፍ (lazily) ይነበባል
+
+        Args:
+            items (Iterable): የሚካሄዱ ግብዓቶች (generator ሊሆን ይችላል)
+
+        Returns:
+            Iterator[Dict]: index, item, status (completed/failed/timeout), result, error, duration
+        """
+        iterator = iter(enumerate(items))
+        exhausted = False
+
+        running: Dict[concurrent.futures.Future, Tuple[int, Any, float]] = {}
+        # ጊዜያቸው ያለፈ ግን አሁንም worker የያዙ ስራዎች
+        stuck: Set[concurrent.futures.Future] = set()
+        buffered: Dict[int, Dict] = {}
+        next_to_yield = 0
+
+        pool = self._create_pool()
+        try:
+            while True:
+                stuck = {future for future in stuck if not future.done()}
+                if stuck and not running and len(stuck) >= self.max_workers and not exhausted:
+                    pool = self._recycle_pool(pool, len(stuck))
+                    stuck = set()
+
+                # Back-pressure: በበረራ ላይ ያሉ + የተጠባበቁ ውጤቶች ከገደቡ አይበልጡም
+                while (not exhausted and len(running) + len(buffered) < self.max_in_flight
+                       and self._has_free_worker(running, stuck)):
+                    try:
+                        index, item = next(iterator)
+                    except StopIteration:
+                        exhausted = True
+                        break
+
+                    future = pool.submit(self.worker, item)
+                    running[future] = (index, item, time.time())
+                    self.progress['submitted'] += 1
+
+                if not running and not buffered:
+                    break
+
+                finished = []
+
+                if running:
+                    # የተያዙ workers ሲለቀቁ አዲስ ስራ ለመላክ እነሱም ይጠበቃሉ
+                    done, _ = concurrent.futures.wait(
+                        set(running) | stuck,
+                        timeout=self._next_deadline(running),
+                        return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+
+                    now = time.time()
+                    for future in list(running.keys()):
+                        index, item, started_at = running[future]
+
+                        if future in done:
+                            del running[future]
+                            finished.append(self._collect(future, index, item, now - started_at))
+
+                        elif self.task_timeout and now - started_at >= self.task_timeout:
+                            # ሂደቱ ሊቋረጥ አይችልም፣ ውጤቱ ግን አይጠበቅም
+                            del running[future]
+                            if not future.cancel():
+                                stuck.add(future)
+                            finished.append({
+                                'index': index,
+                                'item': item,
+                                'status': 'timeout',
+                                'result': None,
+                                'error': f"ጊዜ አልፏል ({self.task_timeout} ሰከንድ)",
+                                'duration': round(now - started_at, 3)
+                            })
+
+                for outcome in finished:
+                    self._record_progress(outcome)
+
+                    if self.ordered:
+                        buffered[outcome['index']] = outcome
+                    else:
+                        yield outcome
+
+                if self.ordered:
+                    while next_to_yield in buffered:
+                        yield buffered.pop(next_to_yield)
+                        next_to_yield += 1
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _has_free_worker(self, running: Dict, stuck: Set) -> bool:
+        """
+        አዲስ ስራ ወዲያው መጀመር እንደሚችል ያረጋግጣል
+
+        task_timeout ሲኖር ስራዎች በ pool ወረፋ ውስጥ አይጠብቁም፣ አለበለዚያ የወረፋው ጊዜ
+        እንደ ስራው ጊዜ ተቆጥሮ ያልጀመሩ ስራዎች ጊዜ አልፏል ይባላሉ
+        """
+        if not self.task_timeout:
+            return True
+        return len(running) + len(stuck) < self.max_workers
+
+    def _recycle_pool(self, pool, stuck_count: int):
+        """ሁሉም workers ጊዜ ባለፈባቸው ስራዎች ሲያዙ አዲስ pool ይፈጥራል"""
+        self.logger.warning(
+            f"⚠️ ሁሉም {stuck_count} workers ጊዜ ባለፈባቸው ስራዎች ተይዘዋል፣ አዲስ pool እየተፈጠረ ነው"
+        )
+        # የቀድሞዎቹ workers የያዙትን ስራ ሲጨርሱ ይወጣሉ
+        pool.shutdown(wait=False, cancel_futures=True)
+        return self._create_pool()
+
+    def _collect(self, future: concurrent.futures.Future, index: int, item: Any, duration: float) -> Dict:
+        """የተጠናቀቀ ስራ ውጤትን ያዘጋጃል"""
+        try:
+            return {
+                'index': index,
+                'item': item,
+                'status': 'completed',
+                'result': future.result(),
+                'error': None,
+                'duration': round(duration, 3)
+            }
+        except Exception as e:
+            return {
+                'index': index,
+                'item': item,
+                'status': 'failed',
+                'result': None,
+                'error': str(e),
+                'duration': round(duration, 3)
+            }
+
+    def _record_progress(self, outcome: Dict):
+        """የሂደቱን ቆጣሪዎች ያዘምናል እና progress_callback ይጠራል"""
+        if outcome['status'] == 'completed':
+            self.progress['completed'] += 1
+        elif outcome['status'] == 'timeout':
+            self.progress['timed_out'] += 1
+        else:
+            self.progress['failed'] += 1
+
+        if self.progress_callback:
+            try:
+                self.progress_callback({**self.progress, 'last': outcome})
+            except Exception as e:
+                self.logger.warning(f"progress_callback ስህተት: {e}")
+
+    def _next_deadline(self, running: Dict) -> Optional[float]:
+        """እስከሚቀጥለው የጊዜ ገደብ ያለውን ሰከንድ ያሰላል"""
+        if not self.task_timeout or not running:
+            return None
+        earliest = min(started_at for _, _, started_at in running.values())
+        return max(0.0, earliest + self.task_timeout - time.time())
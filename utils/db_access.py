@@ -0,0 +1,259 @@
+"""
+ለ v10 እና ለ v11 የሚጋራ የ SQLite መዳረሻ ንብርብር
+አንድ ረጅም ዕድሜ ያለው ግንኙነት በፋይል፣ WAL journal፣ የተስተካከሉ pragmas እና ግልጽ transactions
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+# ነባሪ pragmas: WAL ከ synchronous=NORMAL ጋር ለእያንዳንዱ commit fsync አያደርግም
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -16000,   # 16 MB (አሉታዊ ቁጥር በ KiB ነው)
+    'temp_store': 'MEMORY',
+    'busy_timeout': 5000
+}
+
+
+class DatabaseConnection:
+    """በ lock የተጠበቀ አንድ ረጅም ዕድሜ ያለው የ SQLite ግንኙነት"""
+
+    def __init__(self, db_path: str, pragmas: Optional[Dict[str, Any]] = None,
+                 cached_statements: int = 256):
+        """
+        የግንኙነቱ አደረጃጀት
+
+        Args:
+            db_path (str): የዳታቤዝ ፋይል መንገድ
+            pragmas (Dict, optional): ከነባሪዎቹ ላይ የሚጨመሩ/የሚቀየሩ pragmas
+            cached_statements (int): የሚቀመጡ የተዘጋጁ (prepared) statements ብዛት
+        """
+        self.db_path = db_path
+        self.pragmas = {**DEFAULT_PRAGMAS, **(pragmas or {})}
+        self.logger = logging.getLogger("DatabaseConnection")
+        self._lock = threading.RLock()
+
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+
+        # isolation_level=None: transactions በ transaction() ውስጥ በግልጽ ይጀመራሉ
+        self.connection = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=cached_statements
+        )
+        self.connection.row_factory = sqlite3.Row
+        self._apply_pragmas()
+
+    def _apply_pragmas(self):
+        """pragmas ን ይተገብራል"""
+        for name, value in self.pragmas.items():
+            row = self.connection.execute(f"PRAGMA {name}={value}").fetchone()
+            if name == 'journal_mode' and row and str(row[0]).upper() != str(value).upper():
+                self.logger.warning(f"journal_mode {value} አልተቻለም ({row[0]})")
+
+    @contextmanager
+    def transaction(self, immediate: bool = True) -> Iterator[sqlite3.Cursor]:
+        """
+        ግልጽ transaction (ስህተት ከተፈጠረ ይመለሳል)
+
+        Args:
+            immediate (bool): BEGIN IMMEDIATE (የመጻፍ lock ቀድሞ ይያዛል)
+
+        Returns:
+            Iterator[sqlite3.Cursor]: በ transaction ውስጥ የሚሰራ cursor
+        """
+        with self._lock:
+            nested = self.connection.in_transaction
+            cursor = self.connection.cursor()
+
+            if not nested:
+                cursor.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            try:
+                yield cursor
+                if not nested:
+                    cursor.execute("COMMIT")
+            except Exception:
+                if not nested:
+                    cursor.execute("ROLLBACK")
+                raise
+            finally:
+                cursor.close()
+
+    def execute(self, sql: str, params: Sequence = ()) -> sqlite3.Cursor:
+        """አንድ statement ያስፈጽማል (ከ transaction ውጭ ከሆነ autocommit)"""
+        with self._lock:
+            return self.connection.execute(sql, params)
+
+    def executemany(self, sql: str, rows: Iterable[Sequence]) -> int:
+        """
+        ብዙ ረድፎችን በአንድ transaction ውስጥ ያስገባል
+
+        Args:
+            sql (str): የተዘጋጀው statement
+            rows (Iterable[Sequence]): ግብዓቶች
+
+        Returns:
+            int: የተነኩ ረድፎች ብዛት
+        """
+        with self.transaction() as cursor:
+            cursor.executemany(sql, rows)
+            return cursor.rowcount
+
+    def query(self, sql: str, params: Sequence = ()) -> List[Dict]:
+        """SELECT ያስፈጽማል እና ረድፎችን እንደ Dict ይመልሳል"""
+        with self._lock:
+            return [dict(row) for row in self.connection.execute(sql, params).fetchall()]
+
+    def query_one(self, sql: str, params: Sequence = ()) -> Optional[sqlite3.Row]:
+        """የመጀመሪያውን ረድፍ ብቻ ይመልሳል"""
+        with self._lock:
+            return self.connection.execute(sql, params).fetchone()
+
+    def scalar(self, sql: str, params: Sequence = (), default: Any = None) -> Any:
+        """የመጀመሪያውን ረድፍ የመጀመሪያ አምድ ይመልሳል"""
+        row = self.query_one(sql, params)
+        if row is None or row[0] is None:
+            return default
+        return row[0]
+
+    # ቀጥታ sqlite3.Connection ይጠቀሙ ለነበሩ ኮዶች (cursor() / commit())
+    def cursor(self) -> sqlite3.Cursor:
+        """
+        ጥሬ cursor ይመልሳል
+
+        ግንኙነቱ isolation_level=None ስለሆነ በዚህ cursor የሚሰራ እያንዳንዱ statement ወዲያው
+        ይጸድቃል (autocommit)፣ commit()/rollback() ምንም አይቀለብሱም እና cursor ው በ lock አይጠበቅም።
+        አንድ ላይ መጽደቅ ያለባቸው ወይም ከሌሎች ክሮች ጋር የሚጋሩ ስራዎች transaction() ን ይጠቀሙ።
+        """
+        return self.connection.cursor()
+
+    def commit(self):
+        """በ transaction() ውጭ autocommit ስለሆነ የሚያጸድቀው በእጅ የተጀመረ (BEGIN) transaction ብቻ ነው"""
+        with self._lock:
+            if self.connection.in_transaction:
+                self.connection.commit()
+
+    def rollback(self):
+        with self._lock:
+            if self.connection.in_transaction:
+                self.connection.rollback()
+
+    def checkpoint(self, mode: str = "TRUNCATE"):
+        """
+        የ WAL ይዘትን ወደ ዋናው ፋይል ያስገባል (ፋይሉ ከመቀዳቱ ወይም ከመገፋቱ በፊት)
+
+        Args:
+            mode (str): PASSIVE, FULL, RESTART ወይም TRUNCATE
+        """
+        with self._lock:
+            self.connection.execute(f"PRAGMA wal_checkpoint({mode})")
+
+    def close(self):
+        """ግንኙነቱን ይዘጋል"""
+        with self._lock:
+            self.connection.close()
+        with _REGISTRY_LOCK:
+            if _CONNECTIONS.get(_registry_key(self.db_path)) is self:
+                del _CONNECTIONS[_registry_key(self.db_path)]
+
+
+_CONNECTIONS: Dict[str, DatabaseConnection] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _registry_key(db_path: str) -> str:
+    return f"{os.getpid()}:{os.path.abspath(db_path)}"
+
+
+def get_connection(db_path: str, pragmas: Optional[Dict[str, Any]] = None) -> DatabaseConnection:
+    """
+    ለዳታቤዙ የሚጋራውን ግንኙነት ይመልሳል (በ process አንድ ግንኙነት በፋይል)
+
+    Args:
+        db_path (str): የዳታቤዝ ፋይል መንገድ
+        pragmas (Dict, optional): በመጀመሪያ ሲፈጠር የሚተገበሩ pragmas
+
+    Returns:
+        DatabaseConnection: የሚጋራው ግንኙነት
+    """
+    key = _registry_key(db_path)
+    with _REGISTRY_LOCK:
+        connection = _CONNECTIONS.get(key)
+        if connection is None:
+            connection = DatabaseConnection(db_path, pragmas)
+            _CONNECTIONS[key] = connection
+        return connection
+
+
+def run_benchmark(articles: int = 10000, directory: Optional[str] = None) -> Dict:
+    """
+    በአንድ ጽሁፍ አዲስ ግንኙነት እና commit ከ WAL + executemany ጋር ያወዳድራል
+
+    Args:
+        articles (int): የሚመዘገቡ ጽሁፎች ብዛት
+        directory (str, optional): ጊዜያዊ ፎልደር
+
+    Returns:
+        Dict: ለእያንዳንዱ ዘዴ የወሰደው ሰከንድ
+    """
+    import tempfile
+
+    schema = '''
+        CREATE TABLE IF NOT EXISTS articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT, topic TEXT, word_count INTEGER, revenue_estimate REAL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    '''
+    insert = "INSERT INTO articles (title, topic, word_count, revenue_estimate) VALUES (?, ?, ?, ?)"
+    rows = [(f"Article {i}", f"topic {i % 50}", 2000 + i % 500, i * 0.01) for i in range(articles)]
+
+    results = {}
+    with tempfile.TemporaryDirectory(dir=directory) as temp_dir:
+        # 1. የቀድሞው ዘዴ: በአንድ ጽሁፍ አዲስ ግንኙነት እና commit
+        legacy_path = os.path.join(temp_dir, "legacy.db")
+        conn = sqlite3.connect(legacy_path)
+        conn.execute(schema)
+        conn.commit()
+        conn.close()
+
+        started = time.perf_counter()
+        for row in rows:
+            conn = sqlite3.connect(legacy_path)
+            conn.execute(insert, row)
+            conn.commit()
+            conn.close()
+        results['connect_per_article'] = round(time.perf_counter() - started, 3)
+
+        # 2. ረጅም ዕድሜ ያለው WAL ግንኙነት፣ በአንድ ጽሁፍ አንድ transaction
+        db = DatabaseConnection(os.path.join(temp_dir, "wal_single.db"))
+        db.execute(schema)
+        started = time.perf_counter()
+        for row in rows:
+            with db.transaction() as cursor:
+                cursor.execute(insert, row)
+        results['wal_transaction_per_article'] = round(time.perf_counter() - started, 3)
+        db.connection.close()
+
+        # 3. ረጅም ዕድሜ ያለው WAL ግንኙነት፣ executemany በአንድ transaction
+        db = DatabaseConnection(os.path.join(temp_dir, "wal_batch.db"))
+        db.execute(schema)
+        started = time.perf_counter()
+        db.executemany(insert, rows)
+        results['wal_executemany'] = round(time.perf_counter() - started, 3)
+        db.connection.close()
+
+    return results
+
+
+if __name__ == "__main__":
+    for method, seconds in run_benchmark().items():
+        print(f"{method}: {seconds} ሰከንድ (10000 ጽሁፎች)")
@@ -0,0 +1,172 @@
+"""
+የሚሰራ (online) SQLite ዳታቤዝን በ sqlite3 backup API ወጥ በሆነ መልኩ የሚቀዳ አገልግሎት
+ገጽ በገጽ እና በዝግታ መቅዳት፣ gzip፣ የቆዩ ቅጂዎችን ማጥፋት እና ያልተቀየረ ዳታቤዝን መዝለል
+"""
+
+import os
+import gzip
+import json
+import shutil
+import sqlite3
+import hashlib
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+class DatabaseBackup:
+    """የአንድ ዳታቤዝ ቅጂዎችን የሚያስተዳድር"""
+
+    STATE_FILE = "backup_state.json"
+
+    def __init__(self, db_path: str, backup_dir: str, prefix: Optional[str] = None,
+                 pages: int = 256, sleep: float = 0.005, compress: bool = True,
+                 keep: Optional[int] = 7):
+        """
+        የቅጂ አገልግሎቱ አደረጃጀት
+
+        Args:
+            db_path (str): የሚቀዳው ዳታቤዝ
+            backup_dir (str): ቅጂዎቹ የሚቀመጡበት ፎልደር
+            prefix (str, optional): የቅጂ ፋይሎች ስም መጀመሪያ (ነባሪ: የዳታቤዙ ስም)
+            pages (int): በአንድ ደረጃ የሚቀዱ ገጾች (ጸሐፊዎች በመካከል እንዲገቡ)
+            sleep (float): በደረጃዎች መካከል የሚጠበቅ ሰከንድ
+            compress (bool): ቅጂውን በ gzip መጨመቅ
+            keep (int, optional): የሚቀመጡ የቅርብ ጊዜ ቅጂዎች ብዛት (None ከሆነ ሁሉም)
+        """
+        self.db_path = db_path
+        self.backup_dir = backup_dir
+        self.prefix = prefix or os.path.splitext(os.path.basename(db_path))[0]
+        self.pages = pages
+        self.sleep = sleep
+        self.compress = compress
+        self.keep = keep
+        self.state_path = os.path.join(backup_dir, f"{self.prefix}_{self.STATE_FILE}")
+        self.logger = logging.getLogger("DatabaseBackup")
+
+        os.makedirs(backup_dir, exist_ok=True)
+
+    def _load_state(self) -> Dict:
+        if os.path.exists(self.state_path):
+            try:
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, json.JSONDecodeError):
+                pass
+        return {'backups': []}
+
+    def _save_state(self, state: Dict):
+        temp_path = self.state_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        os.replace(temp_path, self.state_path)
+
+    @staticmethod
+    def _file_hash(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _copy_online(self, target_path: str):
+        """በ backup API ገጽ በገጽ ይቀዳል"""
+        source = sqlite3.connect(self.db_path, isolation_level=None)
+        target = sqlite3.connect(target_path)
+        try:
+            # በ WAL ውስጥ የንባብ transaction አንድ ቋሚ snapshot ይይዛል፤ ያለዚህ ሌላ ግንኙነት
+            # በጻፈ ቁጥር backup እንደገና ይጀምራል እና ቀጣይ ጽሁፎች ባሉበት ላያልቅ ይችላል
+            source.execute("BEGIN")
+            source.execute("SELECT count(*) FROM sqlite_master").fetchone()
+            source.backup(target, pages=self.pages, sleep=self.sleep)
+            source.execute("COMMIT")
+            # ቅጂው ለብቻው እንዲቆም (ያለ -wal ፋይል)
+            target.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            target.close()
+            source.close()
+
+    def backup(self, force: bool = False) -> Dict:
+        """
+        ቅጂ ይሰራል፣ ዳታቤዙ ከመጨረሻው ቅጂ ጀምሮ ካልተቀየረ ይዘላል
+
+        Args:
+            force (bool): ባይቀየርም ቅጂ መስራት
+
+        Returns:
+            Dict: success፣ skipped፣ path፣ hash እና size
+        """
+        if not os.path.exists(self.db_path):
+            return {'success': False, 'skipped': False, 'error': f"ዳታቤዝ አልተገኘም: {self.db_path}"}
+
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        temp_path = os.path.join(self.backup_dir, f".{self.prefix}_{timestamp}.db.tmp")
+
+        try:
+            self._copy_online(temp_path)
+            content_hash = self._file_hash(temp_path)
+
+            state = self._load_state()
+            if not force and state.get('last_hash') == content_hash:
+                os.remove(temp_path)
+                self.logger.info(f"ዳታቤዙ አልተቀየረም ({content_hash[:12]}), ቅጂ አልተሰራም")
+                return {'success': True, 'skipped': True, 'hash': content_hash,
+                        'path': state['backups'][-1]['path'] if state.get('backups') else None}
+
+            # በአንድ ሰከንድ ውስጥ ሁለት ቅጂዎች ቢሰሩ እንዳይደራረቡ
+            if any(entry['path'].startswith(os.path.join(self.backup_dir, f"{self.prefix}_{timestamp}."))
+                   for entry in state.get('backups', [])):
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+
+            if self.compress:
+                final_path = os.path.join(self.backup_dir, f"{self.prefix}_{timestamp}.db.gz")
+                with open(temp_path, 'rb') as source, gzip.open(final_path, 'wb', compresslevel=6) as target:
+                    shutil.copyfileobj(source, target, 1024 * 1024)
+                os.remove(temp_path)
+            else:
+                final_path = os.path.join(self.backup_dir, f"{self.prefix}_{timestamp}.db")
+                os.replace(temp_path, final_path)
+
+            state['last_hash'] = content_hash
+            state.setdefault('backups', []).append({
+                'path': final_path,
+                'hash': content_hash,
+                'created_at': datetime.now().isoformat(),
+                'size': os.path.getsize(final_path)
+            })
+            state['backups'] = self._prune(state['backups'])
+            self._save_state(state)
+
+            self.logger.info(f"✅ የዳታቤዝ ቅጂ ተሰርቷል: {final_path}")
+            return {'success': True, 'skipped': False, 'path': final_path,
+                    'hash': content_hash, 'size': os.path.getsize(final_path)}
+
+        except Exception as e:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            self.logger.error(f"የዳታቤዝ ቅጂ አልተሳካም: {e}")
+            return {'success': False, 'skipped': False, 'error': str(e)}
+
+    def _prune(self, backups: List[Dict]) -> List[Dict]:
+        """ከ keep በላይ የሆኑ የቆዩ ቅጂዎችን ያጠፋል"""
+        if not self.keep or len(backups) <= self.keep:
+            return backups
+
+        for entry in backups[:-self.keep]:
+            try:
+                os.remove(entry['path'])
+            except FileNotFoundError:
+                pass
+        return backups[-self.keep:]
+
+    def restore(self, backup_path: str, target_path: str):
+        """
+        ቅጂን ወደ አዲስ የዳታቤዝ ፋይል ይመልሳል
+
+        Args:
+            backup_path (str): የቅጂው ፋይል (.db ወይም .db.gz)
+            target_path (str): የሚፈጠረው የዳታቤዝ ፋይል
+        """
+        opener = gzip.open if backup_path.endswith(".gz") else open
+        with opener(backup_path, 'rb') as source, open(target_path, 'wb') as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
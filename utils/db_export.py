@@ -0,0 +1,191 @@
+"""
+የ SQLite ሰንጠረዦችን ወደ JSONL (ወይም .jsonl.gz) በዥረት የሚልክ አገልግሎት
+ረድፎች በ fetchmany ይነበባሉ፣ ማህደረ ትውስታው በሰንጠረዡ መጠን አይወሰንም
+"""
+
+import os
+import gzip
+import json
+import sqlite3
+import logging
+import argparse
+from datetime import datetime
+from typing import Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger("DatabaseExporter")
+
+
+def _open_output(path: str, compress: Optional[bool]):
+    """የውጤት ፋይሉን ይከፍታል (.gz ከሆነ ወይም compress=True ከሆነ gzip)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    if compress is None:
+        compress = path.endswith(".gz")
+    if compress:
+        return gzip.open(path, 'wt', encoding='utf-8', compresslevel=6)
+    return open(path, 'w', encoding='utf-8')
+
+
+def iter_rows(connection: sqlite3.Connection, sql: str, params: Tuple = (),
+              batch_size: int = 500) -> Iterator[Dict]:
+    """
+    የጥያቄውን ረድፎች በ fetchmany አንድ በአንድ ይመልሳል
+
+    Args:
+        connection (sqlite3.Connection): row_factory=sqlite3.Row ያለው ግንኙነት
+        sql (str): SELECT ጥያቄ
+        params (Tuple): ግብዓቶች
+        batch_size (int): በአንድ ጊዜ የሚነበቡ ረድፎች
+
+    Returns:
+        Iterator[Dict]: ረድፎች
+    """
+    cursor = connection.execute(sql, params)
+    try:
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(row)
+    finally:
+        cursor.close()
+
+
+class StreamingExporter:
+    """የአንድ ዳታቤዝ ሰንጠረዦችን ወደ JSONL የሚልክ"""
+
+    def __init__(self, db_path: str, batch_size: int = 500):
+        """
+        የላኪው አደረጃጀት
+
+        Args:
+            db_path (str): የዳታቤዝ ፋይል መንገድ
+            batch_size (int): ለ fetchmany የሚነበቡ ረድፎች ብዛት
+        """
+        self.db_path = db_path
+        self.batch_size = batch_size
+
+    def _connect(self) -> sqlite3.Connection:
+        """ለማንበብ ብቻ የተለየ ግንኙነት (WAL ውስጥ ጸሐፊዎችን አያግድም)"""
+        connection = sqlite3.connect(f"file:{os.path.abspath(self.db_path)}?mode=ro", uri=True)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    @staticmethod
+    def _load_state(state_path: Optional[str]) -> Dict:
+        if state_path and os.path.exists(state_path):
+            with open(state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {}
+
+    @staticmethod
+    def _save_state(state_path: str, state: Dict):
+        temp_path = state_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        os.replace(temp_path, state_path)
+
+    def export_table(self, table: str, output_path: str, since: Optional[str] = None,
+                     state_path: Optional[str] = None, compress: Optional[bool] = None) -> Dict:
+        """
+        ሰንጠረዥን በ created_at ቅደም ተከተል ወደ JSONL ይልካል
+
+        Args:
+            table (str): የሰንጠረዡ ስም
+            output_path (str): የውጤት ፋይል (.jsonl ወይም .jsonl.gz)
+            since (str, optional): ከዚህ ጊዜ ጀምሮ የተፈጠሩ ብቻ (created_at >= since)
+            state_path (str, optional): ያለፈው ላክ የቆመበት (created_at, id) የሚቀመጥበት ፋይል
+            compress (bool, optional): gzip (None ከሆነ ከቅጥያው ይወሰናል)
+
+        Returns:
+            Dict: rows፣ path፣ last_created_at እና last_id
+        """
+        if not table.replace('_', '').isalnum():
+            raise ValueError(f"ትክክለኛ ያልሆነ የሰንጠረዥ ስም: {table}")
+
+        state = self._load_state(state_path).get(table, {})
+        conditions = []
+        params = []
+
+        if since:
+            conditions.append("created_at >= ?")
+            params.append(since)
+
+        # ተመሳሳይ created_at ያላቸው ረድፎች እንዳይዘለሉ (created_at, id) ይጠቀማል
+        if state.get('last_created_at') is not None:
+            conditions.append("(created_at > ? OR (created_at = ? AND id > ?))")
+            params.extend([state['last_created_at'], state['last_created_at'], state['last_id']])
+
+        sql = f"SELECT * FROM {table}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY created_at, id"
+
+        exported = 0
+        last_created_at = state.get('last_created_at')
+        last_id = state.get('last_id')
+
+        connection = self._connect()
+        try:
+            with _open_output(output_path, compress) as output:
+                for row in iter_rows(connection, sql, tuple(params), self.batch_size):
+                    output.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+                    exported += 1
+                    last_created_at = row.get('created_at')
+                    last_id = row.get('id')
+        finally:
+            connection.close()
+
+        if state_path:
+            full_state = self._load_state(state_path)
+            full_state[table] = {
+                'last_created_at': last_created_at,
+                'last_id': last_id,
+                'exported_at': datetime.now().isoformat()
+            }
+            self._save_state(state_path, full_state)
+
+        logger.info(f"✅ {exported} ረድፎች ከ {table} ተልከዋል: {output_path}")
+
+        return {
+            'table': table,
+            'rows': exported,
+            'path': output_path,
+            'last_created_at': last_created_at,
+            'last_id': last_id
+        }
+
+
+def export_table_jsonl(db_path: str, table: str, output_path: str, since: Optional[str] = None,
+                       state_path: Optional[str] = None, compress: Optional[bool] = None) -> Dict:
+    """
+    ሰንጠረዥን ወደ JSONL ለመላክ ቀላል ተግባር
+
+    Args:
+        db_path (str): የዳታቤዝ ፋይል መንገድ
+        table (str): የሰንጠረዡ ስም
+        output_path (str): የውጤት ፋይል
+        since (str, optional): ከዚህ ጊዜ ጀምሮ
+        state_path (str, optional): ለተከታታይ ላክ የሁኔታ ፋይል
+        compress (bool, optional): gzip
+
+    Returns:
+        Dict: የላኩ ውጤት
+    """
+    return StreamingExporter(db_path).export_table(table, output_path, since, state_path, compress)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SQLite ሰንጠረዥን ወደ JSONL በዥረት መላክ")
+    parser.add_argument("db_path", help="የዳታቤዝ ፋይል")
+    parser.add_argument("table", help="የሰንጠረዡ ስም (ለምሳሌ articles ወይም articles_v11)")
+    parser.add_argument("--output", help="የውጤት ፋይል (.jsonl ወይም .jsonl.gz)")
+    parser.add_argument("--since", help="ከዚህ created_at ጀምሮ (ለምሳሌ 2024-01-01)")
+    parser.add_argument("--state", help="ለተከታታይ ላክ የሁኔታ ፋይል")
+    args = parser.parse_args()
+
+    output = args.output or f"{args.table}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl.gz"
+    result = export_table_jsonl(args.db_path, args.table, output, args.since, args.state)
+    print(f"✅ {result['rows']} ረድፎች -> {result['path']}")
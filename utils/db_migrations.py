@@ -0,0 +1,122 @@
+"""
+የ SQLite ሥሪት ያላቸው የስኪማ ማሻሻያዎች (migrations) በ PRAGMA user_version
+እና ተደጋጋሚ ጥያቄዎች ኢንዴክስ መጠቀማቸውን በ EXPLAIN QUERY PLAN ማረጋገጫ
+"""
+
+import logging
+from typing import Dict, List, Sequence, Tuple
+
+from .db_access import DatabaseConnection
+
+logger = logging.getLogger("DatabaseMigrations")
+
+
+class Migration:
+    """አንድ የስኪማ ማሻሻያ ደረጃ"""
+
+    def __init__(self, version: int, description: str, statements: Sequence[str]):
+        """
+        የማሻሻያው አደረጃጀት
+
+        Args:
+            version (int): የስኪማ ሥሪት (ከ 1 ጀምሮ የሚጨምር)
+            description (str): አጭር መግለጫ
+            statements (Sequence[str]): የሚፈጸሙ SQL statements
+        """
+        self.version = version
+        self.description = description
+        self.statements = list(statements)
+
+
+def get_schema_version(db: DatabaseConnection) -> int:
+    """የዳታቤዙን የስኪማ ሥሪት ይመልሳል"""
+    return db.scalar("PRAGMA user_version", default=0)
+
+
+def apply_migrations(db: DatabaseConnection, migrations: List[Migration]) -> int:
+    """
+    ገና ያልተፈጸሙ ማሻሻያዎችን በቅደም ተከተል ይፈጽማል
+
+    Args:
+        db (DatabaseConnection): የዳታቤዝ ግንኙነት
+        migrations (List[Migration]): ሁሉም ማሻሻያዎች
+
+    Returns:
+        int: አሁን ያለው የስኪማ ሥሪት
+    """
+    versions = [migration.version for migration in migrations]
+    if len(set(versions)) != len(versions):
+        raise ValueError(f"ተደጋጋሚ የማሻሻያ ሥሪቶች: {versions}")
+
+    current = get_schema_version(db)
+
+    for migration in sorted(migrations, key=lambda m: m.version):
+        if migration.version <= current:
+            continue
+
+        # እያንዳንዱ ማሻሻያ እና የሥሪት ቁጥሩ በአንድ transaction ውስጥ
+        with db.transaction() as cursor:
+            for statement in migration.statements:
+                cursor.execute(statement)
+            cursor.execute(f"PRAGMA user_version = {int(migration.version)}")
+
+        current = migration.version
+        logger.info(f"✅ የስኪማ ማሻሻያ {migration.version} ተፈጽሟል: {migration.description}")
+
+    return current
+
+
+def explain_query_plan(db: DatabaseConnection, sql: str, params: Sequence = ()) -> List[str]:
+    """
+    የጥያቄውን EXPLAIN QUERY PLAN ዝርዝር ይመልሳል
+
+    Args:
+        db (DatabaseConnection): የዳታቤዝ ግንኙነት
+        sql (str): የሚፈተሸው ጥያቄ
+        params (Sequence): የጥያቄው ግብዓቶች
+
+    Returns:
+        List[str]: የዕቅዱ መስመሮች (detail)
+    """
+    return [row['detail'] for row in db.query(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def uses_index(plan: List[str]) -> bool:
+    """
+    ዕቅዱ ሙሉ ሰንጠረዥ ሳይቃኝ እና ጊዜያዊ ቅደም ተከተል ሳይፈጥር ኢንዴክስ መጠቀሙን ያረጋግጣል
+
+    Args:
+        plan (List[str]): የ explain_query_plan ውጤት
+
+    Returns:
+        bool: ኢንዴክስ የሚጠቀም ከሆነ True
+    """
+    for detail in plan:
+        if detail.startswith("SCAN ") and " USING " not in detail:
+            return False
+        if "USE TEMP B-TREE" in detail:
+            return False
+    return any(" USING " in detail for detail in plan)
+
+
+def check_query_plans(db: DatabaseConnection,
+                      queries: Dict[str, Tuple[str, Sequence]]) -> Dict[str, Dict]:
+    """
+    ለተደጋጋሚ ጥያቄዎች ኢንዴክስ መጠቀማቸውን ያረጋግጣል
+
+    Args:
+        db (DatabaseConnection): የዳታቤዝ ግንኙነት
+        queries (Dict): ስም -> (sql, params)
+
+    Returns:
+        Dict: ስም -> {'uses_index': bool, 'plan': List[str]}
+    """
+    report = {}
+    for name, (sql, params) in queries.items():
+        plan = explain_query_plan(db, sql, params)
+        report[name] = {'uses_index': uses_index(plan), 'plan': plan}
+
+        if not report[name]['uses_index']:
+            logger.warning(f"⚠️ ጥያቄ {name} ኢንዴክስ አይጠቀምም: {plan}")
+
+    return report
@@ -5,6 +5,7 @@
 import os
 import json
 import shutil
+import hashlib
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Union
 import logging
@@ -12,6 +13,9 @@ import logging
 class FileManager:
     """የተለያዩ ፋይሎችን ለማስተዳደር የሚረዳ አገልግሎት"""
     
+    # የእያንዳንዱ አጠቃቀም ጊዜ የፋይሎች ዝርዝር (መጠን, mtime, sha256)
+    MANIFEST_FILE = "manifest.json"
+    
     def __init__(self, version: str = "v9"):
         """
         የፋይል ማኔጅር አደረጃጀት
@@ -253,31 +257,166 @@ class FileManager:
         
         return base_name
     
-    def backup_files(self, backup_name: str = None):
+    def backup_files(self, backup_name: str = None, incremental: bool = True, keep: Optional[int] = 10):
         """
         ፋይሎችን የአጠቃቀም ጊዜ ይጠብቃል
         
+        ያልተቀየሩ ፋይሎች ከቀድሞው ቅጂ ጋር በ hard link ይያያዛሉ፣ አዲስ ወይም የተቀየሩ ብቻ ይቀዳሉ
+        
         Args:
             backup_name (str): የአጠቃቀም ጊዜ ስም
+            incremental (bool): False ከሆነ ሙሉ ቅጂ (copytree) ይሰራል
+            keep (int, optional): የሚቀመጡ የቅርብ ጊዜ ቅጂዎች ብዛት (None ከሆነ ሁሉም)
         """
         try:
             if not backup_name:
                 backup_name = f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             
             source_dir = os.path.join(self.base_dir, self.version.upper())
-            backup_dir = os.path.join(self.base_dir, "backup", backup_name)
+            backup_root = os.path.join(self.base_dir, "backup")
+            backup_dir = os.path.join(backup_root, backup_name)
+            
+            if not os.path.exists(source_dir):
+                self.logger.warning("ለአጠቃቀም ጊዜ ምንም ፋይሎች አልተገኙም")
+                return None
             
-            if os.path.exists(source_dir):
+            # ተመሳሳይ ስም ያለው ቅጂ ካለ (ለምሳሌ ከቀድሞ ቡድን) አይደረብም
+            if os.path.exists(backup_dir):
+                backup_dir = f"{backup_dir}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+            
+            if not incremental:
                 shutil.copytree(source_dir, backup_dir)
                 self.logger.info(f"አጠቃቀም ጊዜ ተሰርቷል: {backup_dir}")
                 return backup_dir
-            else:
-                self.logger.warning("ለአጠቃቀም ጊዜ ምንም ፋይሎች አልተገኙም")
-                return None
+            
+            snapshots = self._load_snapshot_index(backup_root)
+            previous_dir = None
+            previous_manifest = {}
+            
+            if snapshots:
+                previous_dir = os.path.join(backup_root, snapshots[-1])
+                previous_manifest = self._read_manifest(previous_dir)
+            
+            manifest = {}
+            copied = 0
+            linked = 0
+            
+            for directory, _, files in os.walk(source_dir):
+                for name in files:
+                    source_path = os.path.join(directory, name)
+                    relative_path = os.path.relpath(source_path, source_dir)
+                    target_path = os.path.join(backup_dir, relative_path)
+                    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                    
+                    stat = os.stat(source_path)
+                    previous = previous_manifest.get(relative_path)
+                    
+                    if (previous and previous['size'] == stat.st_size
+                            and previous['mtime_ns'] == stat.st_mtime_ns
+                            and self._link_or_copy(os.path.join(previous_dir, relative_path), target_path)):
+                        file_hash = previous['sha256']
+                        linked += 1
+                    else:
+                        file_hash = self._file_hash(source_path)
+                        shutil.copy2(source_path, target_path)
+                        copied += 1
+                    
+                    manifest[relative_path] = {
+                        'size': stat.st_size,
+                        'mtime_ns': stat.st_mtime_ns,
+                        'sha256': file_hash
+                    }
+            
+            os.makedirs(backup_dir, exist_ok=True)
+            with open(os.path.join(backup_dir, self.MANIFEST_FILE), 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': self.version,
+                    'created_at': datetime.now().isoformat(),
+                    'previous': os.path.basename(previous_dir) if previous_dir else None,
+                    'files': manifest
+                }, f, indent=2, ensure_ascii=False)
+            
+            snapshots.append(os.path.basename(backup_dir))
+            snapshots = self._prune_snapshots(backup_root, snapshots, keep)
+            self._save_snapshot_index(backup_root, snapshots)
+            
+            self.logger.info(f"አጠቃቀም ጊዜ ተሰርቷል: {backup_dir} ({copied} ተቀድተዋል, {linked} ተያይዘዋል)")
+            return backup_dir
                 
         except Exception as e:
             self.logger.error(f"አጠቃቀም ጊዜ ማድረግ አልተቻለም: {e}")
             return None
+    
+    def _snapshot_index_path(self, backup_root: str) -> str:
+        """የስሪቱ የቅጂዎች ዝርዝር ፋይል መንገድ"""
+        return os.path.join(backup_root, f"snapshots_{self.version.upper()}.json")
+    
+    def _load_snapshot_index(self, backup_root: str) -> List[str]:
+        """ያሉትን ቅጂዎች (ከአሮጌ ወደ አዲስ) ይጭናል"""
+        index_path = self._snapshot_index_path(backup_root)
+        if not os.path.exists(index_path):
+            return []
+        
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                snapshots = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"የቅጂዎች ዝርዝር ማንበብ አልተቻለም: {e}")
+            return []
+        
+        # በእጅ የተሰረዙ ቅጂዎችን ማስወገድ
+        return [name for name in snapshots if os.path.isdir(os.path.join(backup_root, name))]
+    
+    def _save_snapshot_index(self, backup_root: str, snapshots: List[str]):
+        """የቅጂዎችን ዝርዝር ያስቀምጣል"""
+        with open(self._snapshot_index_path(backup_root), 'w', encoding='utf-8') as f:
+            json.dump(snapshots, f, indent=2, ensure_ascii=False)
+    
+    def _read_manifest(self, snapshot_dir: str) -> Dict:
+        """የቅጂውን የፋይሎች ዝርዝር ያነባል"""
+        manifest_path = os.path.join(snapshot_dir, self.MANIFEST_FILE)
+        if not os.path.exists(manifest_path):
+            return {}
+        
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('files', {})
+        except (OSError, json.JSONDecodeError):
+            return {}
+    
+    def _prune_snapshots(self, backup_root: str, snapshots: List[str], keep: Optional[int]) -> List[str]:
+        """ከ keep በላይ የሆኑ አሮጌ ቅጂዎችን ያጠፋል"""
+        if not keep or len(snapshots) <= keep:
+            return snapshots
+        
+        for name in snapshots[:-keep]:
+            # hard link ስለሆኑ በአዲሶቹ ቅጂዎች ውስጥ ያሉ ፋይሎች አይጠፉም
+            shutil.rmtree(os.path.join(backup_root, name), ignore_errors=True)
+            self.logger.info(f"አሮጌ አጠቃቀም ጊዜ ተሰርዟል: {name}")
+        
+        return snapshots[-keep:]
+    
+    @staticmethod
+    def _link_or_copy(source_path: str, target_path: str) -> bool:
+        """ፋይሉን በ hard link ያያይዛል (ካልተቻለ ይቀዳል)"""
+        if not os.path.exists(source_path):
+            return False
+        
+        try:
+            os.link(source_path, target_path)
+        except OSError:
+            shutil.copy2(source_path, target_path)
+        
+        return True
+    
+    @staticmethod
+    def _file_hash(filepath: str) -> str:
+        """የፋይሉን SHA-256 ሃሽ ያሰላል"""
+        digest = hashlib.sha256()
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
 
 # ለቀላል መጠቀም የሚረዳ አገልግሎት ተግባር
 def get_file_manager(version: str = "v9") -> FileManager:
@@ -0,0 +1,181 @@
+"""
+ከመታተም እና ከመላክ በፊት የጽሁፍ HTML ን የሚያሳንስ አገልግሎት
+ከ <pre>/<textarea>/<script>/<style> ውጭ ክፍተቶችን ያሳጥራል፣ አስተያየቶችን ያጠፋል (metadata ን ሳይጨምር)፣ attributes ን በ "..." ያስተካክላል
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Pattern
+
+# ክፍተታቸው ትርጉም ያለው ክፍሎች (ሳይነኩ ይቀራሉ)
+RAW_TAGS = ('pre', 'textarea', 'script', 'style')
+
+# በዙሪያቸው ያለ ክፍተት በገጹ ላይ የማይታይ block መለያዎች
+BLOCK_TAGS = frozenset({
+    'address', 'article', 'aside', 'blockquote', 'body', 'br', 'caption', 'col', 'colgroup',
+    'dd', 'details', 'div', 'dl', 'dt', 'fieldset', 'figcaption', 'figure', 'footer', 'form',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'head', 'header', 'hr', 'html', 'li', 'link', 'main',
+    'meta', 'nav', 'ol', 'p', 'pre', 'section', 'summary', 'table', 'tbody', 'td', 'tfoot', 'th',
+    'thead', 'title', 'tr', 'ul'
+})
+
+# የሚቀሩ አስተያየቶች: የጽሁፍ metadata፣ የ WordPress block መለያዎች እና conditional comments
+KEEP_COMMENTS = re.compile(r'\s*(?:(?:Article ID|Generated|Title):|/?wp:|\[if\b)')
+
+TOKEN = re.compile(
+    r'<!--.*?-->'
+    r'|<(' + '|'.join(RAW_TAGS) + r')\b[^>]*>.*?</\1\s*>'
+    r'|<[A-Za-z/!?][^>]*>'
+    r'|[^<]+|<',
+    re.IGNORECASE | re.DOTALL
+)
+TAG = re.compile(r'<(/?)([A-Za-z][\w:-]*)(.*?)(/?)>', re.DOTALL)
+ATTRIBUTE = re.compile(
+    r'[ \t\r\n\f]*([^\s"\'<>/=]+)'
+    r'(?:[ \t\r\n\f]*=[ \t\r\n\f]*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'=<>`]+)))?'
+)
+ATTRIBUTES = re.compile(r'(?:' + ATTRIBUTE.pattern + r')*[ \t\r\n\f]*')
+# \s አይጠቀምም: &nbsp; (\xa0) እንደ ክፍተት መቆጠር የለበትም
+WHITESPACE = re.compile(r'[ \t\r\n\f]+')
+
+
+def _collapse(match) -> str:
+    # ባዶ መስመር የአንቀጽ መለያ ሊሆን ይችላል (ለምሳሌ ለ WordPress wpautop)
+    return '\n\n' if match.group(0).count('\n') > 1 else ' '
+
+
+@lru_cache(maxsize=4096)
+def _normalize_tag(tag: str) -> str:
+    """የመለያውን ክፍተቶች ያሳጥራል እና የ attribute ዋጋዎችን በ "..." ያስቀምጣል"""
+    match = TAG.fullmatch(tag)
+    if not match:
+        return tag
+
+    closing, name, attributes, self_closing = match.groups()
+    if closing:
+        return f"</{name}>" if not attributes.strip() else tag
+    if not ATTRIBUTES.fullmatch(attributes):
+        # ያልተለመደ አጻጻፍ - ሳይነካ ይቀራል
+        return tag
+
+    parts = [name]
+    for attribute in ATTRIBUTE.finditer(attributes):
+        attr_name, double, single, bare = attribute.groups()
+        if double is not None:
+            value = double
+        elif single is not None:
+            value = single.replace('"', '&quot;')
+        elif bare is not None:
+            value = bare
+        else:
+            parts.append(attr_name)
+            continue
+        parts.append(f'{attr_name}="{value}"')
+
+    return f"<{' '.join(parts)}{'/' if self_closing else ''}>"
+
+
+def _tag_name(token: str) -> str:
+    match = TAG.match(token)
+    return match.group(2).lower() if match else ''
+
+
+class HtmlMinifier:
+    """የጽሁፍ HTML ን በአንድ ዙር የሚያሳንስ"""
+
+    def __init__(self, keep_comments: Optional[Pattern] = None, normalize_attributes: bool = True):
+        """
+        የማሳነሻው አደረጃጀት
+
+        Args:
+            keep_comments (Pattern, optional): የሚቀሩ አስተያየቶች (ነባሪ: metadata፣ wp: እና conditional)
+            normalize_attributes (bool): የመለያ ክፍተቶችን እና የ attribute ጥቅሶችን ማስተካከል
+        """
+        self.keep_comments = keep_comments or KEEP_COMMENTS
+        self.normalize_attributes = normalize_attributes
+
+    def _is_block(self, token: Optional[str]) -> bool:
+        # የጽሁፉ መጀመሪያ/መጨረሻ እንደ block ይቆጠራል
+        return token is None or _tag_name(token) in BLOCK_TAGS
+
+    def _flush(self, text: str, previous: Optional[str], following: Optional[str]) -> str:
+        text = WHITESPACE.sub(_collapse, text)
+        if text[:1] in (' ', '\n') and self._is_block(previous):
+            text = text.lstrip(' \n')
+        if text[-1:] in (' ', '\n') and self._is_block(following):
+            text = text.rstrip(' \n')
+        return text
+
+    def minify(self, html: str) -> str:
+        """
+        HTML ን ያሳንሳል
+
+        Args:
+            html (str): የጽሁፉ HTML
+
+        Returns:
+            str: የተሳነሰው HTML
+        """
+        if not html:
+            return html
+
+        output = []
+        pending = []
+        previous = None
+
+        for match in TOKEN.finditer(html):
+            token = match.group(0)
+
+            if token.startswith('<!--'):
+                if not self.keep_comments.match(token[4:-3]):
+                    # የሚጠፋ አስተያየት በዙሪያው ያለውን ጽሁፍ አይለያይም
+                    continue
+            elif token[0] != '<' or len(token) == 1:
+                pending.append(token)
+                continue
+            elif match.group(1) is None and self.normalize_attributes:
+                token = _normalize_tag(token)
+
+            if pending:
+                output.append(self._flush(''.join(pending), previous, token))
+                pending = []
+            output.append(token)
+            previous = token
+
+        if pending:
+            output.append(self._flush(''.join(pending), previous, None))
+
+        return ''.join(output)
+
+    def minify_report(self, html: str) -> Dict:
+        """
+        HTML ን ያሳንሳል እና የመጠን ቅነሳውን ይመልሳል
+
+        Args:
+            html (str): የጽሁፉ HTML
+
+        Returns:
+            Dict: html፣ original_bytes፣ minified_bytes፣ saved_bytes እና saved_percent
+        """
+        minified = self.minify(html)
+        original_bytes = len(html.encode('utf-8')) if html else 0
+        minified_bytes = len(minified.encode('utf-8')) if minified else 0
+        saved_bytes = original_bytes - minified_bytes
+
+        return {
+            'html': minified,
+            'original_bytes': original_bytes,
+            'minified_bytes': minified_bytes,
+            'saved_bytes': saved_bytes,
+            'saved_percent': round(saved_bytes / original_bytes * 100, 1) if original_bytes else 0.0
+        }
+
+
+def get_html_minifier() -> HtmlMinifier:
+    """
+    የ HTML ማሳነሻ አገልግሎት ይመልሳል
+
+    Returns:
+        HtmlMinifier: የማሳነሻ አገልግሎት
+    """
+    return HtmlMinifier()
@@ -0,0 +1,226 @@
+"""
+በይዘት ሃሽ የሚቀመጥ (content-addressed) የተጨመቀ የውጤት ማከማቻ
+ተመሳሳይ ይዘት አንድ ጊዜ ብቻ ይቀመጣል፣ ትንሽ ኢንዴክስ (topic, version, timestamp) -> hash ይይዛል
+"""
+
+import os
+import gzip
+import json
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Union
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+class OutputStore:
+    """ውጤቶችን በ SHA-256 ሃሽ የሚያስቀምጥ እና ተደጋጋሚዎችን የሚያስወግድ ማከማቻ"""
+
+    INDEX_FILE = "index.jsonl"
+    OBJECTS_DIR = "objects"
+
+    def __init__(self, root_dir: str, compression: str = "auto"):
+        """
+        የማከማቻ አደረጃጀት
+
+        Args:
+            root_dir (str): የማከማቻው ፎልደር
+            compression (str): "zstd", "gzip" ወይም "auto" (zstandard ካለ zstd)
+        """
+        self.root_dir = root_dir
+        self.objects_dir = os.path.join(root_dir, self.OBJECTS_DIR)
+        self.index_path = os.path.join(root_dir, self.INDEX_FILE)
+        self.compression = self._resolve_compression(compression)
+        self.logger = logging.getLogger("OutputStore")
+        self._lock = threading.Lock()
+
+        os.makedirs(self.objects_dir, exist_ok=True)
+
+    def _resolve_compression(self, compression: str) -> str:
+        """የሚጠቀመውን የመጨመቂያ ዘዴ ይወስናል"""
+        if compression in ("auto", "zstd"):
+            return "zstd" if ZSTD_AVAILABLE else "gzip"
+        return "gzip"
+
+    def _extension(self, compression: str) -> str:
+        return ".zst" if compression == "zstd" else ".gz"
+
+    def _blob_path(self, content_hash: str, compression: str) -> str:
+        """ለሃሹ የፋይል መንገድ ይመልሳል (objects/ab/abcdef...gz)"""
+        return os.path.join(self.objects_dir, content_hash[:2], content_hash + self._extension(compression))
+
+    def _find_blob(self, content_hash: str) -> Optional[str]:
+        """በማንኛውም የመጨመቂያ ዘዴ የተቀመጠ ብሎብ ይፈልጋል"""
+        for compression in ("zstd", "gzip"):
+            path = self._blob_path(content_hash, compression)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor(level=10).compress(data)
+        return gzip.compress(data, compresslevel=9, mtime=0)
+
+    def _decompress(self, path: str, raw: bytes) -> bytes:
+        if path.endswith(".zst"):
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError("zstd ብሎብ ለማንበብ zstandard ያስፈልጋል: pip install zstandard")
+            return zstandard.ZstdDecompressor().decompress(raw)
+        return gzip.decompress(raw)
+
+    def put(self, data: Union[str, bytes], topic: str, version: str,
+            name: Optional[str] = None) -> Dict:
+        """
+        ይዘትን ያስቀምጣል (ቀድሞ ካለ እንደገና አይጻፍም)
+
+        Args:
+            data (str | bytes): የሚቀመጠው ይዘት
+            topic (str): ርዕሰ ጉዳይ
+            version (str): ስሪት
+            name (str, optional): ለኢንዴክስ የሚመዘገብ ስም
+
+        Returns:
+            Dict: hash፣ path፣ size፣ stored_size፣ deduplicated እና timestamp
+        """
+        raw = data.encode('utf-8') if isinstance(data, str) else data
+        content_hash = hashlib.sha256(raw).hexdigest()
+        timestamp = datetime.now().isoformat()
+
+        with self._lock:
+            path = self._find_blob(content_hash)
+            deduplicated = path is not None
+
+            if not deduplicated:
+                path = self._blob_path(content_hash, self.compression)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+
+                # ግማሽ የተጻፈ ብሎብ እንዳይቀር በጊዜያዊ ፋይል በኩል መጻፍ
+                temp_path = f"{path}.tmp{os.getpid()}"
+                with open(temp_path, 'wb') as f:
+                    f.write(self._compress(raw))
+                os.replace(temp_path, path)
+
+            entry = {
+                'topic': topic,
+                'version': version,
+                'timestamp': timestamp,
+                'hash': content_hash,
+                'name': name or topic,
+                'size': len(raw)
+            }
+
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+        if deduplicated:
+            self.logger.debug(f"ተደጋጋሚ ይዘት አልተጻፈም: {content_hash[:12]}")
+
+        return {
+            'hash': content_hash,
+            'path': path,
+            'size': len(raw),
+            'stored_size': os.path.getsize(path),
+            'deduplicated': deduplicated,
+            'timestamp': timestamp
+        }
+
+    def get(self, content_hash: str) -> bytes:
+        """
+        በሃሽ የተቀመጠ ይዘት ያነባል
+
+        Args:
+            content_hash (str): የይዘቱ SHA-256 ሃሽ
+
+        Returns:
+            bytes: ያልተጨመቀው ይዘት
+        """
+        path = self._find_blob(content_hash)
+        if path is None:
+            raise FileNotFoundError(f"ብሎብ አልተገኘም: {content_hash}")
+
+        with open(path, 'rb') as f:
+            return self._decompress(path, f.read())
+
+    def get_text(self, content_hash: str) -> str:
+        """በሃሽ የተቀመጠ ይዘት እንደ ጽሁፍ ያነባል"""
+        return self.get(content_hash).decode('utf-8')
+
+    def iter_index(self):
+        """የኢንዴክሱን መዝገቦች አንድ በአንድ ይመልሳል"""
+        if not os.path.exists(self.index_path):
+            return
+
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+    def find(self, topic: str, version: Optional[str] = None) -> List[Dict]:
+        """
+        ለርዕሰ ጉዳይ የተቀመጡ መዝገቦችን ይፈልጋል
+
+        Args:
+            topic (str): ርዕሰ ጉዳይ
+            version (str, optional): ስሪት
+
+        Returns:
+            List[Dict]: የኢንዴክስ መዝገቦች በጊዜ ቅደም ተከተል
+        """
+        return [
+            entry for entry in self.iter_index()
+            if entry['topic'] == topic and (version is None or entry['version'] == version)
+        ]
+
+    def latest(self, topic: str, version: Optional[str] = None) -> Optional[str]:
+        """ለርዕሰ ጉዳዩ የመጨረሻውን ይዘት ይመልሳል"""
+        entries = self.find(topic, version)
+        if not entries:
+            return None
+        return self.get_text(entries[-1]['hash'])
+
+    def get_stats(self) -> Dict:
+        """የማከማቻውን መጠን እና የመጨመቂያ ውጤት ያሳያል"""
+        blobs = 0
+        stored_bytes = 0
+        for directory, _, files in os.walk(self.objects_dir):
+            for filename in files:
+                if filename.endswith(('.gz', '.zst')):
+                    blobs += 1
+                    stored_bytes += os.path.getsize(os.path.join(directory, filename))
+
+        entries = 0
+        logical_bytes = 0
+        for entry in self.iter_index():
+            entries += 1
+            logical_bytes += entry.get('size', 0)
+
+        return {
+            'entries': entries,
+            'unique_blobs': blobs,
+            'logical_bytes': logical_bytes,
+            'stored_bytes': stored_bytes,
+            'compression': self.compression,
+            'savings_ratio': round(1 - stored_bytes / logical_bytes, 3) if logical_bytes else 0
+        }
+
+
+def get_output_store(root_dir: str, compression: str = "auto") -> OutputStore:
+    """
+    የውጤት ማከማቻ አገልግሎት ይመልሳል
+
+    Args:
+        root_dir (str): የማከማቻው ፎልደር
+        compression (str): የመጨመቂያ ዘዴ
+
+    Returns:
+        OutputStore: የውጤት ማከማቻ
+    """
+    return OutputStore(root_dir, compression)
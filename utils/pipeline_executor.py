@@ -0,0 +1,290 @@
+"""
+የስራ ሂደት ደረጃዎችን እንደ ጥገኝነት ግራፍ (DAG) የሚያስፈጽም አገልግሎት
+ለ BaseProfitEngine፣ ለ v10 እና ለ v11 ኦርኬስትሬተሮች የሚጠቅም
+"""
+
+import time
+import logging
+import concurrent.futures
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# የደረጃ ሁኔታዎች
+STATUS_PENDING = 'pending'
+STATUS_STARTED = 'started'
+STATUS_COMPLETED = 'completed'
+STATUS_FAILED = 'failed'
+STATUS_TIMEOUT = 'timeout'
+STATUS_SKIPPED = 'skipped'
+
+# ከዚህ በኋላ የማይቀየሩ ሁኔታዎች
+FINISHED_STATUSES = (STATUS_COMPLETED, STATUS_FAILED, STATUS_TIMEOUT, STATUS_SKIPPED)
+
+
+class PipelineStep:
+    """የአንድ የስራ ሂደት ደረጃ መግለጫ"""
+
+    def __init__(self, name: str, func: Callable[[Dict[str, Any]], Any],
+                 depends_on: Iterable[str] = (), timeout: Optional[float] = None,
+                 retries: int = 0, retry_delay: float = 0.0, required: bool = True,
+                 optional_depends_on: Iterable[str] = ()):
+        """
+        የደረጃ አደረጃጀት
+
+        Args:
+            name (str): የደረጃው ስም (በ pipeline_steps ውስጥ የሚታይ)
+            func (Callable): የጥገኞቹን ውጤቶች (Dict) ተቀብሎ ውጤት የሚመልስ ተግባር
+            depends_on (Iterable[str]): ይህ ደረጃ ከመጀመሩ በፊት መጠናቀቅ ያለባቸው ደረጃዎች
+            timeout (float, optional): ለእያንዳንዱ ሙከራ የሚፈቀደው ከፍተኛ ሰከንድ
+                (ጊዜው ያለፈበት ሙከራ በክር ውስጥ እየሰራ እያለ አዲስ ሙከራ አይጀመርም)
+            retries (int): ካልተሳካ የሚደገምበት ብዛት
+            retry_delay (float): በሙከራዎች መካከል የሚጠበቅ ሰከንድ (ሌሎች ደረጃዎችን አያግድም)
+            required (bool): ካልተሳካ ሙሉው ሂደት እንደወደቀ ይቆጠር እንደሆነ
+            optional_depends_on (Iterable[str]): ይህ ደረጃ የሚጠብቃቸው ግን ባይሳኩም የሚጀመርባቸው
+                ደረጃዎች (ውጤታቸው የሚተላለፈው ከተጠናቀቁ ብቻ ነው)
+        """
+        self.name = name
+        self.func = func
+        self.depends_on = list(depends_on)
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.required = required
+        self.optional_depends_on = list(optional_depends_on)
+
+    @property
+    def all_dependencies(self) -> List[str]:
+        """ሁሉም (አስገዳጅ እና አማራጭ) ጥገኝነቶች"""
+        return self.depends_on + self.optional_depends_on
+
+
+class PipelineExecutor:
+    """ደረጃዎችን በጥገኝነታቸው መሠረት በከፍተኛ ትይዩነት የሚያስፈጽም"""
+
+    def __init__(self, steps: List[PipelineStep], max_workers: int = 4,
+                 logger: Optional[logging.Logger] = None):
+        """
+        የአስፈጻሚ አደረጃጀት
+
+        Args:
+            steps (List[PipelineStep]): የሂደቱ ደረጃዎች
+            max_workers (int): በአንድ ጊዜ የሚሰሩ ከፍተኛ ደረጃዎች
+            logger (logging.Logger, optional): ሎገር
+        """
+        self.steps = {step.name: step for step in steps}
+        self.max_workers = max_workers
+        self.logger = logger or logging.getLogger("PipelineExecutor")
+        self._validate_graph()
+
+    def _validate_graph(self):
+        """ያልታወቁ ጥገኝነቶች ወይም ዑደቶች እንደሌሉ ያረጋግጣል"""
+        for step in self.steps.values():
+            for dependency in step.all_dependencies:
+                if dependency not in self.steps:
+                    raise ValueError(f"ያልታወቀ ጥገኝነት: {step.name} -> {dependency}")
+
+        visiting, visited = set(), set()
+
+        def visit(name: str):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"በደረጃዎች ውስጥ ዑደት ተገኝቷል: {name}")
+            visiting.add(name)
+            for dependency in self.steps[name].all_dependencies:
+                visit(dependency)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self.steps:
+            visit(name)
+
+    def run(self, status: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        ሁሉንም ደረጃዎች ያስፈጽማል
+
+        Args:
+            status (Dict[str, str], optional): የደረጃ ሁኔታዎች የሚጻፉበት መዝገብ (ለምሳሌ pipeline_steps)
+
+        Returns:
+            Dict: results (የደረጃ ውጤቶች)፣ status፣ errors፣ durations እና success
+        """
+        if status is None:
+            status = {}
+
+        results: Dict[str, Any] = {}
+        errors: Dict[str, str] = {}
+        durations: Dict[str, float] = {}
+        attempts: Dict[str, int] = {name: 0 for name in self.steps}
+        # ደረጃ -> ቀጣዩ ሙከራ የሚፈቀድበት ጊዜ
+        retry_at: Dict[str, float] = {}
+        # ደረጃ -> (ጊዜው ያለፈበት ግን አሁንም የሚሰራ ሙከራ, ተስፋ የሚቆረጥበት ጊዜ)
+        abandoned: Dict[str, tuple] = {}
+
+        for name in self.steps:
+            status[name] = STATUS_PENDING
+
+        running: Dict[concurrent.futures.Future, tuple] = {}
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while True:
+                self._submit_ready_steps(executor, status, results, errors, attempts, running,
+                                         retry_at, abandoned)
+                self._skip_blocked_steps(status)
+
+                waiting = [name for name in retry_at.keys() | abandoned.keys()
+                           if status[name] == STATUS_PENDING]
+                if not running and not waiting:
+                    break
+
+                # የቀድሞ ሙከራ ሲያልቅ ድጋሚ ሙከራው ወዲያው እንዲጀመር እነሱም ይጠበቃሉ
+                watched = set(running) | {abandoned[name][0] for name in waiting if name in abandoned}
+                timeout = self._next_deadline(running, [retry_at.get(name) for name in waiting] +
+                                              [abandoned[name][1] for name in waiting if name in abandoned])
+                if watched:
+                    done, _ = concurrent.futures.wait(
+                        watched,
+                        timeout=timeout,
+                        return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                else:
+                    time.sleep(timeout or 0)
+                    done = set()
+
+                now = time.time()
+                for future in list(running.keys()):
+                    name, started_at, deadline = running[future]
+
+                    if future in done:
+                        del running[future]
+                        durations[name] = round(now - started_at, 3)
+                        try:
+                            results[name] = future.result()
+                            status[name] = STATUS_COMPLETED
+                            self.logger.debug(f"✅ ደረጃ ተጠናቋል: {name}")
+                        except Exception as e:
+                            self._handle_failure(name, STATUS_FAILED, str(e), status, errors,
+                                                 attempts, retry_at)
+
+                    elif deadline is not None and now >= deadline:
+                        # ተግባሩ በክር ውስጥ መስራቱን ሊቀጥል ይችላል፣ ውጤቱ ግን አይጠበቅም
+                        del running[future]
+                        future.cancel()
+                        durations[name] = round(now - started_at, 3)
+                        retrying = self._handle_failure(
+                            name, STATUS_TIMEOUT,
+                            f"ጊዜ አልፏል ({self.steps[name].timeout} ሰከንድ)",
+                            status, errors, attempts, retry_at
+                        )
+                        if retrying and not future.done():
+                            # ተመሳሳይ ተግባር (ለምሳሌ የ Groq ጥሪ) በሁለት ክሮች በአንድ ጊዜ እንዳይሰራ
+                            # ድጋሚ ሙከራው ቀዳሚው እስኪያልቅ ድረስ (ቢበዛ አንድ ተጨማሪ timeout) ይጠብቃል
+                            give_up_at = max(now + self.steps[name].timeout, retry_at.get(name, now))
+                            abandoned[name] = (future, give_up_at)
+        finally:
+            executor.shutdown(wait=False)
+
+        success = all(
+            status[name] == STATUS_COMPLETED
+            for name, step in self.steps.items() if step.required
+        )
+
+        return {
+            'results': results,
+            'status': status,
+            'errors': errors,
+            'durations': durations,
+            'success': success
+        }
+
+    def _submit_ready_steps(self, executor, status: Dict[str, str], results: Dict[str, Any],
+                            errors: Dict[str, str], attempts: Dict[str, int], running: Dict,
+                            retry_at: Dict[str, float], abandoned: Dict[str, tuple]):
+        """ጥገኞቻቸው የተጠናቀቁ እና ለድጋሚ ሙከራ ጊዜያቸው የደረሰ ደረጃዎችን ያስጀምራል"""
+        for name, step in self.steps.items():
+            if status[name] != STATUS_PENDING:
+                continue
+            if not all(status[dep] == STATUS_COMPLETED for dep in step.depends_on):
+                continue
+            if not all(status[dep] in FINISHED_STATUSES for dep in step.optional_depends_on):
+                continue
+
+            now = time.time()
+            if retry_at.get(name, now) > now:
+                continue
+
+            if name in abandoned:
+                previous, give_up_at = abandoned[name]
+                if not previous.done():
+                    if now >= give_up_at:
+                        # ቀዳሚው ሙከራ አሁንም እየሰራ ነው - ሁለተኛ ሙከራ በትይዩ አይጀመርም
+                        del abandoned[name]
+                        retry_at.pop(name, None)
+                        status[name] = STATUS_TIMEOUT
+                        errors[name] = f"ጊዜ አልፏል ({step.timeout} ሰከንድ)፣ ቀዳሚው ሙከራ አሁንም እየሰራ ነው"
+                        self.logger.error(f"❌ ደረጃ {name} አልተሳካም: {errors[name]}")
+                    continue
+
+            retry_at.pop(name, None)
+            abandoned.pop(name, None)
+
+            attempts[name] += 1
+            status[name] = STATUS_STARTED
+
+            dependency_results = {dep: results[dep] for dep in step.all_dependencies if dep in results}
+            started_at = time.time()
+            deadline = started_at + step.timeout if step.timeout else None
+
+            future = executor.submit(step.func, dependency_results)
+            running[future] = (name, started_at, deadline)
+
+    def _skip_blocked_steps(self, status: Dict[str, str]):
+        """አስገዳጅ ጥገኞቻቸው ያልተሳኩ ደረጃዎችን ይዘላል"""
+        changed = True
+        while changed:
+            changed = False
+            for name, step in self.steps.items():
+                if status[name] != STATUS_PENDING:
+                    continue
+                if any(status[dep] in (STATUS_FAILED, STATUS_TIMEOUT, STATUS_SKIPPED)
+                       for dep in step.depends_on):
+                    status[name] = STATUS_SKIPPED
+                    changed = True
+
+    def _handle_failure(self, name: str, failure_status: str, error: str,
+                        status: Dict[str, str], errors: Dict[str, str], attempts: Dict[str, int],
+                        retry_at: Dict[str, float]) -> bool:
+        """
+        ያልተሳካ ደረጃን እንደገና ይሞክራል ወይም እንደወደቀ ይመዘግባል
+
+        Returns:
+            bool: ደረጃው እንደገና የሚሞከር ከሆነ True
+        """
+        step = self.steps[name]
+
+        if attempts[name] <= step.retries:
+            self.logger.warning(f"⚠️ ደረጃ {name} አልተሳካም ({error}), እንደገና እየተሞከረ ነው ({attempts[name]}/{step.retries})")
+            status[name] = STATUS_PENDING
+            if step.retry_delay:
+                # የስራ ሂደቱን ሳያግድ ቀጣዩ ሙከራ ከዚህ ጊዜ በኋላ ይጀመራል
+                retry_at[name] = time.time() + step.retry_delay
+            return True
+
+        status[name] = failure_status
+        errors[name] = error
+        self.logger.error(f"❌ ደረጃ {name} አልተሳካም: {error}")
+        return False
+
+    def _next_deadline(self, running: Dict, waits: Iterable[Optional[float]] = ()) -> Optional[float]:
+        """
+        እስከሚቀጥለው የጊዜ ገደብ ወይም የድጋሚ ሙከራ ጊዜ ያለውን ሰከንድ ያሰላል
+
+        Args:
+            running (Dict): እየሰሩ ያሉ ሙከራዎች
+            waits (Iterable[float]): የድጋሚ ሙከራ እና ተስፋ የሚቆረጥባቸው ጊዜያት
+        """
+        deadlines = [deadline for _, _, deadline in running.values() if deadline is not None]
+        deadlines.extend(when for when in waits if when is not None)
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines) - time.time())
@@ -0,0 +1,187 @@
+"""
+ርዕሰ ጉዳዮችን ከ JSONL/CSV ፋይሎች በሰነፍ (lazily) የሚያነብ አገልግሎት
+እያንዳንዱ መዝገብ ሲነበብ ይረጋገጣል፣ ቀድሞ የተካሄዱት ይዘለላሉ
+"""
+
+import os
+import csv
+import json
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Dict, Iterator, Optional
+
+from .validators import Validators, get_validator
+
+
+class TopicSource:
+    """ከፋይል የሚመጡ ርዕሰ ጉዳዮችን አንድ በአንድ የሚመልስ ምንጭ"""
+
+    def __init__(self, path: str, file_format: Optional[str] = None,
+                 topic_field: str = "topic", validator: Optional[Validators] = None,
+                 processed_log: Optional[str] = None):
+        """
+        የምንጩ አደረጃጀት
+
+        Args:
+            path (str): የ JSONL ወይም CSV ፋይል መንገድ
+            file_format (str, optional): "jsonl" ወይም "csv" (ካልተሰጠ ከቅጥያው ይወሰናል)
+            topic_field (str): ርዕሰ ጉዳዩ ያለበት መስክ
+            validator (Validators, optional): የሚጠቀመው ቫሊዴተር
+            processed_log (str, optional): የተካሄዱ ርዕሰ ጉዳዮች ሃሾች የሚመዘገቡበት ፋይል
+        """
+        self.path = path
+        self.file_format = (file_format or self._detect_format(path)).lower()
+        self.topic_field = topic_field
+        self.validator = validator or get_validator()
+        self.processed_log = processed_log
+        self.logger = logging.getLogger("TopicSource")
+        self._lock = threading.Lock()
+
+        if self.file_format not in ("jsonl", "csv"):
+            raise ValueError(f"ያልተደገፈ የፋይል አይነት: {self.file_format}")
+
+        # የታዩ ርዕሰ ጉዳዮች 64-ቢት ሃሾች በጊዜያዊ የዲስክ SQLite ሰንጠረዥ ውስጥ ይያዛሉ፤ ለሚሊዮን መስመሮችም
+        # ማህደረ ትውስታው በ SQLite ገጽ ካሽ (~2 MB) ይወሰናል። ግንኙነቱ ሲዘጋ ፋይሉ ይጠፋል።
+        # ፋይሉ ጊዜያዊ ስለሆነ journal እና commit አያስፈልጉም (አንድ ረጅም transaction)
+        self._seen = sqlite3.connect('', check_same_thread=False)
+        self._seen.execute("PRAGMA journal_mode=OFF")
+        self._seen.execute("PRAGMA synchronous=OFF")
+        self._seen.execute("CREATE TABLE seen (key INTEGER PRIMARY KEY)")
+        self._load_processed()
+
+        self.stats = {
+            'read': 0,
+            'yielded': 0,
+            'invalid': 0,
+            'duplicates': 0
+        }
+
+    @staticmethod
+    def _detect_format(path: str) -> str:
+        """ከፋይሉ ቅጥያ አይነቱን ይወስናል"""
+        extension = os.path.splitext(path)[1].lower()
+        return "csv" if extension in (".csv", ".tsv") else "jsonl"
+
+    @staticmethod
+    def topic_key(topic: str) -> int:
+        """ለተደጋጋሚ ማጣሪያ የርዕሰ ጉዳዩን ቁልፍ ያሰላል (ፊደል እና ክፍተት ሳይለይ)"""
+        normalized = " ".join(topic.lower().split())
+        return int.from_bytes(hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).digest(), 'big')
+
+    @staticmethod
+    def _db_key(key: int) -> int:
+        """64-ቢት ቁልፉን ወደ SQLite INTEGER (signed) ክልል ይቀይራል"""
+        return key - (1 << 64) if key >= (1 << 63) else key
+
+    def _remember(self, key: int) -> bool:
+        """ቁልፉን ይመዘግባል፤ ከዚህ በፊት ካልታየ True ይመልሳል (በ self._lock ውስጥ ይጠራል)"""
+        cursor = self._seen.execute("INSERT OR IGNORE INTO seen (key) VALUES (?)", (self._db_key(key),))
+        return cursor.rowcount == 1
+
+    def _load_processed(self):
+        """ቀድሞ የተካሄዱ ርዕሰ ጉዳዮችን ሃሾች ይጭናል"""
+        if not (self.processed_log and os.path.exists(self.processed_log)):
+            return
+        with open(self.processed_log, 'r', encoding='utf-8') as f:
+            self._seen.executemany(
+                "INSERT OR IGNORE INTO seen (key) VALUES (?)",
+                ((self._db_key(int(line, 16)),) for line in map(str.strip, f) if line)
+            )
+
+    def close(self):
+        """የታዩ ርዕሶችን ጊዜያዊ ሰንጠረዥ ይዘጋል (ፋይሉ ይጠፋል)"""
+        with self._lock:
+            self._seen.close()
+
+    def mark_processed(self, topic: str):
+        """
+        ርዕሰ ጉዳዩን እንደተካሄደ ይመዘግባል (በሚቀጥለው ሩጫ ይዘለላል)
+
+        Args:
+            topic (str): የተካሄደው ርዕሰ ጉዳይ
+        """
+        key = self.topic_key(topic)
+        with self._lock:
+            self._remember(key)
+            if self.processed_log:
+                with open(self.processed_log, 'a', encoding='utf-8') as f:
+                    f.write(f"{key:016x}\n")
+
+    def _iter_raw(self) -> Iterator[Dict]:
+        """ፋይሉን መስመር በመስመር ያነባል"""
+        with open(self.path, 'r', encoding='utf-8', newline='') as f:
+            if self.file_format == "csv":
+                delimiter = "\t" if self.path.lower().endswith(".tsv") else ","
+                for row in csv.DictReader(f, delimiter=delimiter):
+                    yield row
+                return
+
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    self.stats['invalid'] += 1
+                    self.logger.warning(f"መስመር {line_number} JSON አይደለም: {e}")
+                    continue
+
+                # ቀላል የጽሁፍ መስመሮችም ይፈቀዳሉ ("topic")
+                yield record if isinstance(record, dict) else {self.topic_field: record}
+
+    def iter_records(self) -> Iterator[Dict]:
+        """
+        የተረጋገጡ እና ያልተደገሙ መዝገቦችን ይመልሳል
+
+        Returns:
+            Iterator[Dict]: topic መስክ ያለው መዝገብ (ሌሎቹ መስኮች እንዳሉ ይቀራሉ)
+        """
+        for record in self._iter_raw():
+            self.stats['read'] += 1
+
+            topic = record.get(self.topic_field)
+            topic = topic.strip() if isinstance(topic, str) else topic
+
+            is_valid, message = self.validator.validate_topic(topic)
+            if not is_valid:
+                self.stats['invalid'] += 1
+                self.logger.debug(f"ርዕሰ ጉዳይ ተዘሏል ({message}): {topic!r}")
+                continue
+
+            key = self.topic_key(topic)
+            with self._lock:
+                # በዚህ ሩጫ ውስጥ ተደጋጋሚዎችን ለማስቀረትም ይመዘገባል (ፋይሉ የሚጻፈው በ mark_processed ብቻ ነው)
+                if not self._remember(key):
+                    self.stats['duplicates'] += 1
+                    continue
+
+            self.stats['yielded'] += 1
+            record[self.topic_field] = topic
+            yield record
+
+    def iter_topics(self) -> Iterator[str]:
+        """የተረጋገጡ ርዕሰ ጉዳዮችን ብቻ ይመልሳል"""
+        for record in self.iter_records():
+            yield record[self.topic_field]
+
+    def __iter__(self) -> Iterator[str]:
+        return self.iter_topics()
+
+
+def get_topic_source(path: str, version: str = "v9",
+                     processed_log: Optional[str] = None) -> TopicSource:
+    """
+    የርዕሰ ጉዳይ ምንጭ አገልግሎት ይመልሳል
+
+    Args:
+        path (str): የ JSONL ወይም CSV ፋይል መንገድ
+        version (str): የሚሰራበት ስሪት (ለቫሊዴተሩ)
+        processed_log (str, optional): የተካሄዱ ርዕሰ ጉዳዮች መዝገብ ፋይል
+
+    Returns:
+        TopicSource: የርዕሰ ጉዳይ ምንጭ
+    """
+    return TopicSource(path, validator=get_validator(version), processed_log=processed_log)
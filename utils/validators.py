@@ -203,12 +203,13 @@ class Validators:
         except json.JSONDecodeError as e:
             return False, f"JSON ማረጋገጫ አልተቻለም: {e}", None
     
-    def validate_batch_input(self, topics: List[str]) -> Tuple[bool, str, List[str]]:
+    def validate_batch_input(self, topics: List[str], enforce_limit: bool = True) -> Tuple[bool, str, List[str]]:
         """
         የቡድን ግብዓትን ያረጋግጣል
         
         Args:
             topics (List[str]): የሚፈቀዱ ርዕሰ ጉዳዮች
+            enforce_limit (bool): የስሪቱን ከፍተኛ የርዕሰ ጉዳይ ብዛት መተግበር (ለትይዩ ሂደት False)
             
         Returns:
             Tuple[bool, str, List[str]]: (ማረጋገጫ ውጤት, መልእክት, የተረጋገጡ ርዕሰ ጉዳዮች)
@@ -228,7 +229,7 @@ class Validators:
         
         max_allowed = max_topics.get(self.version, 10)
         
-        if len(topics) > max_allowed:
+        if enforce_limit and len(topics) > max_allowed:
             return False, f"የበለጠ ርዕሰ ጉዳዮች አሉ: {len(topics)} > {max_allowed}", []
         
         # እያንዳንዱን ርዕሰ ጉዳይ ማረጋገጫ
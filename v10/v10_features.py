@@ -25,19 +25,33 @@ import os
 import sys
 import json
 import time
-import sqlite3
 import threading
 import hashlib
 import base64
 import random
 import re
 import uuid
+import wave
 import subprocess
 import shutil
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from urllib.parse import quote
+from html import escape as html_escape
 import concurrent.futures
+import itertools
+import tracemalloc
+from collections import deque
+
+# Shared SQLite access layer (utils/db_access.py)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.db_access import get_connection
+from utils.db_migrations import Migration, apply_migrations, check_query_plans
+from utils.db_export import StreamingExporter
+from utils.db_backup import DatabaseBackup
+from utils.article_document import ArticleDocument
+from utils.article_styles import ArticleStyles, get_article_styles
+from utils.html_minifier import HtmlMinifier, get_html_minifier
 
 # =================== DEPENDENCY CHECK ===================
 
@@ -66,6 +80,27 @@ except ImportError:
     TTS_AVAILABLE = False
     print("⚠️  Install TTS: pip install gtts pygame")
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("⚠️  Install numpy for batch revenue estimation: pip install numpy")
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+    print("⚠️  Install psutil for accurate memory monitoring: pip install psutil")
+
+try:
+    from PIL import Image, ImageDraw, ImageFont, features as pil_features
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+    print("⚠️  Install Pillow for WebP/AVIF image optimization: pip install pillow")
+
 # =================== CONFIGURATION MANAGER ===================
 
 class ConfigManager:
@@ -109,12 +144,38 @@ class ConfigManager:
             'TELEGRAM_REVENUE_ALERTS': True,
             'MINIMUM_REVENUE_ALERT': 10.0,
             
+            # Revenue Scenarios (Monte Carlo p10/p50/p90, requires numpy)
+            'REVENUE_SCENARIOS': True,
+            'REVENUE_SCENARIO_SAMPLES': 100000,
+            
+            # Images (fetched concurrently, cached by prompt, WebP/AVIF srcset, uploaded once)
+            'OPTIMIZE_IMAGES': True,
+            'IMAGE_CACHE_DIR': 'image_cache',
+            'IMAGE_PUBLIC_URL': '',
+            'IMAGE_MAX_WORKERS': 4,
+            
+            # Audio Summaries (synthesized concurrently, cached by text/language/voice)
+            'AUDIO_LANGUAGES': ['en'],
+            'AUDIO_CACHE_DIR': 'audio_output/cache',
+            'AUDIO_MAX_WORKERS': 4,
+            
+            # Performance Monitoring (background RSS/CPU sampler, optional tracemalloc)
+            'PERFORMANCE_SAMPLE_INTERVAL': 0.5,
+            'TRACE_ALLOCATIONS': False,
+            
             # Content Formatting
             'INCLUDE_TABLE_OF_CONTENTS': True,
             'INCLUDE_KEY_TAKEAWAYS': True,
             'INCLUDE_STATISTICS': True,
             'INCLUDE_CASE_STUDIES': True,
-            'INCLUDE_FAQ': True
+            'INCLUDE_FAQ': True,
+            
+            # Article Styling ('inline' style attributes or 'class' + shared stylesheet)
+            'ARTICLE_STYLE_MODE': 'inline',
+            'EMBED_ARTICLE_STYLESHEET': True,
+            
+            # Publishing
+            'MINIFY_HTML': True
         }
         
         try:
@@ -261,6 +322,16 @@ class EnhancedTelegramNotifier:
         performance = report_data.get('performance_report', {})
         health = report_data.get('health_report', {})
         stats = report_data.get('stats_report', {})
+        scenarios = report_data.get('revenue_scenarios')
+        
+        scenario_lines = ""
+        if scenarios:
+            scenario_lines = f"""
+🎲 *Revenue Scenarios (monthly)*
+├─ 🔻 P10: ${scenarios.get('p10', 0):,.2f}
+├─ ⚖️ P50: *${scenarios.get('p50', 0):,.2f}*
+└─ 🔺 P90: ${scenarios.get('p90', 0):,.2f}
+"""
         
         # Calculate score
         word_score = min(30, (article_info.get('word_count', 0) / 1800) * 30)
@@ -294,11 +365,11 @@ class EnhancedTelegramNotifier:
 ├─ 🎯 Weekly: *${revenue_estimate.get('monthly_estimate', 0)/4:.2f}*
 ├─ 📊 Traffic: {revenue_estimate.get('traffic_estimate', 0):,}
 └─ 🌟 Quality: {revenue_estimate.get('quality_score', 'N/A')}
-
+{scenario_lines}
 🏥 *System Health*
 ├─ 🩺 Status: {health.get('overall_health', 'N/A')}
 ├─ 📈 Success Rate: {health.get('success_rate', 0)}%
-├─ 🖥️ Memory: {performance.get('average_memory_usage', 0):.1f}MB
+├─ 🖥️ Memory: {performance.get('average_memory_usage', 0):.1f}MB (peak {performance.get('peak_memory_usage', 0):.1f}MB)
 └─ ⚠️ Errors: {performance.get('error_rate', 0)}
 
 📈 *Overall Statistics*
@@ -362,72 +433,144 @@ class EnhancedTelegramNotifier:
 class PersistentDatabaseManager:
     """SQLite database manager with GitHub backup"""
     
+    ARTICLE_INSERT = '''
+        INSERT INTO articles 
+        (title, topic, language, word_count, images_count, has_audio, 
+         has_video, published, publish_date, revenue_estimate, affiliate_links_count)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    
+    CATEGORY_UPSERT = '''
+        INSERT OR REPLACE INTO category_stats 
+        (category, articles_count, avg_revenue, last_used)
+        VALUES (
+            ?,
+            COALESCE((SELECT articles_count + 1 FROM category_stats WHERE category = ?), 1),
+            COALESCE((SELECT (avg_revenue * articles_count + ?) / (articles_count + 1) 
+                     FROM category_stats WHERE category = ?), ?),
+            datetime('now')
+        )
+    '''
+    
+    # Summary tables maintained in the same transaction as every insert
+    TOTALS_UPDATE = '''
+        UPDATE stats_totals
+        SET total_articles = total_articles + 1,
+            total_words = total_words + COALESCE(?, 0),
+            total_revenue = total_revenue + COALESCE(?, 0)
+        WHERE id = 1
+    '''
+    
+    DAILY_UPSERT = '''
+        INSERT INTO stats_daily (day, articles_count)
+        VALUES (date('now'), 1)
+        ON CONFLICT(day) DO UPDATE SET articles_count = articles_count + 1
+    '''
+    
+    # Schema migrations, applied on startup (PRAGMA user_version)
+    MIGRATIONS = [
+        Migration(1, "Indexes for recent articles, daily counts and top categories", [
+            "CREATE INDEX IF NOT EXISTS idx_articles_created_at ON articles (created_at)",
+            "CREATE INDEX IF NOT EXISTS idx_articles_day ON articles (strftime('%Y-%m-%d', created_at))",
+            "CREATE INDEX IF NOT EXISTS idx_category_stats_count ON category_stats (articles_count)"
+        ])
+    ]
+    
+    # Hot queries that must be served by an index (see check_indexes)
+    HOT_QUERIES = {
+        'recent_articles': ("SELECT * FROM articles ORDER BY created_at DESC LIMIT 50", ()),
+        'top_categories': ("SELECT category, articles_count FROM category_stats ORDER BY articles_count DESC LIMIT 5", ()),
+        'daily_counts': ("SELECT strftime('%Y-%m-%d', created_at), COUNT(*) FROM articles GROUP BY strftime('%Y-%m-%d', created_at)", ()),
+        'weekly_stats': ("SELECT day, articles_count FROM stats_daily ORDER BY day DESC LIMIT 7", ())
+    }
+    
     def __init__(self, db_file='profit_machine_v10.db'):
         os.makedirs('data', exist_ok=True)
         self.db_file = os.path.join('data', db_file)
+        self.backup = DatabaseBackup(self.db_file, os.path.join('data', 'backups'), keep=3)
+        # Fresh checkouts (e.g. CI) only carry the snapshot committed by backup_to_github
+        github_copy = self.db_file + '.gz'
+        if not os.path.exists(self.db_file) and os.path.exists(github_copy):
+            self.backup.restore(github_copy, self.db_file)
+            print(f"✅ Database restored from {github_copy}")
+        # Long-lived WAL connection shared by all calls (see utils/db_access.py)
+        self.db = get_connection(self.db_file)
         self._init_database()
     
     def _init_database(self):
         """Initialize database tables"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        # Articles table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS articles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT,
-                topic TEXT,
-                language TEXT,
-                word_count INTEGER,
-                images_count INTEGER,
-                has_audio BOOLEAN,
-                has_video BOOLEAN,
-                published BOOLEAN DEFAULT 0,
-                publish_date TEXT,
-                revenue_estimate REAL,
-                affiliate_links_count INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Performance stats
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS performance_stats (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                execution_date TEXT,
-                total_articles INTEGER,
-                total_words INTEGER,
-                total_revenue_estimate REAL,
-                execution_time_seconds REAL,
-                status TEXT
-            )
-        ''')
-        
-        # Category stats
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS category_stats (
-                category TEXT PRIMARY KEY,
-                articles_count INTEGER DEFAULT 0,
-                avg_revenue REAL DEFAULT 0,
-                last_used TEXT
-            )
-        ''')
+        with self.db.transaction() as cursor:
+            # Articles table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS articles (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT,
+                    topic TEXT,
+                    language TEXT,
+                    word_count INTEGER,
+                    images_count INTEGER,
+                    has_audio BOOLEAN,
+                    has_video BOOLEAN,
+                    published BOOLEAN DEFAULT 0,
+                    publish_date TEXT,
+                    revenue_estimate REAL,
+                    affiliate_links_count INTEGER DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Performance stats
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS performance_stats (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    execution_date TEXT,
+                    total_articles INTEGER,
+                    total_words INTEGER,
+                    total_revenue_estimate REAL,
+                    execution_time_seconds REAL,
+                    status TEXT
+                )
+            ''')
+            
+            # Category stats
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS category_stats (
+                    category TEXT PRIMARY KEY,
+                    articles_count INTEGER DEFAULT 0,
+                    avg_revenue REAL DEFAULT 0,
+                    last_used TEXT
+                )
+            ''')
+            
+            # Global totals (single row)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS stats_totals (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    total_articles INTEGER DEFAULT 0,
+                    total_words INTEGER DEFAULT 0,
+                    total_revenue REAL DEFAULT 0
+                )
+            ''')
+            
+            # Articles per day (UTC, same as created_at)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS stats_daily (
+                    day TEXT PRIMARY KEY,
+                    articles_count INTEGER DEFAULT 0
+                )
+            ''')
+            
+            has_totals = cursor.execute("SELECT 1 FROM stats_totals WHERE id = 1").fetchone()
         
-        conn.commit()
-        conn.close()
+        self.schema_version = apply_migrations(self.db, self.MIGRATIONS)
+        
+        # Existing databases get their summaries computed once
+        if not has_totals:
+            self.rebuild_statistics()
     
-    def log_article(self, article_data: Dict) -> int:
-        """Log article to database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO articles 
-            (title, topic, language, word_count, images_count, has_audio, 
-             has_video, published, publish_date, revenue_estimate, affiliate_links_count)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+    def _article_row(self, article_data: Dict) -> Tuple:
+        """Build the articles INSERT parameters"""
+        return (
             article_data.get('title'),
             article_data.get('topic'),
             article_data.get('language', 'en'),
@@ -439,52 +582,61 @@ class PersistentDatabaseManager:
             article_data.get('publish_date'),
             article_data.get('revenue_estimate', 0),
             article_data.get('affiliate_links_count', 0)
-        ))
-        
-        article_id = cursor.lastrowid
-        
-        # Update category stats
+        )
+    
+    def _category_row(self, article_data: Dict) -> Tuple:
+        """Build the category_stats upsert parameters"""
         category = article_data.get('category', 'general')
-        cursor.execute('''
-            INSERT OR REPLACE INTO category_stats 
-            (category, articles_count, avg_revenue, last_used)
-            VALUES (
-                ?,
-                COALESCE((SELECT articles_count + 1 FROM category_stats WHERE category = ?), 1),
-                COALESCE((SELECT (avg_revenue * articles_count + ?) / (articles_count + 1) 
-                         FROM category_stats WHERE category = ?), ?),
-                datetime('now')
-            )
-        ''', (category, category, 
-              article_data.get('revenue_estimate', 0), category,
-              article_data.get('revenue_estimate', 0)))
-        
-        conn.commit()
-        conn.close()
+        revenue = article_data.get('revenue_estimate', 0)
+        return (category, category, revenue, category, revenue)
+    
+    def _totals_row(self, article_data: Dict) -> Tuple:
+        """Build the stats_totals update parameters"""
+        return (article_data.get('word_count', 0), article_data.get('revenue_estimate', 0))
+    
+    def log_article(self, article_data: Dict) -> int:
+        """Log article to database"""
+        with self.db.transaction() as cursor:
+            cursor.execute(self.ARTICLE_INSERT, self._article_row(article_data))
+            article_id = cursor.lastrowid
+            
+            # Update category stats and summaries
+            cursor.execute(self.CATEGORY_UPSERT, self._category_row(article_data))
+            cursor.execute(self.TOTALS_UPDATE, self._totals_row(article_data))
+            cursor.execute(self.DAILY_UPSERT)
         
         return article_id
     
-    def get_statistics(self) -> Dict:
-        """Get system statistics"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT COUNT(*) FROM articles")
-        total_articles = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT SUM(word_count) FROM articles")
-        total_words = cursor.fetchone()[0] or 0
+    def log_articles(self, articles: List[Dict]) -> int:
+        """Log many articles in one transaction (executemany)"""
+        if not articles:
+            return 0
         
-        cursor.execute("SELECT SUM(revenue_estimate) FROM articles")
-        total_revenue = cursor.fetchone()[0] or 0
+        with self.db.transaction() as cursor:
+            cursor.executemany(self.ARTICLE_INSERT, [self._article_row(a) for a in articles])
+            # Upserts run row by row, so category averages match log_article
+            cursor.executemany(self.CATEGORY_UPSERT, [self._category_row(a) for a in articles])
+            cursor.executemany(self.TOTALS_UPDATE, [self._totals_row(a) for a in articles])
+            cursor.executemany(self.DAILY_UPSERT, [()] * len(articles))
         
-        cursor.execute("SELECT category, articles_count FROM category_stats ORDER BY articles_count DESC LIMIT 5")
-        top_categories = cursor.fetchall()
+        return len(articles)
+    
+    def get_statistics(self) -> Dict:
+        """Get system statistics (reads the summary tables only)"""
+        totals = self.db.query_one(
+            "SELECT total_articles, total_words, total_revenue FROM stats_totals WHERE id = 1"
+        )
+        total_articles = totals['total_articles'] if totals else 0
+        total_words = totals['total_words'] if totals else 0
+        total_revenue = totals['total_revenue'] if totals else 0
         
-        cursor.execute("SELECT strftime('%Y-%m-%d', created_at) as date, COUNT(*) FROM articles GROUP BY date ORDER BY date DESC LIMIT 7")
-        weekly_stats = cursor.fetchall()
+        top_categories = self.db.query(
+            "SELECT category, articles_count FROM category_stats ORDER BY articles_count DESC LIMIT 5"
+        )
         
-        conn.close()
+        weekly_stats = self.db.query(
+            "SELECT day, articles_count FROM stats_daily ORDER BY day DESC LIMIT 7"
+        )
         
         return {
             'total_articles': total_articles,
@@ -492,19 +644,61 @@ class PersistentDatabaseManager:
             'total_revenue_estimate': round(total_revenue, 2),
             'avg_article_length': round(total_words / total_articles, 1) if total_articles > 0 else 0,
             'avg_revenue_per_article': round(total_revenue / total_articles, 2) if total_articles > 0 else 0,
-            'top_categories': dict(top_categories),
-            'weekly_stats': dict(weekly_stats)
+            'top_categories': {row['category']: row['articles_count'] for row in top_categories},
+            'weekly_stats': {row['day']: row['articles_count'] for row in weekly_stats}
         }
     
+    def rebuild_statistics(self) -> Dict:
+        """Recompute stats_totals and stats_daily from the articles table"""
+        with self.db.transaction() as cursor:
+            cursor.execute("DELETE FROM stats_totals")
+            cursor.execute('''
+                INSERT INTO stats_totals (id, total_articles, total_words, total_revenue)
+                SELECT 1, COUNT(*), COALESCE(SUM(word_count), 0), COALESCE(SUM(revenue_estimate), 0)
+                FROM articles
+            ''')
+            
+            cursor.execute("DELETE FROM stats_daily")
+            cursor.execute('''
+                INSERT INTO stats_daily (day, articles_count)
+                SELECT strftime('%Y-%m-%d', created_at), COUNT(*)
+                FROM articles
+                GROUP BY strftime('%Y-%m-%d', created_at)
+            ''')
+        
+        # category_stats cannot be recomputed: articles has no category column
+        return self.get_statistics()
+    
+    def check_indexes(self) -> Dict:
+        """EXPLAIN QUERY PLAN for the hot queries"""
+        return check_query_plans(self.db, self.HOT_QUERIES)
+    
     def backup_to_github(self):
         """Backup database to GitHub"""
         try:
+            # Snapshot via the backup API; nothing to push if the content hash is unchanged
+            snapshot = self.backup.backup()
+            
+            if not snapshot['success']:
+                print(f"⚠️  Database snapshot failed: {snapshot.get('error')}")
+                return False
+            
+            if snapshot['skipped']:
+                print("ℹ️  Database unchanged since last backup, skipping GitHub push")
+                return True
+            
             # Export to JSON
             self.export_to_json()
             
+            # Only the latest compressed snapshot is committed, under a fixed name so each
+            # push replaces it (not the raw .db, the rotated snapshots or the JSON export).
+            # The backup state goes with it so the next checkout can skip an unchanged DB.
+            github_copy = self.db_file + '.gz'
+            shutil.copyfile(snapshot['path'], github_copy)
+            
             # Git commands
             commands = [
-                ['git', 'add', 'data/'],
+                ['git', 'add', '--', github_copy, self.backup.state_path],
                 ['git', 'commit', '-m', f'Database backup {datetime.now().strftime("%Y-%m-%d %H:%M")}'],
                 ['git', 'push']
             ]
@@ -525,13 +719,8 @@ class PersistentDatabaseManager:
     def export_to_json(self):
         """Export database to JSON file"""
         try:
-            conn = sqlite3.connect(self.db_file)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
             # Export recent articles
-            cursor.execute("SELECT * FROM articles ORDER BY created_at DESC LIMIT 50")
-            articles = [dict(row) for row in cursor.fetchall()]
+            articles = self.db.query("SELECT * FROM articles ORDER BY created_at DESC LIMIT 50")
             
             # Export statistics
             stats = self.get_statistics()
@@ -547,7 +736,6 @@ class PersistentDatabaseManager:
             with open(json_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
             
-            conn.close()
             print(f"✅ Database exported to JSON: {json_file}")
             return True
             
@@ -555,11 +743,32 @@ class PersistentDatabaseManager:
             print(f"❌ JSON export failed: {e}")
             return False
 
+    def export_to_jsonl(self, since: Optional[str] = None, incremental: bool = False) -> Dict:
+        """Stream the full articles table to data/exports/*.jsonl.gz"""
+        export_dir = os.path.join('data', 'exports')
+        output_file = os.path.join(export_dir, f"articles_v10_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl.gz")
+        
+        # Incremental exports continue after the last exported (created_at, id)
+        state_file = os.path.join(export_dir, 'export_state.json') if incremental else None
+        
+        result = StreamingExporter(self.db_file).export_table('articles', output_file, since, state_file)
+        print(f"✅ Exported {result['rows']} articles: {output_file}")
+        return result
+
 # =================== SMART REVENUE CALCULATOR ===================
 
 class SmartRevenueCalculator:
     """Intelligent revenue estimation"""
     
+    # Quality score threshold -> monthly traffic range (checked from highest down)
+    TRAFFIC_LEVELS = {
+        9: {'min': 10000, 'max': 50000},
+        7: {'min': 5000, 'max': 20000},
+        5: {'min': 2000, 'max': 8000},
+        3: {'min': 1000, 'max': 3000}
+    }
+    DEFAULT_TRAFFIC = 1000
+    
     def __init__(self):
         self.cpc_rates = {
             'en': {'US': 2.50, 'UK': 2.00, 'CA': 1.80, 'AU': 1.70},
@@ -613,23 +822,24 @@ class SmartRevenueCalculator:
         
         # Traffic estimation
         quality_score = min(10, (word_mult + image_mult + affiliate_mult) * 3)
-        traffic_levels = {
-            9: {'min': 10000, 'max': 50000},
-            7: {'min': 5000, 'max': 20000},
-            5: {'min': 2000, 'max': 8000},
-            3: {'min': 1000, 'max': 3000}
-        }
         
-        for threshold, traffic in traffic_levels.items():
+        for threshold, traffic in self.TRAFFIC_LEVELS.items():
             if quality_score >= threshold:
                 estimated_traffic = (traffic['min'] + traffic['max']) / 2
                 break
         else:
-            estimated_traffic = 1000
+            estimated_traffic = self.DEFAULT_TRAFFIC
         
         # Monthly revenue (3% CTR, 30 days)
         monthly_revenue = estimated_traffic * 0.03 * final_cpc * 30
         
+        return self._format_estimate(monthly_revenue, final_cpc, estimated_traffic, quality_score,
+                                     category_mult, word_mult, image_mult, affiliate_mult, quality_mult)
+    
+    def _format_estimate(self, monthly_revenue: float, final_cpc: float, estimated_traffic: float,
+                         quality_score: float, category_mult: float, word_mult: float,
+                         image_mult: float, affiliate_mult: float, quality_mult: float) -> Dict:
+        """Build the rounded estimate dict returned by calculate_revenue"""
         return {
             'monthly_estimate': round(monthly_revenue, 2),
             'weekly_estimate': round(monthly_revenue / 4, 2),
@@ -645,14 +855,291 @@ class SmartRevenueCalculator:
                 'quality': round(quality_mult, 2)
             }
         }
+    
+    def calculate_revenue_batch(self, word_counts, images_counts, affiliate_counts,
+                                categories, languages, countries,
+                                has_audio=None, has_video=None, has_toc=None) -> Dict[str, Any]:
+        """
+        Vectorized calculate_revenue over arrays of article features.
+        
+        Applies the same float operations in the same order as the scalar path,
+        so every value equals the scalar result before rounding. Returns
+        unrounded NumPy arrays; use estimates_to_dicts for calculate_revenue-style dicts.
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for batch revenue estimation: pip install numpy")
+        
+        word_counts = np.asarray(word_counts, dtype=np.float64)
+        size = word_counts.shape[0]
+        images_counts = np.asarray(images_counts, dtype=np.float64)
+        affiliate_counts = np.asarray(affiliate_counts, dtype=np.float64)
+        
+        # Per-unique-value dict lookups instead of per-article
+        base_cpc = self._lookup(
+            list(zip(languages, countries)),
+            lambda key: self.cpc_rates.get(key[0], {}).get(key[1], 1.0)
+        )
+        category_mult = self._lookup(categories, lambda key: self.category_multipliers.get(key, 1.0))
+        
+        word_mult = np.minimum(1.5, np.maximum(0.8, word_counts / 1000))
+        image_mult = 1 + (images_counts * 0.05)
+        affiliate_mult = 1 + (affiliate_counts * 0.1)
+        
+        quality_mult = np.full(size, 1.0)
+        for flags, bonus in ((has_audio, 0.1), (has_video, 0.15), (has_toc, 0.05)):
+            if flags is not None:
+                quality_mult = np.where(np.asarray(flags, dtype=bool), quality_mult + bonus, quality_mult)
+        
+        final_cpc = base_cpc * category_mult * word_mult * image_mult * affiliate_mult * quality_mult
+        
+        quality_score = np.minimum(10, (word_mult + image_mult + affiliate_mult) * 3)
+        
+        estimated_traffic = np.select(
+            [quality_score >= threshold for threshold in self.TRAFFIC_LEVELS],
+            [(traffic['min'] + traffic['max']) / 2 for traffic in self.TRAFFIC_LEVELS.values()],
+            default=self.DEFAULT_TRAFFIC
+        )
+        
+        monthly_revenue = estimated_traffic * 0.03 * final_cpc * 30
+        
+        return {
+            'monthly_revenue': monthly_revenue,
+            'cpc_rate': final_cpc,
+            'traffic_estimate': estimated_traffic,
+            'quality_score': quality_score,
+            'category_mult': category_mult,
+            'word_mult': word_mult,
+            'image_mult': image_mult,
+            'affiliate_mult': affiliate_mult,
+            'quality_mult': quality_mult
+        }
+    
+    def _lookup(self, keys, resolve) -> Any:
+        """Map a sequence of keys to float64 values, resolving each distinct key once"""
+        cache = {}
+        values = np.empty(len(keys), dtype=np.float64)
+        for index, key in enumerate(keys):
+            if key not in cache:
+                cache[key] = resolve(key)
+            values[index] = cache[key]
+        return values
+    
+    def estimates_to_dicts(self, estimates: Dict[str, Any]) -> List[Dict]:
+        """Convert calculate_revenue_batch arrays to calculate_revenue dicts"""
+        columns = [estimates[key].tolist() for key in (
+            'monthly_revenue', 'cpc_rate', 'traffic_estimate', 'quality_score', 'category_mult',
+            'word_mult', 'image_mult', 'affiliate_mult', 'quality_mult'
+        )]
+        return [self._format_estimate(*row) for row in zip(*columns)]
+    
+    def calculate_revenue_many(self, articles: List[Dict], category: str = 'business',
+                               language: str = 'en', country: str = 'US') -> List[Dict]:
+        """
+        calculate_revenue for many articles. Per-article 'category', 'language'
+        and 'country' keys override the defaults. Falls back to the scalar path
+        without numpy.
+        """
+        if not NUMPY_AVAILABLE:
+            return [
+                self.calculate_revenue(article, article.get('category', category),
+                                       article.get('language', language), article.get('country', country))
+                for article in articles
+            ]
+        
+        estimates = self.calculate_revenue_batch(
+            [article.get('word_count', 1000) for article in articles],
+            [article.get('images_count', 0) for article in articles],
+            [article.get('affiliate_links_count', 0) for article in articles],
+            [article.get('category', category) for article in articles],
+            [article.get('language', language) for article in articles],
+            [article.get('country', country) for article in articles],
+            has_audio=[article.get('has_audio', False) for article in articles],
+            has_video=[article.get('has_video', False) for article in articles],
+            has_toc=[article.get('has_toc', False) for article in articles]
+        )
+        return self.estimates_to_dicts(estimates)
+
+# =================== REVENUE SCENARIO SIMULATOR ===================
+
+class RevenueScenarioSimulator:
+    """Monte Carlo revenue scenarios (p10/p50/p90) on top of SmartRevenueCalculator"""
+    
+    # Category -> (mean CTR, Beta concentration); higher concentration = narrower spread
+    CTR_PROFILES = {
+        'technology': (0.030, 400),
+        'business': (0.032, 350),
+        'finance': (0.028, 300),
+        'health': (0.035, 350),
+        'education': (0.030, 400),
+        'lifestyle': (0.034, 250)
+    }
+    DEFAULT_CTR_PROFILE = (0.030, 300)
+    
+    # Country -> lognormal sigma of CPC around the calculator's rate
+    CPC_VOLATILITY = {
+        'US': 0.25, 'UK': 0.30, 'CA': 0.30, 'AU': 0.30,
+        'DE': 0.30, 'AT': 0.35, 'CH': 0.30,
+        'FR': 0.35, 'BE': 0.40,
+        'ES': 0.40, 'MX': 0.50, 'AR': 0.60, 'CO': 0.55
+    }
+    DEFAULT_CPC_VOLATILITY = 0.45
+    
+    # Traffic range for articles below the lowest quality tier
+    DEFAULT_TRAFFIC_RANGE = {'min': 500, 'max': 2000}
+    
+    PERCENTILES = (10, 50, 90)
+    
+    # Upper bound on samples x articles drawn at once (keeps portfolio memory flat)
+    MAX_CHUNK_VALUES = 2_000_000
+    
+    def __init__(self, calculator: SmartRevenueCalculator = None, seed: int = None):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for revenue scenarios: pip install numpy")
+        
+        self.calculator = calculator or SmartRevenueCalculator()
+        self.rng = np.random.default_rng(seed)
+        # Treat each tier's min/max as the p10/p90 of a lognormal traffic distribution
+        self._z90 = 1.2815515655446004
+    
+    def _article_parameters(self, articles: List[Dict], category: str,
+                            language: str, country: str) -> Dict[str, Any]:
+        """Per-article distribution parameters as arrays"""
+        categories = [article.get('category', category) for article in articles]
+        countries = [article.get('country', country) for article in articles]
+        
+        estimates = self.calculator.calculate_revenue_batch(
+            [article.get('word_count', 1000) for article in articles],
+            [article.get('images_count', 0) for article in articles],
+            [article.get('affiliate_links_count', 0) for article in articles],
+            categories,
+            [article.get('language', language) for article in articles],
+            countries,
+            has_audio=[article.get('has_audio', False) for article in articles],
+            has_video=[article.get('has_video', False) for article in articles],
+            has_toc=[article.get('has_toc', False) for article in articles]
+        )
+        
+        ctr_profiles = [self.CTR_PROFILES.get(name, self.DEFAULT_CTR_PROFILE) for name in categories]
+        ctr_mean = np.array([profile[0] for profile in ctr_profiles])
+        ctr_concentration = np.array([profile[1] for profile in ctr_profiles], dtype=np.float64)
+        
+        cpc_sigma = np.array([self.CPC_VOLATILITY.get(name, self.DEFAULT_CPC_VOLATILITY) for name in countries])
+        
+        quality_score = estimates['quality_score']
+        levels = list(self.calculator.TRAFFIC_LEVELS.items())
+        traffic_min = np.select([quality_score >= threshold for threshold, _ in levels],
+                                [traffic['min'] for _, traffic in levels],
+                                default=self.DEFAULT_TRAFFIC_RANGE['min'])
+        traffic_max = np.select([quality_score >= threshold for threshold, _ in levels],
+                                [traffic['max'] for _, traffic in levels],
+                                default=self.DEFAULT_TRAFFIC_RANGE['max'])
+        
+        return {
+            'ctr_alpha': ctr_mean * ctr_concentration,
+            'ctr_beta': (1 - ctr_mean) * ctr_concentration,
+            # Mean-preserving lognormal: E[cpc] equals the calculator's point CPC
+            'cpc_mu': np.log(estimates['cpc_rate']) - cpc_sigma ** 2 / 2,
+            'cpc_sigma': cpc_sigma,
+            'traffic_mu': (np.log(traffic_min) + np.log(traffic_max)) / 2,
+            'traffic_sigma': (np.log(traffic_max) - np.log(traffic_min)) / (2 * self._z90),
+            'point_estimate': estimates['monthly_revenue']
+        }
+    
+    def _sample(self, params: Dict[str, Any], columns: slice, samples: int) -> Any:
+        """Monthly revenue samples, shape (samples, articles in columns)"""
+        size = (samples, columns.stop - columns.start)
+        ctr = self.rng.beta(params['ctr_alpha'][columns], params['ctr_beta'][columns], size=size)
+        cpc = self.rng.lognormal(params['cpc_mu'][columns], params['cpc_sigma'][columns], size=size)
+        traffic = self.rng.lognormal(params['traffic_mu'][columns], params['traffic_sigma'][columns], size=size)
+        # Same revenue model as SmartRevenueCalculator: traffic x CTR x CPC x 30 days
+        return traffic * ctr * cpc * 30
+    
+    def _summarize(self, values: Any) -> Dict[str, float]:
+        """Percentile summary of a 1-D sample array"""
+        percentiles = np.percentile(values, self.PERCENTILES)
+        summary = {f"p{p}": round(float(value), 2) for p, value in zip(self.PERCENTILES, percentiles)}
+        summary['mean'] = round(float(values.mean()), 2)
+        return summary
+    
+    def simulate_article(self, article_data: Dict, category: str = 'business',
+                         language: str = 'en', country: str = 'US',
+                         samples: int = 100000) -> Dict:
+        """
+        Revenue distribution for a single article
+        
+        Returns p10/p50/p90/mean monthly revenue, the calculator's point
+        estimate and weekly/daily p50 values.
+        """
+        params = self._article_parameters([article_data], category, language, country)
+        
+        chunks = [
+            self._sample(params, slice(0, 1), min(self.MAX_CHUNK_VALUES, samples - start))[:, 0]
+            for start in range(0, samples, self.MAX_CHUNK_VALUES)
+        ]
+        
+        summary = {'samples': samples}
+        summary.update(self._summarize(np.concatenate(chunks)))
+        summary['point_estimate'] = round(float(params['point_estimate'][0]), 2)
+        summary['weekly_p50'] = round(summary['p50'] / 4, 2)
+        summary['daily_p50'] = round(summary['p50'] / 30, 2)
+        return summary
+    
+    def simulate_portfolio(self, articles: List[Dict], category: str = 'business',
+                           language: str = 'en', country: str = 'US',
+                           samples: int = 10000) -> Dict:
+        """
+        Revenue distribution for a whole portfolio of articles
+        
+        Articles are sampled independently in column chunks so memory stays
+        bounded; per-article percentiles come from the same draws that are
+        summed into the portfolio total.
+        """
+        if not articles:
+            return {'samples': samples, 'articles': [], 'portfolio': self._summarize(np.zeros(1))}
+        
+        params = self._article_parameters(articles, category, language, country)
+        total = np.zeros(samples)
+        per_article = []
+        
+        chunk_size = max(1, self.MAX_CHUNK_VALUES // samples)
+        for start in range(0, len(articles), chunk_size):
+            columns = slice(start, min(start + chunk_size, len(articles)))
+            values = self._sample(params, columns, samples)
+            total += values.sum(axis=1)
+            
+            percentiles = np.percentile(values, self.PERCENTILES, axis=0)
+            means = values.mean(axis=0)
+            for offset in range(values.shape[1]):
+                index = start + offset
+                entry = {f"p{p}": round(float(percentiles[i, offset]), 2) for i, p in enumerate(self.PERCENTILES)}
+                entry['mean'] = round(float(means[offset]), 2)
+                entry['point_estimate'] = round(float(params['point_estimate'][index]), 2)
+                entry['topic'] = articles[index].get('topic', articles[index].get('title', f"article_{index}"))
+                per_article.append(entry)
+        
+        return {
+            'samples': samples,
+            'articles': per_article,
+            'portfolio': self._summarize(total)
+        }
+    
+    def prioritize(self, articles: List[Dict], key: str = 'p50', samples: int = 10000, **kwargs) -> List[Dict]:
+        """
+        Rank candidate articles/topics by a scenario percentile
+        
+        key='p10' favours safe topics, 'p90' favours upside.
+        """
+        result = self.simulate_portfolio(articles, samples=samples, **kwargs)
+        return sorted(result['articles'], key=lambda entry: entry[key], reverse=True)
 
 # =================== SAFE AFFILIATE MANAGER ===================
 
 class SafeAffiliateManager:
     """Safe affiliate link integration (max 3 links)"""
     
-    def __init__(self, config: ConfigManager):
+    def __init__(self, config: ConfigManager, styles: ArticleStyles = None):
         self.config = config
+        self.styles = styles or get_article_styles()
         self.max_links = config.get('MAX_AFFILIATE_LINKS', 3)
         
         # Network configurations
@@ -739,33 +1226,40 @@ class SafeAffiliateManager:
         if not links:
             return content, 0
         
-        paragraphs = re.split(r'\n\s*\n', content)
-        if len(paragraphs) < 10:
+        document = ArticleDocument.parse(content)
+        inserted = self.embed_affiliate_links_in_document(document, topic, category, links)
+        if not inserted:
             return content, 0
+        return document.to_html(), inserted
+    
+    def embed_affiliate_links_in_document(self, document: ArticleDocument, topic: str,
+                                          category: str, links: List[Dict] = None) -> int:
+        """Insert affiliate blocks with proper spacing; returns links inserted"""
+        
+        if links is None:
+            links = self.generate_affiliate_links(topic, category)
+        if not links:
+            return 0
+        
+        total_paragraphs = len(document)
+        if total_paragraphs < 10:
+            return 0
         
         # Calculate positions with proper spacing
-        positions = []
-        total_paragraphs = len(paragraphs)
         min_spacing = max(3, total_paragraphs // len(links))
         
-        for i in range(len(links)):
+        # Each link goes before block `pos` of the current document; links
+        # sharing a clamped position keep their order
+        placements = []
+        for i, link in enumerate(links):
             pos = min((i + 1) * min_spacing, total_paragraphs - 2)
-            positions.append(pos)
+            placements.append((pos, self._create_affiliate_html(link)))
         
-        # Insert links
-        inserted_count = 0
-        for i, pos in enumerate(positions):
-            if i < len(links):
-                link_html = self._create_affiliate_html(links[i])
-                insert_pos = pos + inserted_count
-                if insert_pos < len(paragraphs):
-                    paragraphs.insert(insert_pos, link_html)
-                    inserted_count += 1
-        
-        return '\n\n'.join(paragraphs), len(links)
+        return document.insert_many(placements, source='affiliate')
     
     def _create_affiliate_html(self, link_data: Dict) -> str:
         """Create affiliate link HTML with disclosure"""
+        styles = self.styles
         
         ctas = [
             "For more information, check this out",
@@ -778,14 +1272,14 @@ class SafeAffiliateManager:
         cta = random.choice(ctas)
         
         return f'''
-<div class="affiliate-disclosure" style="background: #f8f9fa; border-left: 4px solid #4a5568; padding: 15px; margin: 20px 0; border-radius: 0 8px 8px 0;">
-<p style="margin: 0; font-style: italic; color: #4a5568;">
+<div {styles.attrs('affiliate')}>
+<p {styles.attrs('affiliate-text')}>
 💡 <strong>Note:</strong> {cta}: 
-<a href="{link_data['url']}" target="_blank" rel="{link_data['rel']}" style="color: #2d3748; font-weight: bold; text-decoration: none;">
+<a href="{link_data['url']}" target="_blank" rel="{link_data['rel']}" {styles.attrs('affiliate-link')}>
 {link_data['anchor_text']}
 </a>
 </p>
-<p style="margin: 10px 0 0 0; font-size: 0.9em; color: #718096;">
+<p {styles.attrs('affiliate-note')}>
 (This is an affiliate link. Clicking it won't cost you extra but helps support our work.)
 </p>
 </div>
@@ -796,94 +1290,106 @@ class SafeAffiliateManager:
 class AdvancedContentFormatter:
     """Advanced content formatting with TOC and styling"""
     
-    def __init__(self, config: ConfigManager):
+    # Headings listed in the table of contents (attributes may span lines)
+    TOC_HEADING = re.compile(r'<h[2-3][^>]*>(.*?)</h[2-3]>')
+    H2 = re.compile(r'<h2>(.*?)</h2>')
+    H3 = re.compile(r'<h3>(.*?)</h3>')
+    
+    # Conclusion section: an unstyled <h2>/<h3> starting with "Conclusion", up to
+    # its first closing heading tag and then up to the next "<h" (or the end)
+    CONCLUSION_START = re.compile(r'<h[2-3]>Conclusion', re.IGNORECASE)
+    HEADING_CLOSE = re.compile(r'</h[2-3]>', re.IGNORECASE)
+    NEXT_TAG_H = re.compile(r'<h', re.IGNORECASE)
+    
+    def __init__(self, config: ConfigManager, styles: ArticleStyles = None):
         self.config = config
+        self.styles = styles or get_article_styles()
+        self.h2_styled = f"<h2 {self.styles.attrs('heading-2')}>\\1</h2>"
+        self.h3_styled = f"<h3 {self.styles.attrs('heading-3')}>\\1</h3>"
         
     def format_content(self, content: str, topic: str, 
                       include_toc: bool = None,
                       include_takeaways: bool = None) -> str:
-        """Format content with advanced features"""
+        """
+        Format content with advanced features
+        
+        One traversal over the lines inserts the table of contents after the
+        first h1/h2 line, styles h2/h3 headings and inserts key takeaways
+        before the first line mentioning the conclusion; the conclusion
+        section is then restyled by a forward-only scan.
+        """
         
         if include_toc is None:
             include_toc = self.config.get('INCLUDE_TABLE_OF_CONTENTS', True)
         if include_takeaways is None:
             include_takeaways = self.config.get('INCLUDE_KEY_TAKEAWAYS', True)
         
-        formatted = content
-        
-        # Add table of contents
+        toc_lines = None
         if include_toc:
-            formatted = self._add_table_of_contents(formatted, topic)
+            # Only the first six headings are listed; three are needed for a TOC
+            headings = [match.group(1) for match in itertools.islice(self.TOC_HEADING.finditer(content), 6)]
+            if len(headings) >= 3:
+                toc_lines = self._table_of_contents_html(headings, topic).split('\n')
         
-        # Add styling to headings
-        formatted = self._style_headings(formatted)
+        takeaways_lines = self._key_takeaways_html().split('\n') if include_takeaways else None
         
-        # Add key takeaways
-        if include_takeaways:
-            formatted = self._add_key_takeaways(formatted)
+        output = []
+        
+        def emit(line: str):
+            nonlocal takeaways_lines
+            
+            # Heading styling never crosses a line, so it is applied per line
+            if '<h2>' in line:
+                line = self.H2.sub(self.h2_styled, line)
+            if '<h3>' in line:
+                line = self.H3.sub(self.h3_styled, line)
+            
+            # Add key takeaways before the first line mentioning the conclusion
+            if takeaways_lines is not None and 'conclusion' in line.lower():
+                output.extend(takeaways_lines)
+                takeaways_lines = None
+            
+            output.append(line)
         
-        # Add conclusion styling
-        formatted = self._style_conclusion(formatted)
+        for line in content.split('\n'):
+            emit(line)
+            
+            # Insert table of contents after the first heading line
+            if toc_lines is not None and ('<h1' in line or '<h2' in line):
+                for toc_line in toc_lines:
+                    emit(toc_line)
+                toc_lines = None
         
-        return formatted
+        # Replace conclusion if exists
+        return self._replace_conclusion('\n'.join(output))
     
-    def _add_table_of_contents(self, content: str, topic: str) -> str:
-        """Add table of contents"""
-        
-        # Extract headings
-        headings = re.findall(r'<h[2-3][^>]*>(.*?)</h[2-3]>', content)
-        if len(headings) < 3:
-            return content
+    def _table_of_contents_html(self, headings: List[str], topic: str) -> str:
+        """Create table of contents HTML"""
+        styles = self.styles
         
         # Create TOC items
+        link_attrs = styles.attrs('toc-link')
         toc_items = []
         for i, heading in enumerate(headings[:6]):
             clean_heading = re.sub(r'<[^>]+>', '', heading)
             slug = re.sub(r'[^a-z0-9]+', '-', clean_heading.lower()).strip('-')
-            toc_items.append(f'<li><a href="#{slug}" style="color: #4a5568; text-decoration: none;">{clean_heading}</a></li>')
+            toc_items.append(f'<li><a href="#{slug}" {link_attrs}>{clean_heading}</a></li>')
         
-        toc_html = f'''
-<div class="table-of-contents" style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 25px; border-radius: 12px; margin: 30px 0; box-shadow: 0 10px 30px rgba(0,0,0,0.1);">
-<h3 style="margin-top: 0; color: white;">📑 In This Article: {topic[:50]}</h3>
-<ul style="columns: 2; column-gap: 40px; list-style: none; padding-left: 0;">
+        return f'''
+<div {styles.attrs('toc')}>
+<h3 {styles.attrs('toc-title')}>📑 In This Article: {topic[:50]}</h3>
+<ul {styles.attrs('toc-list')}>
 {toc_items}
 </ul>
-<p style="font-size: 0.9em; opacity: 0.9; margin-top: 15px;">
+<p {styles.attrs('toc-note')}>
 <em>Use the links above to navigate to specific sections.</em>
 </p>
 </div>
 '''
-        
-        # Insert after first heading
-        lines = content.split('\n')
-        for i, line in enumerate(lines):
-            if '<h1' in line or '<h2' in line:
-                lines.insert(i + 1, toc_html)
-                break
-        
-        return '\n'.join(lines)
-    
-    def _style_headings(self, content: str) -> str:
-        """Add styling to headings"""
-        
-        # Style h2 headings
-        content = re.sub(
-            r'<h2>(.*?)</h2>',
-            r'<h2 style="border-bottom: 2px solid #4a5568; padding-bottom: 10px; margin-top: 40px; color: #2d3748;">\1</h2>',
-            content
-        )
-        
-        # Style h3 headings
-        content = re.sub(
-            r'<h3>(.*?)</h3>',
-            r'<h3 style="border-left: 4px solid #667eea; padding-left: 15px; margin-top: 30px; color: #4a5568;">\1</h3>',
-            content
-        )
-        
-        return content
     
-    def _add_key_takeaways(self, content: str) -> str:
-        """Add key takeaways section"""
+    def _key_takeaways_html(self) -> str:
+        """Create key takeaways section HTML"""
+        styles = self.styles
         
         takeaways = [
             "Start with clear, measurable goals",
@@ -895,39 +1401,29 @@ class AdvancedContentFormatter:
         
         takeaways_html = '\n'.join([f'<li>{takeaway}</li>' for takeaway in takeaways])
         
-        takeaways_section = f'''
-<div class="key-takeaways" style="background: #f0fff4; border: 2px solid #9ae6b4; padding: 25px; border-radius: 12px; margin: 40px 0; box-shadow: 0 5px 15px rgba(0,0,0,0.05);">
-<h3 style="margin-top: 0; color: #2f855a;">🎯 Key Takeaways</h3>
-<ul style="margin: 15px 0; padding-left: 20px; color: #2d3748;">
+        return f'''
+<div {styles.attrs('takeaways')}>
+<h3 {styles.attrs('takeaways-title')}>🎯 Key Takeaways</h3>
+<ul {styles.attrs('takeaways-list')}>
 {takeaways_html}
 </ul>
-<p style="color: #718096; font-style: italic; margin-top: 15px;">
+<p {styles.attrs('takeaways-note')}>
 Remember: Consistency and continuous improvement are key to success.
 </p>
 </div>
 '''
-        
-        # Insert before conclusion
-        if 'Conclusion' in content or 'conclusion' in content.lower():
-            lines = content.split('\n')
-            for i, line in enumerate(lines):
-                if 'Conclusion' in line or 'conclusion' in line.lower():
-                    lines.insert(i, takeaways_section)
-                    break
-            return '\n'.join(lines)
-        
-        return content
     
-    def _style_conclusion(self, content: str) -> str:
-        """Style conclusion section"""
+    def _conclusion_html(self) -> str:
+        """Create conclusion section HTML"""
+        styles = self.styles
         
-        conclusion_html = '''
-<div class="conclusion" style="background: linear-gradient(135deg, #f6d365 0%, #fda085 100%); padding: 30px; border-radius: 12px; margin: 40px 0; box-shadow: 0 10px 30px rgba(0,0,0,0.1);">
-<h3 style="margin-top: 0; color: #2d3748;">✨ Final Thoughts</h3>
-<p style="color: #2d3748; font-size: 1.1em;">
+        return f'''
+<div {styles.attrs('conclusion')}>
+<h3 {styles.attrs('conclusion-title')}>✨ Final Thoughts</h3>
+<p {styles.attrs('conclusion-text')}>
 The journey of a thousand miles begins with a single step. Start implementing these strategies today, and track your progress over time.
 </p>
-<p style="margin-top: 20px;">
+<p {styles.attrs('conclusion-plan')}>
 <strong>🎯 Your Action Plan:</strong><br>
 1. Choose one strategy to implement today<br>
 2. Set up tracking and measurement<br>
@@ -936,39 +1432,174 @@ The journey of a thousand miles begins with a single step. Start implementing th
 </p>
 </div>
 '''
+    
+    def _replace_conclusion(self, content: str) -> str:
+        """
+        Replace conclusion sections with the styled conclusion block
+        
+        Every search starts where the previous one ended, so long documents
+        are scanned once instead of re-scanned from each candidate heading.
+        """
+        conclusion_html = self._conclusion_html()
+        # Where a trailing "$" can match: before a final newline, else at the end
+        end_anchor = len(content) - 1 if content.endswith('\n') else len(content)
+        
+        pieces = []
+        position = 0
+        while True:
+            start = self.CONCLUSION_START.search(content, position)
+            if not start:
+                break
+            
+            close = self.HEADING_CLOSE.search(content, start.end())
+            if not close:
+                # No closing tag further on, so no later candidate can match
+                break
+            
+            next_heading = self.NEXT_TAG_H.search(content, close.end())
+            end = next_heading.start() if next_heading else len(content)
+            if close.end() <= end_anchor:
+                end = min(end, end_anchor)
+            
+            pieces.append(content[position:start.start()])
+            pieces.append(conclusion_html)
+            position = end
         
-        # Replace conclusion if exists
-        content = re.sub(
-            r'<h[2-3]>Conclusion.*?</h[2-3]>.*?(?=<h|$)',
-            conclusion_html,
-            content,
-            flags=re.DOTALL | re.IGNORECASE
-        )
-        
-        return content
+        pieces.append(content[position:])
+        return ''.join(pieces)
 
 # =================== PERFORMANCE MONITOR ===================
 
 class PerformanceMonitor:
-    """System performance monitoring"""
+    """System performance monitoring with a background memory/CPU sampler"""
     
-    def __init__(self):
+    MAX_SAMPLES = 10000
+    
+    def __init__(self, sample_interval: float = 0.5, trace_allocations: bool = False,
+                 top_allocations: int = 5):
+        self.sample_interval = sample_interval
+        self.trace_allocations = trace_allocations
+        self.top_allocations = top_allocations
+        
         self.metrics = {
             'start_time': None,
+            'start_cpu': 0.0,
             'component_times': {},
+            'component_memory': {},
             'api_calls': [],
-            'memory_usage': [],
+            'memory_usage': deque(maxlen=self.MAX_SAMPLES),  # (timestamp, rss_mb, cpu_seconds)
             'errors': []
         }
+        
+        self._process = psutil.Process(os.getpid()) if PSUTIL_AVAILABLE else None
+        self._page_size = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._sampler = None
+        self._owns_tracemalloc = False
+        self._last_snapshot = None
     
     def start(self):
-        """Start monitoring"""
+        """Start monitoring (samples RSS and CPU every sample_interval seconds)"""
         self.metrics['start_time'] = time.time()
-        self.metrics['memory_usage'].append(self._get_memory_usage())
+        self.metrics['start_cpu'] = time.process_time()
+        self.metrics['component_memory'] = {}
+        with self._lock:
+            self.metrics['memory_usage'].clear()
+        self._sample()
+        
+        if self.trace_allocations:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owns_tracemalloc = True
+            tracemalloc.reset_peak()
+            self._last_snapshot = self._take_snapshot()
+        
+        if self.sample_interval and not (self._sampler and self._sampler.is_alive()):
+            self._stop_event.clear()
+            self._sampler = threading.Thread(target=self._run_sampler, name='PerformanceSampler', daemon=True)
+            self._sampler.start()
+    
+    def stop(self):
+        """Stop the background sampler (and tracemalloc if this monitor started it)"""
+        self._stop_event.set()
+        if self._sampler:
+            self._sampler.join(timeout=max(1.0, self.sample_interval * 2))
+            self._sampler = None
+        
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+        self._last_snapshot = None
+    
+    def _run_sampler(self):
+        while not self._stop_event.wait(self.sample_interval):
+            self._sample()
+    
+    def _sample(self) -> Tuple[float, float, float]:
+        sample = (time.time(), self._get_memory_usage(), time.process_time())
+        with self._lock:
+            self.metrics['memory_usage'].append(sample)
+        return sample
     
     def log_component(self, component: str, duration: float):
-        """Log component execution time"""
+        """Log component execution time and its memory/CPU window (the last `duration` seconds)"""
         self.metrics['component_times'][component] = duration
+        
+        if not self.metrics['start_time']:
+            return
+        
+        end = self._sample()
+        window_start = end[0] - duration
+        
+        # Samples inside the window plus the last one before it as the baseline
+        window = []
+        baseline = end
+        with self._lock:
+            for sample in reversed(self.metrics['memory_usage']):
+                baseline = sample
+                if sample[0] < window_start:
+                    break
+                window.append(sample)
+        
+        memory = {
+            'peak_rss_mb': round(max(sample[1] for sample in window + [baseline]), 2),
+            'rss_delta_mb': round(end[1] - baseline[1], 2),
+            'cpu_time': round(end[2] - baseline[2], 3),
+            'samples': len(window)
+        }
+        
+        if self.trace_allocations and tracemalloc.is_tracing():
+            # Python allocations since the previous component was logged
+            _, traced_peak = tracemalloc.get_traced_memory()
+            memory['peak_traced_mb'] = round(traced_peak / 1024 / 1024, 2)
+            memory['top_allocations'] = self._top_allocations()
+            # Reset after the snapshot so its own memory is not charged to the next component
+            tracemalloc.reset_peak()
+        
+        self.metrics['component_memory'][component] = memory
+    
+    def _take_snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<unknown>'),
+        ))
+    
+    def _top_allocations(self) -> List[Dict]:
+        snapshot = self._take_snapshot()
+        previous, self._last_snapshot = self._last_snapshot, snapshot
+        
+        if previous is None:
+            stats = snapshot.statistics('lineno')
+            return [{'location': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                     'size_kb': round(stat.size / 1024, 1), 'count': stat.count}
+                    for stat in stats[:self.top_allocations]]
+        
+        stats = [stat for stat in snapshot.compare_to(previous, 'lineno') if stat.size_diff > 0]
+        return [{'location': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                 'size_kb': round(stat.size_diff / 1024, 1), 'count': stat.count_diff}
+                for stat in stats[:self.top_allocations]]
     
     def log_api_call(self, endpoint: str, status: str, duration: float):
         """Log API call"""
@@ -993,18 +1624,31 @@ class PerformanceMonitor:
             return {}
         
         total_time = time.time() - self.metrics['start_time']
+        cpu_time = time.process_time() - self.metrics['start_cpu']
         
         # Find slowest component
         component_times = self.metrics['component_times']
         slowest = max(component_times.items(), key=lambda x: x[1]) if component_times else None
         
+        # Memory samples
+        with self._lock:
+            rss_samples = [sample[1] for sample in self.metrics['memory_usage']]
+        component_memory = self.metrics['component_memory']
+        peak_component = max(component_memory.items(), key=lambda x: x[1]['peak_rss_mb']) if component_memory else None
+        
         # API call stats
         api_calls = self.metrics['api_calls']
         successful_calls = sum(1 for call in api_calls if call['status'] == 'success')
         
         return {
             'total_execution_time': round(total_time, 2),
-            'average_memory_usage': round(sum(self.metrics['memory_usage']) / len(self.metrics['memory_usage']), 2) if self.metrics['memory_usage'] else 0,
+            'average_memory_usage': round(sum(rss_samples) / len(rss_samples), 2) if rss_samples else 0,
+            'peak_memory_usage': round(max(rss_samples), 2) if rss_samples else 0,
+            'memory_samples': len(rss_samples),
+            'cpu_time': round(cpu_time, 2),
+            'cpu_utilization': round(cpu_time / total_time * 100, 1) if total_time else 0,
+            'component_memory': dict(component_memory),
+            'peak_memory_component': peak_component[0] if peak_component else None,
             'slowest_component': slowest,
             'total_api_calls': len(api_calls),
             'successful_api_calls': successful_calls,
@@ -1014,20 +1658,59 @@ class PerformanceMonitor:
         }
     
     def _get_memory_usage(self) -> float:
-        """Get memory usage in MB"""
+        """Get memory usage (RSS) in MB"""
         try:
-            import psutil
-            process = psutil.Process(os.getpid())
-            return process.memory_info().rss / 1024 / 1024
-        except:
+            if self._process is not None:
+                return self._process.memory_info().rss / 1024 / 1024
+            # Without psutil: resident pages from /proc (Linux)
+            with open('/proc/self/statm') as f:
+                return int(f.read().split()[1]) * self._page_size / 1024 / 1024
+        except Exception:
             return 0
 
 # =================== VOICE AI ENGINE ===================
 
+class GTTSBackend:
+    """Google Text-to-Speech backend (requires gtts)"""
+    
+    name = 'gTTS'
+    extension = 'mp3'
+    
+    def synthesize(self, text: str, language: str, voice: str, path: str):
+        """Write speech for text to path"""
+        tts = gTTS(text=text, lang=language, tld=voice, slow=False)
+        tts.save(path)
+
+class StubTTSBackend:
+    """Local TTS stand-in for tests: writes silent WAV audio, no network"""
+    
+    name = 'stub'
+    extension = 'wav'
+    
+    def __init__(self, seconds_per_word: float = 0.05, sample_rate: int = 8000):
+        self.seconds_per_word = seconds_per_word
+        self.sample_rate = sample_rate
+        self.calls = 0
+        self._calls_lock = threading.Lock()
+    
+    def synthesize(self, text: str, language: str, voice: str, path: str):
+        """Write silence whose length follows the word count"""
+        # VoiceAIEngine synthesizes languages in parallel threads
+        with self._calls_lock:
+            self.calls += 1
+        frames = max(1, int(len(text.split()) * self.seconds_per_word * self.sample_rate))
+        with wave.open(path, 'wb') as audio:
+            audio.setnchannels(1)
+            audio.setsampwidth(1)
+            audio.setframerate(self.sample_rate)
+            audio.writeframes(b'\x80' * frames)
+
 class VoiceAIEngine:
     """Convert articles to speech with native accents"""
     
-    def __init__(self):
+    STREAM_CHUNK_SIZE = 64 * 1024
+    
+    def __init__(self, backend=None, cache_dir: str = 'audio_output/cache', max_workers: int = 4):
         self.supported_languages = {
             'en': {'name': 'English', 'accent': 'com', 'tld': 'com', 'slow': False},
             'en-uk': {'name': 'English (UK)', 'accent': 'co.uk', 'tld': 'co.uk', 'slow': False},
@@ -1036,32 +1719,61 @@ class VoiceAIEngine:
             'es': {'name': 'Spanish', 'accent': 'es', 'tld': 'es', 'slow': False},
             'it': {'name': 'Italian', 'accent': 'it', 'tld': 'it', 'slow': False}
         }
+        
+        if backend is None and TTS_AVAILABLE:
+            backend = GTTSBackend()
+        self.backend = backend
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
     
-    def create_audio_summary(self, article_content: str, language: str = 'en') -> Dict:
+    def create_audio_summary(self, article_content: str, language: str = 'en',
+                             include_base64: bool = False) -> Dict:
         """Create audio summary of article"""
+        return self.create_audio_summaries(article_content, [language], include_base64)[language]
+    
+    def create_audio_summaries(self, article_content: str, languages: List[str],
+                               include_base64: bool = False) -> Dict[str, Dict]:
+        """Create audio summaries for several languages concurrently (cached by text, language and voice)"""
         
-        print(f"🔊 Generating audio for {self.supported_languages.get(language, {}).get('name', language)}...")
+        names = ', '.join(self.supported_languages.get(language, {}).get('name', language) for language in languages)
+        print(f"🔊 Generating audio for {names}...")
         
         # Extract summary
-        summary = self._extract_summary(article_content, language)
+        summary = self._extract_summary(article_content, languages[0] if languages else 'en')
         
-        try:
-            if TTS_AVAILABLE:
-                audio_file = self._generate_with_gtts(summary, language)
-                if audio_file:
-                    return {
+        if not self.backend:
+            return {language: {'success': False, 'error': 'TTS not available', 'summary': summary}
+                    for language in languages}
+        
+        results = {}
+        workers = max(1, min(self.max_workers, len(languages)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {language: executor.submit(self._synthesize_cached, summary, language)
+                       for language in dict.fromkeys(languages)}
+            
+            for language, future in futures.items():
+                try:
+                    audio_file = future.result()
+                    if include_base64:
+                        with open(audio_file['filename'], 'rb') as f:
+                            audio_file['base64'] = base64.b64encode(f.read()).decode('utf-8')
+                    
+                    results[language] = {
                         'success': True,
                         'audio_file': audio_file,
                         'summary': summary,
                         'language': language,
-                        'method': 'gTTS'
+                        'method': self.backend.name
                     }
-            
-            return {'success': False, 'error': 'TTS not available', 'summary': summary}
-            
-        except Exception as e:
-            print(f"⚠️  Audio generation failed: {e}")
-            return {'success': False, 'error': str(e), 'summary': summary}
+                    
+                except Exception as e:
+                    print(f"⚠️  Audio generation failed ({language}): {e}")
+                    results[language] = {'success': False, 'error': str(e), 'summary': summary}
+        
+        cached = sum(1 for result in results.values() if result.get('audio_file', {}).get('cached'))
+        print(f"   🎧 {sum(1 for result in results.values() if result['success'])}/{len(results)} audio files ready ({cached} from cache)")
+        
+        return results
     
     def _extract_summary(self, content: str, language: str) -> str:
         """Extract summary from content"""
@@ -1078,37 +1790,78 @@ class VoiceAIEngine:
         
         return summary[:800]
     
-    def _generate_with_gtts(self, text: str, language: str) -> Optional[Dict]:
-        """Generate audio using gTTS"""
-        try:
-            lang_code = language.split('-')[0]
-            os.makedirs('audio_output', exist_ok=True)
-            
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"audio_output/article_{timestamp}_{lang_code}.mp3"
-            
-            tts = gTTS(text=text, lang=lang_code, slow=False)
-            tts.save(filename)
-            
-            with open(filename, 'rb') as audio_file:
-                audio_base64 = base64.b64encode(audio_file.read()).decode('utf-8')
-            
-            return {
-                'filename': filename,
-                'base64': audio_base64,
-                'text': text[:100] + '...'
-            }
-            
-        except Exception as e:
-            print(f"⚠️  gTTS error: {e}")
-            return None
+    def _voice_for(self, language: str) -> Tuple[str, str]:
+        """(language code, voice/accent) for a supported language key"""
+        settings = self.supported_languages.get(language, {})
+        return language.split('-')[0], settings.get('tld', 'com')
+    
+    def _synthesize_cached(self, text: str, language: str) -> Dict:
+        """Synthesize text once per (text hash, language, voice); later calls reuse the file"""
+        
+        lang_code, voice = self._voice_for(language)
+        text_hash = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        key = hashlib.sha256(f"{self.backend.name}|{lang_code}|{voice}|{text_hash}".encode('utf-8')).hexdigest()[:24]
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+        filename = os.path.join(self.cache_dir, f"{lang_code}_{voice.replace('.', '-')}_{key}.{self.backend.extension}")
+        
+        cached = os.path.exists(filename)
+        if not cached:
+            # Write to a temp file first so a failed or concurrent run never leaves a partial cache entry
+            temp_path = f"{filename}.{uuid.uuid4().hex[:8]}.tmp"
+            try:
+                self.backend.synthesize(text, lang_code, voice, temp_path)
+                os.replace(temp_path, filename)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+        
+        return {
+            'filename': filename,
+            'size': os.path.getsize(filename),
+            'cached': cached,
+            'text_hash': text_hash,
+            'voice': voice,
+            'text': text[:100] + '...'
+        }
+    
+    def stream_audio(self, filename: str, chunk_size: int = None):
+        """Yield an audio file in chunks (for uploads) instead of loading it into memory"""
+        with open(filename, 'rb') as audio_file:
+            for chunk in iter(lambda: audio_file.read(chunk_size or self.STREAM_CHUNK_SIZE), b''):
+                yield chunk
 
 # =================== VISUAL AI ENGINE ===================
 
 class VisualAIEngine:
     """Generate and source images for articles"""
     
-    def __init__(self):
+    # Responsive widths and output formats (format, mime type, quality); AVIF only if Pillow supports it
+    IMAGE_WIDTHS = (400, 800, 1200)
+    IMAGE_FORMATS = (('avif', 'image/avif', 50), ('webp', 'image/webp', 80))
+    FETCH_TIMEOUT = 20
+    
+    # Placeholder colors and the shared data-URI cache (keyed by text and size)
+    PLACEHOLDER_BACKGROUND = '#4A5568'
+    PLACEHOLDER_FOREGROUND = '#FFFFFF'
+    PLACEHOLDER_CACHE: Dict[Tuple[str, int, int], str] = {}
+    
+    def __init__(self, styles: ArticleStyles = None, cache_dir: str = 'image_cache',
+                 public_url: str = None, max_workers: int = 4):
+        self.styles = styles or get_article_styles()
+        self.cache_dir = cache_dir
+        self.public_url = public_url.rstrip('/') if public_url else None
+        self.max_workers = max_workers
+        self.output_formats = [fmt for fmt in self.IMAGE_FORMATS if self._format_supported(fmt[0])]
+        
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        })
+        self._uploads = None
+        self._uploads_lock = threading.Lock()
+        self._upload_key_locks: Dict[str, threading.Lock] = {}
+        
         self.image_sources = [
             {
                 'name': 'Pollinations AI',
@@ -1140,45 +1893,322 @@ class VisualAIEngine:
         
         for i in range(num_images):
             image_type = self._get_image_type(i)
+            prompt = self._create_image_prompt(keywords, image_type)
+            width = 800 if i % 2 == 0 else 600
+            height = 450 if i % 2 == 0 else 400
             
-            # Try different sources
+            # Candidate URLs from every source, in priority order (fallbacks for prepare_images)
+            candidates = []
             for source in self.image_sources:
                 try:
                     if source['name'] == 'Pollinations AI':
-                        prompt = self._create_image_prompt(keywords, image_type)
                         clean_prompt = quote(prompt)
-                        width = 800 if i % 2 == 0 else 600
-                        height = 450 if i % 2 == 0 else 400
                         image_url = f"https://image.pollinations.ai/prompt/{clean_prompt}?width={width}&height={height}&nofilter=true"
                     elif source['name'] == 'Unsplash':
-                        width = 800 if i % 2 == 0 else 600
-                        height = 450 if i % 2 == 0 else 400
                         keyword = keywords[0] if keywords else 'technology'
                         image_url = f"https://source.unsplash.com/featured/{width}x{height}/?{keyword}&{i}"
                     else:
-                        width = 800 if i % 2 == 0 else 600
-                        height = 450 if i % 2 == 0 else 400
                         image_url = f"https://picsum.photos/{width}/{height}?random={i}"
                     
                     if image_url:
-                        images.append({
-                            'url': image_url,
-                            'alt': self._create_alt_text(keywords, image_type),
-                            'caption': self._create_caption(keywords, image_type),
-                            'source': source['name'],
-                            'position': i,
-                            'type': image_type
-                        })
-                        break
+                        candidates.append({'source': source['name'], 'url': image_url})
                         
                 except Exception as e:
                     continue
             
-            if len(images) <= i:
+            if candidates:
+                images.append({
+                    'url': candidates[0]['url'],
+                    'alt': self._create_alt_text(keywords, image_type),
+                    'caption': self._create_caption(keywords, image_type),
+                    'source': candidates[0]['source'],
+                    'position': i,
+                    'type': image_type,
+                    'prompt': prompt,
+                    'width': width,
+                    'height': height,
+                    'keywords': keywords,
+                    'candidates': candidates
+                })
+            else:
                 images.append(self._create_placeholder_image(keywords, i))
         
         return images
     
+    # =================== IMAGE PIPELINE (fetch, cache, optimize, upload) ===================
+    
+    @staticmethod
+    def _format_supported(image_format: str) -> bool:
+        if not PIL_AVAILABLE:
+            return False
+        try:
+            return bool(pil_features.check(image_format))
+        except ValueError:
+            # Older Pillow without this feature name
+            return False
+    
+    def prepare_images(self, images: List[Dict], wordpress=None) -> List[Dict]:
+        """Fetch, cache, optimize and upload images concurrently; images that fail keep their remote URL"""
+        
+        if not images:
+            return images
+        
+        print(f"🖼️  Preparing {len(images)} images (fetch, cache, optimize)...")
+        
+        workers = max(1, min(self.max_workers, len(images)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            prepared = list(executor.map(lambda image: self._prepare_image(image, wordpress), images))
+        
+        originals = [image['original'] for image in prepared if image.get('original')]
+        cached = sum(1 for original in originals if original['cached'])
+        variants = sum(len(image.get('variants', [])) for image in prepared)
+        uploaded = sum(1 for image in prepared for variant in image.get('variants', []) if variant.get('uploaded'))
+        placeholders = sum(1 for image in prepared if image.get('type') == 'placeholder')
+        ready = sum(1 for image in prepared if image.get('original') or image.get('type') == 'placeholder')
+        print(f"   ✅ {ready}/{len(images)} images ready ({cached} from cache, {placeholders} placeholders), "
+              f"{variants} optimized variants, {uploaded} uploaded")
+        
+        return prepared
+    
+    def _prepare_image(self, image: Dict, wordpress=None) -> Dict:
+        """Run one image through the pipeline"""
+        try:
+            if image.get('type') == 'placeholder':
+                # Rendered locally; without Pillow the inline SVG data URI is kept as is
+                if not self.output_formats:
+                    return image
+                original = self._render_placeholder(image)
+            else:
+                original = self._fetch_original(image)
+            
+            if not original:
+                if image.get('type') == 'placeholder':
+                    return image
+                # Every source failed: fall back to the local placeholder instead of a dead remote URL
+                print(f"⚠️  No image source responded for #{image.get('position')}, using local placeholder")
+                placeholder = self._create_placeholder_image(image.get('keywords', []), image.get('position', 0))
+                return self._prepare_image(placeholder, wordpress)
+            
+            prepared = {**image, 'original': original, 'source': original['source'],
+                        'variants': self._optimize(original, image)}
+            
+            if wordpress or self.public_url:
+                for asset in prepared['variants']:
+                    asset.update(self._publish_asset(asset['path'], asset['mime_type'], prepared, wordpress))
+                
+                if not prepared['variants']:
+                    # No Pillow (or SVG): serve the cached original instead
+                    published = self._publish_asset(original['path'], original['content_type'], prepared, wordpress)
+                    if published.get('url'):
+                        prepared['url'] = published['url']
+            
+            return prepared
+            
+        except Exception as e:
+            print(f"⚠️  Image preparation failed (#{image.get('position')}): {e}")
+            return image
+    
+    def _cache_key(self, image: Dict) -> str:
+        """Cache key from the prompt, requested size and slot (image types repeat, so prompts do too)"""
+        key_source = (f"{image.get('prompt') or image['url']}|{image.get('width')}x{image.get('height')}"
+                      f"|{image.get('position')}")
+        return hashlib.sha256(key_source.encode('utf-8')).hexdigest()[:24]
+    
+    def _fetch_original(self, image: Dict) -> Optional[Dict]:
+        """Download the first working candidate once; later calls with the same prompt read the disk cache"""
+        
+        originals_dir = os.path.join(self.cache_dir, 'originals')
+        os.makedirs(originals_dir, exist_ok=True)
+        
+        key = self._cache_key(image)
+        meta_path = os.path.join(originals_dir, f"{key}.json")
+        
+        if os.path.exists(meta_path):
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                if os.path.exists(meta['path']):
+                    return {**meta, 'cached': True}
+            except (OSError, ValueError, KeyError):
+                pass
+        
+        candidates = image.get('candidates') or [{'source': image.get('source'), 'url': image['url']}]
+        for candidate in candidates:
+            temp_path = None
+            try:
+                with self.session.get(candidate['url'], timeout=self.FETCH_TIMEOUT, stream=True) as response:
+                    content_type = response.headers.get('Content-Type', '').split(';')[0].strip()
+                    if response.status_code != 200 or not content_type.startswith('image/'):
+                        continue
+                    
+                    extension = content_type.split('/')[1].replace('jpeg', 'jpg').replace('svg+xml', 'svg')
+                    path = os.path.join(originals_dir, f"{key}.{extension}")
+                    temp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+                    with open(temp_path, 'wb') as f:
+                        for chunk in response.iter_content(64 * 1024):
+                            f.write(chunk)
+                    os.replace(temp_path, path)
+                
+                meta = {
+                    'key': key,
+                    'path': path,
+                    'url': candidate['url'],
+                    'source': candidate['source'],
+                    'content_type': content_type,
+                    'size': os.path.getsize(path)
+                }
+                with open(meta_path, 'w', encoding='utf-8') as f:
+                    json.dump(meta, f, indent=2)
+                return {**meta, 'cached': False}
+                
+            except (requests.RequestException, OSError) as e:
+                print(f"⚠️  Image fetch failed ({candidate['source']}): {e}")
+                continue
+            finally:
+                if temp_path and os.path.exists(temp_path):
+                    os.remove(temp_path)
+        
+        return None
+    
+    def _render_placeholder(self, image: Dict) -> Dict:
+        """PNG placeholder for the optimize/upload stages, cached by its content (text, size, colors)"""
+        
+        originals_dir = os.path.join(self.cache_dir, 'originals')
+        os.makedirs(originals_dir, exist_ok=True)
+        
+        text, width, height = image.get('text', ''), image.get('width', 800), image.get('height', 450)
+        key_source = f"placeholder|{text}|{width}x{height}|{self.PLACEHOLDER_BACKGROUND}|{self.PLACEHOLDER_FOREGROUND}"
+        key = hashlib.sha256(key_source.encode('utf-8')).hexdigest()[:24]
+        path = os.path.join(originals_dir, f"{key}.png")
+        
+        cached = os.path.exists(path)
+        if not cached:
+            canvas = Image.new('RGB', (width, height), self.PLACEHOLDER_BACKGROUND)
+            font_size = self._placeholder_font_size(text, width, height)
+            try:
+                font = ImageFont.load_default(size=font_size)
+            except TypeError:
+                # Pillow < 10.1: fixed-size bitmap font
+                font = ImageFont.load_default()
+            ImageDraw.Draw(canvas).text((width / 2, height / 2), text, fill=self.PLACEHOLDER_FOREGROUND,
+                                        font=font, anchor='mm')
+            
+            temp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+            try:
+                canvas.save(temp_path, 'PNG', optimize=True)
+                os.replace(temp_path, path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+        
+        return {
+            'key': key,
+            'path': path,
+            'url': image['url'],
+            'source': image.get('source', 'Local placeholder'),
+            'content_type': 'image/png',
+            'size': os.path.getsize(path),
+            'cached': cached
+        }
+    
+    def _optimize(self, original: Dict, image: Dict) -> List[Dict]:
+        """Responsive WebP/AVIF variants of the cached original (reused when already on disk)"""
+        
+        if not self.output_formats or original['content_type'] == 'image/svg+xml':
+            return []
+        
+        variants_dir = os.path.join(self.cache_dir, 'variants')
+        os.makedirs(variants_dir, exist_ok=True)
+        
+        variants = []
+        with Image.open(original['path']) as source:
+            source_width, source_height = source.size
+            if source.mode not in ('RGB', 'RGBA'):
+                source = source.convert('RGBA' if 'A' in source.getbands() or 'transparency' in source.info else 'RGB')
+            
+            # Never upscale; the largest variant is the original width capped at the largest IMAGE_WIDTHS entry
+            widths = sorted({width for width in self.IMAGE_WIDTHS if width < source_width}
+                            | {min(source_width, max(self.IMAGE_WIDTHS))})
+            
+            for width in widths:
+                height = max(1, round(source_height * width / source_width))
+                resized = None
+                
+                for image_format, mime_type, quality in self.output_formats:
+                    path = os.path.join(variants_dir, f"{original['key']}-{width}.{image_format}")
+                    
+                    if not os.path.exists(path):
+                        if resized is None:
+                            resized = source if width == source_width else source.resize((width, height), Image.LANCZOS)
+                        temp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+                        try:
+                            resized.save(temp_path, image_format.upper(), quality=quality)
+                            os.replace(temp_path, path)
+                        finally:
+                            if os.path.exists(temp_path):
+                                os.remove(temp_path)
+                    
+                    variants.append({
+                        'path': path,
+                        'width': width,
+                        'height': height,
+                        'format': image_format,
+                        'mime_type': mime_type,
+                        'size': os.path.getsize(path)
+                    })
+        
+        return variants
+    
+    def _upload_registry_path(self) -> str:
+        return os.path.join(self.cache_dir, 'uploads.json')
+    
+    def _publish_asset(self, path: str, mime_type: str, image: Dict, wordpress=None) -> Dict:
+        """Public URL for a cached file: WordPress media library if available, else IMAGE_PUBLIC_URL"""
+        if wordpress:
+            return self._upload_once(path, mime_type, image.get('alt'), wordpress)
+        relative = os.path.relpath(path, self.cache_dir).replace(os.sep, '/')
+        return {'url': f"{self.public_url}/{relative}"}
+    
+    def _upload_once(self, path: str, mime_type: str, alt_text: Optional[str], wordpress) -> Dict:
+        """Upload a file to the media library unless the same bytes were already uploaded to this site"""
+        
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        registry_key = f"{wordpress.wp_url}|{digest.hexdigest()}"
+        
+        with self._uploads_lock:
+            if self._uploads is None:
+                try:
+                    with open(self._upload_registry_path(), 'r', encoding='utf-8') as f:
+                        self._uploads = json.load(f)
+                except (OSError, ValueError):
+                    self._uploads = {}
+            key_lock = self._upload_key_locks.setdefault(registry_key, threading.Lock())
+        
+        # Workers holding identical bytes wait here, then reuse the first upload
+        with key_lock:
+            with self._uploads_lock:
+                entry = self._uploads.get(registry_key)
+            
+            if entry:
+                return {'url': entry['url'], 'media_id': entry['media_id'], 'uploaded': False}
+            
+            result = wordpress.upload_media(path, mime_type, alt_text=alt_text)
+            if not result.get('success'):
+                print(f"⚠️  Media upload failed: {result.get('error')}")
+                return {'url': None}
+            
+            with self._uploads_lock:
+                self._uploads[registry_key] = {'media_id': result['media_id'], 'url': result['url']}
+                temp_path = f"{self._upload_registry_path()}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._uploads, f, indent=2)
+                os.replace(temp_path, self._upload_registry_path())
+        
+        return {'url': result['url'], 'media_id': result['media_id'], 'uploaded': True}
+    
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract keywords from text"""
         stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
@@ -1234,28 +2264,66 @@ class VisualAIEngine:
         return captions.get(image_type, f"Related to {base}")
     
     def _create_placeholder_image(self, keywords: List[str], index: int) -> Dict:
-        """Create placeholder image"""
+        """Create placeholder image (inline SVG data URI, no external request)"""
         width = 800 if index % 2 == 0 else 600
         height = 450 if index % 2 == 0 else 400
         keyword = keywords[0] if keywords else 'content'
         
         return {
-            'url': f"https://via.placeholder.com/{width}x{height}/4A5568/FFFFFF?text={keyword.replace(' ', '+')}",
+            'url': self._placeholder_data_uri(keyword, width, height),
             'alt': f"placeholder for {keyword}",
             'caption': "Image placeholder - replace with relevant image",
-            'source': 'Placeholder.com',
+            'source': 'Local placeholder',
             'position': index,
-            'type': 'placeholder'
+            'type': 'placeholder',
+            'text': keyword,
+            'width': width,
+            'height': height
         }
     
+    @staticmethod
+    def _placeholder_font_size(text: str, width: int, height: int) -> int:
+        # Fit the text to ~90% of the width (average glyph ~0.6em), at most 1/6 of the height
+        return max(12, min(height // 6, int(width * 0.9 / max(1.0, len(text) * 0.6))))
+    
+    def _placeholder_data_uri(self, text: str, width: int, height: int) -> str:
+        """SVG placeholder as a data URI, built once per text and size"""
+        cache_key = (text, width, height)
+        data_uri = self.PLACEHOLDER_CACHE.get(cache_key)
+        if data_uri:
+            return data_uri
+        
+        font_size = self._placeholder_font_size(text, width, height)
+        svg = (
+            f"<svg xmlns='http://www.w3.org/2000/svg' width='{width}' height='{height}' viewBox='0 0 {width} {height}'>"
+            f"<rect width='100%' height='100%' fill='{self.PLACEHOLDER_BACKGROUND}'/>"
+            f"<text x='50%' y='50%' fill='{self.PLACEHOLDER_FOREGROUND}' font-family='sans-serif' "
+            f"font-size='{font_size}' text-anchor='middle' dominant-baseline='middle'>{html_escape(text)}</text></svg>"
+        )
+        
+        # Percent-encoded SVG is smaller than base64 and safe inside a double-quoted src
+        data_uri = "data:image/svg+xml;charset=utf-8," + quote(svg, safe="'=:/;,")
+        self.PLACEHOLDER_CACHE[cache_key] = data_uri
+        return data_uri
+    
     def embed_images_in_content(self, content: str, images: List[Dict]) -> str:
         """Embed images into content"""
         
         if not images:
             return content
         
-        paragraphs = re.split(r'\n\s*\n', content)
-        total_paragraphs = len(paragraphs)
+        document = ArticleDocument.parse(content)
+        if not self.embed_images_in_document(document, images):
+            return content
+        return document.to_html()
+    
+    def embed_images_in_document(self, document: ArticleDocument, images: List[Dict]) -> int:
+        """Insert image blocks after selected paragraphs; returns images inserted"""
+        
+        if not images:
+            return 0
+        
+        total_paragraphs = len(document)
         
         if total_paragraphs >= 8:
             positions = [2, 4, 6]
@@ -1266,29 +2334,67 @@ class VisualAIEngine:
         else:
             positions = [1] if total_paragraphs > 2 else [0]
         
-        result_paragraphs = []
-        image_index = 0
+        placements = []
+        for position in positions:
+            if position < total_paragraphs and len(placements) < len(images):
+                image_html = self._create_image_html(images[len(placements)])
+                placements.append((position + 1, image_html))
         
-        for i, paragraph in enumerate(paragraphs):
-            result_paragraphs.append(paragraph)
-            
-            if i in positions and image_index < len(images):
-                image_html = self._create_image_html(images[image_index])
-                result_paragraphs.append(image_html)
-                image_index += 1
-        
-        return '\n\n'.join(result_paragraphs)
+        return document.insert_many(placements, source='image')
     
     def _create_image_html(self, image_data: Dict) -> str:
         """Create image HTML"""
+        styles = self.styles
+        
+        variants = image_data.get('variants')
+        if variants and all(variant.get('url') for variant in variants):
+            return self._create_picture_html(image_data, variants)
         
         return f'''
-<div class="article-image" style="margin: 30px 0; text-align: center;">
+<div {styles.attrs('image')}>
     <img src="{image_data['url']}" 
          alt="{image_data['alt']}" 
-         style="max-width: 100%; height: auto; border-radius: 12px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); border: 1px solid #e2e8f0;"
+         {styles.attrs('image-img')}
          loading="lazy">
-    <p style="font-style: italic; color: #666; margin-top: 10px; font-size: 0.9em;">
+    <p {styles.attrs('image-caption')}>
+        {image_data['caption']} | Source: {image_data['source']}
+    </p>
+</div>
+'''
+    
+    def _create_picture_html(self, image_data: Dict, variants: List[Dict]) -> str:
+        """Responsive <picture> with AVIF/WebP srcset (largest WebP as the <img> fallback)"""
+        styles = self.styles
+        
+        display_width = image_data.get('width') or max(variant['width'] for variant in variants)
+        sizes = f"(max-width: {display_width}px) 100vw, {display_width}px"
+        
+        sources = []
+        for _, mime_type, _ in self.IMAGE_FORMATS:
+            srcset = ', '.join(f"{variant['url']} {variant['width']}w"
+                               for variant in variants if variant['mime_type'] == mime_type)
+            if srcset:
+                sources.append(f'        <source type="{mime_type}" srcset="{srcset}" sizes="{sizes}">')
+        
+        fallback = max((variant for variant in variants if variant['format'] == 'webp'),
+                       key=lambda variant: variant['width'], default=variants[-1])
+        sources_html = '\n'.join(sources)
+        
+        # Display size (keeps the aspect ratio) so the browser reserves space before loading
+        width = min(display_width, fallback['width'])
+        height = max(1, round(fallback['height'] * width / fallback['width']))
+        
+        return f'''
+<div {styles.attrs('image')}>
+    <picture>
+{sources_html}
+        <img src="{fallback['url']}" 
+             alt="{image_data['alt']}" 
+             width="{width}" height="{height}"
+             {styles.attrs('image-img')}
+             loading="lazy" decoding="async">
+    </picture>
+    <p {styles.attrs('image-caption')}>
         {image_data['caption']} | Source: {image_data['source']}
     </p>
 </div>
@@ -1667,7 +2773,8 @@ class ContentExpander:
 class YouTubeEmbedder:
     """YouTube video embedder"""
     
-    def __init__(self):
+    def __init__(self, styles: ArticleStyles = None):
+        self.styles = styles or get_article_styles()
         self.fallback_videos = {
             'technology': 'dQw4w9WgXcQ',
             'business': '3JluqTojuME',
@@ -1695,43 +2802,54 @@ class YouTubeEmbedder:
     def embed_video_in_content(self, content: str, video_data: Dict) -> str:
         """Embed YouTube video in content"""
         
-        video_html = f'''
-<div class="youtube-embed" style="margin: 40px 0; background: #f8f9fa; padding: 25px; border-radius: 10px; border-left: 5px solid #ff0000; box-shadow: 0 5px 15px rgba(0,0,0,0.05);">
-    <h3 style="margin-top: 0; color: #333;">📺 Watch Related Video</h3>
+        document = ArticleDocument.parse(content)
+        self.embed_video_in_document(document, video_data)
+        return document.to_html()
+    
+    def embed_video_in_document(self, document: ArticleDocument, video_data: Dict) -> int:
+        """Insert the video block a third of the way into the article"""
+        
+        insert_position = max(1, len(document) // 3)
+        document.insert(insert_position, self._create_video_html(video_data), source='video')
+        return 1
     
-    <div style="position: relative; padding-bottom: 56.25%; height: 0; overflow: hidden; margin: 20px 0; border-radius: 8px;">
+    def _create_video_html(self, video_data: Dict) -> str:
+        """Create YouTube embed HTML"""
+        styles = self.styles
+        
+        return f'''
+<div {styles.attrs('video')}>
+    <h3 {styles.attrs('video-title')}>📺 Watch Related Video</h3>
+    
+    <div {styles.attrs('video-frame')}>
         <iframe src="{video_data['embed_url']}" 
-                style="position: absolute; top: 0; left: 0; width: 100%; height: 100%; border: none; border-radius: 8px;"
+                {styles.attrs('video-iframe')}
                 frameborder="0" 
                 allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture" 
                 allowfullscreen>
         </iframe>
     </div>
     
-    <p style="text-align: center; margin-top: 15px;">
-        <a href="{video_data['watch_url']}" target="_blank" style="background: #ff0000; color: white; padding: 10px 20px; border-radius: 6px; text-decoration: none; font-weight: bold;">
+    <p {styles.attrs('video-actions')}>
+        <a href="{video_data['watch_url']}" target="_blank" {styles.attrs('video-button')}>
             🔗 Watch on YouTube
         </a>
     </p>
 </div>
 '''
-        
-        paragraphs = content.split('\n\n')
-        insert_position = max(1, len(paragraphs) // 3)
-        paragraphs.insert(insert_position, video_html)
-        
-        return '\n\n'.join(paragraphs)
 
 # =================== WORDPRESS PUBLISHER ===================
 
 class WordPressPublisher:
     """WordPress publisher"""
     
-    def __init__(self, wp_url: str, wp_username: str, app_password: str):
+    def __init__(self, wp_url: str, wp_username: str, app_password: str,
+                 minifier: HtmlMinifier = None):
         self.wp_url = wp_url.rstrip('/')
         self.wp_username = wp_username
         self.app_password = app_password
         self.api_url = f"{self.wp_url}/wp-json/wp/v2"
+        self.minifier = minifier
         
         self.auth = (self.wp_username, self.app_password)
         self.session = requests.Session()
@@ -1745,9 +2863,17 @@ class WordPressPublisher:
         
         print(f"🌐 Publishing {language.upper()} version to WordPress...")
         
+        content = article.get('content', '')
+        html_size = None
+        if self.minifier:
+            html_size = self.minifier.minify_report(content)
+            content = html_size.pop('html')
+            print(f"   🗜️  HTML minified: {html_size['original_bytes']:,} → {html_size['minified_bytes']:,} bytes "
+                  f"(-{html_size['saved_percent']}%)")
+        
         post_data = {
             'title': article.get('title', 'Untitled'),
-            'content': article.get('content', ''),
+            'content': content,
             'status': 'draft',
             'slug': self._generate_slug(article.get('title', '')),
             'lang': language
@@ -1768,7 +2894,47 @@ class WordPressPublisher:
                     'post_id': result.get('id'),
                     'link': result.get('link'),
                     'edit_link': result.get('link', '').replace('?p=', '/wp-admin/post.php?action=edit&post='),
-                    'language': language
+                    'language': language,
+                    'html_size': html_size
+                }
+            else:
+                return {
+                    'success': False,
+                    'error': f"HTTP {response.status_code}",
+                    'response': response.text[:200]
+                }
+                
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
+    def upload_media(self, file_path: str, mime_type: str, alt_text: str = None) -> Dict:
+        """Upload a file to the WordPress media library (streamed from disk)"""
+        
+        filename = os.path.basename(file_path)
+        
+        try:
+            with open(file_path, 'rb') as f:
+                response = self.session.post(
+                    f"{self.api_url}/media",
+                    data=f,
+                    headers={
+                        'Content-Type': mime_type,
+                        'Content-Disposition': f'attachment; filename="{filename}"'
+                    },
+                    params={'alt_text': alt_text} if alt_text else None,
+                    auth=self.auth,
+                    timeout=60
+                )
+            
+            if response.status_code in [200, 201]:
+                result = response.json()
+                return {
+                    'success': True,
+                    'media_id': result.get('id'),
+                    'url': result.get('source_url')
                 }
             else:
                 return {
@@ -1856,23 +3022,43 @@ class ProfitMachineV10:
         print("🚀 Initializing Profit Machine v10.0...")
         print("=" * 80)
         
+        # Shared article styling (inline styles or classes + one stylesheet)
+        self.article_styles = get_article_styles(
+            config_manager.get('ARTICLE_STYLE_MODE', 'inline'),
+            embed_stylesheet=config_manager.get('EMBED_ARTICLE_STYLESHEET', True)
+        )
+        
         # Initialize all engines
         self.ai_generator = AIContentGenerator(
             groq_api_key=config_manager.get('GROQ_API_KEY')
         )
         
         self.content_expander = ContentExpander()
-        self.voice_engine = VoiceAIEngine()
-        self.visual_engine = VisualAIEngine()
-        self.youtube_embedder = YouTubeEmbedder()
+        self.voice_engine = VoiceAIEngine(
+            cache_dir=config_manager.get('AUDIO_CACHE_DIR', 'audio_output/cache'),
+            max_workers=config_manager.get('AUDIO_MAX_WORKERS', 4)
+        )
+        self.visual_engine = VisualAIEngine(
+            self.article_styles,
+            cache_dir=config_manager.get('IMAGE_CACHE_DIR', 'image_cache'),
+            public_url=config_manager.get('IMAGE_PUBLIC_URL'),
+            max_workers=config_manager.get('IMAGE_MAX_WORKERS', 4)
+        )
+        self.youtube_embedder = YouTubeEmbedder(self.article_styles)
         self.topic_selector = SmartTopicSelector()
         
         # Enhanced components
         self.database = PersistentDatabaseManager()
         self.revenue_calculator = SmartRevenueCalculator()
-        self.affiliate_manager = SafeAffiliateManager(config_manager)
-        self.content_formatter = AdvancedContentFormatter(config_manager)
-        self.performance_monitor = PerformanceMonitor()
+        self.scenario_simulator = None
+        if NUMPY_AVAILABLE and config_manager.get('REVENUE_SCENARIOS', True):
+            self.scenario_simulator = RevenueScenarioSimulator(self.revenue_calculator)
+        self.affiliate_manager = SafeAffiliateManager(config_manager, self.article_styles)
+        self.content_formatter = AdvancedContentFormatter(config_manager, self.article_styles)
+        self.performance_monitor = PerformanceMonitor(
+            config_manager.get('PERFORMANCE_SAMPLE_INTERVAL', 0.5),
+            config_manager.get('TRACE_ALLOCATIONS', False)
+        )
         
         # Initialize publishers
         self.wordpress = None
@@ -1881,7 +3067,8 @@ class ProfitMachineV10:
         wp_pass = config_manager.get('WP_PASSWORD')
         
         if wp_url and wp_user and wp_pass:
-            self.wordpress = WordPressPublisher(wp_url, wp_user, wp_pass)
+            minifier = get_html_minifier() if config_manager.get('MINIFY_HTML', True) else None
+            self.wordpress = WordPressPublisher(wp_url, wp_user, wp_pass, minifier)
         
         # Initialize Telegram
         self.telegram = None
@@ -1952,28 +3139,27 @@ class ProfitMachineV10:
                 topic, 
                 num_images=self.config.get('IMAGE_COUNT', 4)
             )
+            if self.config.get('OPTIMIZE_IMAGES', True):
+                images = self.visual_engine.prepare_images(images, self.wordpress)
             
-            content_with_images = self.visual_engine.embed_images_in_content(
-                base_article['content'],
-                images
-            )
+            # Parse once; images, video and affiliate links are inserted into
+            # the same document and serialized once before formatting
+            document = ArticleDocument.parse(base_article['content'])
+            self.visual_engine.embed_images_in_document(document, images)
             
             self.performance_monitor.log_component('image_generation', time.time() - images_start)
             
             # 5. Add YouTube video
             video_start = time.time()
             video_data = self.youtube_embedder.find_relevant_video(topic, category)
-            content_with_video = self.youtube_embedder.embed_video_in_content(
-                content_with_images,
-                video_data
-            )
+            self.youtube_embedder.embed_video_in_document(document, video_data)
             
             self.performance_monitor.log_component('video_embedding', time.time() - video_start)
             
             # 6. Add affiliate links
             affiliate_start = time.time()
-            content_with_affiliates, affiliate_count = self.affiliate_manager.embed_affiliate_links(
-                content_with_video,
+            affiliate_count = self.affiliate_manager.embed_affiliate_links_in_document(
+                document,
                 topic,
                 category
             )
@@ -1983,7 +3169,7 @@ class ProfitMachineV10:
             # 7. Advanced formatting
             formatting_start = time.time()
             formatted_content = self.content_formatter.format_content(
-                content_with_affiliates,
+                document.to_html(),
                 topic
             )
             
@@ -1992,7 +3178,7 @@ class ProfitMachineV10:
             # Update article with all enhancements
             final_article = {
                 'title': topic,
-                'content': formatted_content,
+                'content': self.article_styles.attach_stylesheet(formatted_content),
                 'word_count': len(formatted_content.split()),
                 'category': category,
                 'images_count': len(images),
@@ -2010,14 +3196,26 @@ class ProfitMachineV10:
                 country='US'
             )
             
+            revenue_scenarios = None
+            if self.scenario_simulator:
+                revenue_scenarios = self.scenario_simulator.simulate_article(
+                    final_article,
+                    category=category,
+                    language='en',
+                    country='US',
+                    samples=int(self.config.get('REVENUE_SCENARIO_SAMPLES', 100000))
+                )
+            
             self.performance_monitor.log_component('revenue_calculation', time.time() - revenue_start)
             
-            # 9. Create audio (optional)
+            # 9. Create audio (optional, languages synthesized concurrently and cached)
             audio_data = None
-            if TTS_AVAILABLE:
+            if self.voice_engine.backend:
                 audio_start = time.time()
-                audio_data = self.voice_engine.create_audio_summary(formatted_content, 'en')
-                if audio_data.get('success'):
+                audio_data = self.voice_engine.create_audio_summaries(
+                    formatted_content, self.config.get('AUDIO_LANGUAGES', ['en'])
+                )
+                if any(result.get('success') for result in audio_data.values()):
                     final_article['has_audio'] = True
                 self.performance_monitor.log_component('audio_generation', time.time() - audio_start)
             
@@ -2070,6 +3268,7 @@ class ProfitMachineV10:
                     'published': final_article.get('published', False)
                 },
                 'revenue_estimate': revenue_estimate,
+                'revenue_scenarios': revenue_scenarios,
                 'performance_report': performance_report,
                 'stats_report': stats_report,
                 'total_execution_time': total_time
@@ -2101,6 +3300,9 @@ class ProfitMachineV10:
             print(f"🖼️ Images: {final_article['images_count']}")
             print(f"🔗 Affiliate Links: {final_article['affiliate_links_count']}")
             print(f"💰 Monthly Revenue Estimate: ${revenue_estimate['monthly_estimate']:.2f}")
+            if revenue_scenarios:
+                print(f"🎲 Revenue Scenarios: P10 ${revenue_scenarios['p10']:.2f} | "
+                      f"P50 ${revenue_scenarios['p50']:.2f} | P90 ${revenue_scenarios['p90']:.2f}")
             print(f"⚡ Execution Time: {total_time:.1f}s")
             print(f"📄 Report File: {report_file}")
             
@@ -2125,6 +3327,9 @@ class ProfitMachineV10:
                 'error': str(e),
                 'total_execution_time': error_time
             }
+        
+        finally:
+            self.performance_monitor.stop()
 
 # =================== MAIN EXECUTION ===================
 
@@ -2175,7 +3380,7 @@ jobs:
     - name: Install dependencies
       run: |
         python -m pip install --upgrade pip
-        pip install requests groq gtts pygame psutil
+        pip install requests groq gtts pygame psutil pillow
         
     - name: Create directories
       run: |
@@ -2199,7 +3404,8 @@ jobs:
       run: |
         git config --global user.email "actions@github.com"
         git config --global user.name "GitHub Actions"
-        git add data/
+        # The compressed database snapshot and its backup state are committed by
+        # backup_to_github and restored by PersistentDatabaseManager on the next run
         git add reports/
         git commit -m "Database backup $(date +'%Y-%m-%d %H:%M')" || echo "No changes to commit"
         git pull --rebase
@@ -2221,6 +3427,27 @@ jobs:
             print("3. Commit and push to GitHub")
             print("4. Profit Machine will run daily at 8:00 AM")
             return True
+        
+        if sys.argv[1] == '--check-indexes':
+            database = PersistentDatabaseManager()
+            print(f"\n🔍 Schema version: {database.schema_version}")
+            report = database.check_indexes()
+            for name, result in report.items():
+                print(f"{'✅' if result['uses_index'] else '❌'} {name}: {' | '.join(result['plan'])}")
+            return all(result['uses_index'] for result in report.values())
+        
+        if sys.argv[1] == '--export':
+            # --export [--since YYYY-MM-DD] | --export --incremental
+            since = sys.argv[sys.argv.index('--since') + 1] if '--since' in sys.argv[2:-1] else None
+            PersistentDatabaseManager().export_to_jsonl(since, incremental='--incremental' in sys.argv)
+            return True
+        
+        if sys.argv[1] == '--rebuild-stats':
+            print("\n📊 Rebuilding database statistics...")
+            stats = PersistentDatabaseManager().rebuild_statistics()
+            print(f"✅ Statistics rebuilt: {stats['total_articles']} articles, "
+                  f"{stats['total_words']} words, ${stats['total_revenue_estimate']}")
+            return True
     
     # Check minimum requirements
     if not config_manager.get('GROQ_API_KEY'):
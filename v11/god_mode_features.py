@@ -18,7 +18,6 @@ import os
 import sys
 import json
 import time
-import sqlite3
 import threading
 import hashlib
 import base64
@@ -26,13 +25,22 @@ import random
 import re
 import uuid
 import subprocess
-import shutil
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple, Set
 from urllib.parse import quote, urlencode
 import concurrent.futures
 import traceback
 
+# Shared SQLite access layer (utils/db_access.py)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.db_access import get_connection
+from utils.db_migrations import Migration, apply_migrations, check_query_plans
+from utils.db_export import StreamingExporter
+from utils.db_backup import DatabaseBackup
+from utils.article_document import ArticleDocument
+from utils.article_styles import ArticleStyles, get_article_styles
+from utils.html_minifier import get_html_minifier
+
 # =================== DEPENDENCY CHECK ===================
 
 print("🔧 Checking dependencies for GOD MODE v11.0...")
@@ -134,7 +142,14 @@ class GodModeConfig:
             'PARALLEL_PROCESSING': True,
             'MAX_WORKERS': 4,
             'CACHE_ENABLED': True,
-            'CACHE_TTL_HOURS': 24
+            'CACHE_TTL_HOURS': 24,
+            
+            # Article Styling ('inline' style attributes or 'class' + shared stylesheet)
+            'ARTICLE_STYLE_MODE': 'inline',
+            'EMBED_ARTICLE_STYLESHEET': True,
+            
+            # Export
+            'MINIFY_HTML': True
         }
         
         # Load from environment variables
@@ -164,8 +179,9 @@ class GodModeConfig:
 class AIPoweredInternalLinker:
     """AI-powered internal linking system"""
     
-    def __init__(self, database_manager):
+    def __init__(self, database_manager, styles: ArticleStyles = None):
         self.db = database_manager
+        self.styles = styles or get_article_styles()
         self.link_cache = {}
         self.semantic_cache = {}
         
@@ -246,26 +262,21 @@ class AIPoweredInternalLinker:
                                    category: str) -> List[Dict]:
         """Query database for relevant articles"""
         
-        # Connect to database
-        conn = sqlite3.connect('data/profit_machine_v11.db')
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        # Shared long-lived connection
+        db = get_connection('data/profit_machine_v11.db')
         
         # Build query
         keyword_terms = [kw[0] for kw in keywords[:5]]
         
         query = '''
-        SELECT id, title, content, category, created_at, views, revenue_estimate
-        FROM articles 
+        SELECT id, title, content, category, created_at, 0 AS views, revenue_estimate
+        FROM articles_v11 
         WHERE category = ? AND published = 1
         ORDER BY created_at DESC 
         LIMIT 50
         '''
         
-        cursor.execute(query, (category,))
-        articles = [dict(row) for row in cursor.fetchall()]
-        
-        conn.close()
+        articles = db.query(query, (category,))
         
         # Filter by keyword relevance
         relevant_articles = []
@@ -358,28 +369,36 @@ class AIPoweredInternalLinker:
         if not links:
             return content
         
-        paragraphs = content.split('\n\n')
+        document = ArticleDocument.parse(content)
+        if not self.apply_internal_links_to_document(document, links):
+            return content
+        return document.to_html()
+    
+    def apply_internal_links_to_document(self, document: ArticleDocument, links: List[Dict]) -> int:
+        """Insert internal link cards into a parsed article; returns links inserted"""
         
+        inserted = 0
         for link in links:
             position = link['link_position']
-            if position < len(paragraphs):
-                link_html = self._create_link_html(link)
-                paragraphs.insert(position, link_html)
+            if position < len(document):
+                document.insert(position, self._create_link_html(link), source='internal_link')
+                inserted += 1
         
-        return '\n\n'.join(paragraphs)
+        return inserted
     
     def _create_link_html(self, link_data: Dict) -> str:
         """Create internal link HTML"""
+        styles = self.styles
         
         return f'''
-<div class="internal-link" style="background: #f0f9ff; border-left: 4px solid #3182ce; padding: 15px; margin: 20px 0; border-radius: 0 8px 8px 0;">
-<p style="margin: 0; color: #2d3748;">
+<div {styles.attrs('internal-link')}>
+<p {styles.attrs('internal-link-text')}>
 <strong>📚 Related Reading:</strong> 
-<a href="{link_data.get('url', '#')}" style="color: #2b6cb0; font-weight: bold; text-decoration: none;">
+<a href="{link_data.get('url', '#')}" {styles.attrs('internal-link-anchor')}>
 {link_data['anchor_text']}
 </a>
 </p>
-<p style="margin: 10px 0 0 0; font-size: 0.9em; color: #718096;">
+<p {styles.attrs('internal-link-excerpt')}>
 {link_data.get('title', '')[:100]}...
 </p>
 </div>
@@ -1491,7 +1510,9 @@ class MultiModelContentVerifier:
 class AdSenseSafeGuard:
     """Google AdSense compliance protection system"""
     
-    def __init__(self):
+    def __init__(self, styles: ArticleStyles = None):
+        self.styles = styles or get_article_styles()
+        
         # AdSense prohibited content categories
         self.prohibited_categories = {
             'high_risk': {
@@ -1785,16 +1806,17 @@ class AdSenseSafeGuard:
     
     def _create_educational_disclaimer(self) -> str:
         """Create educational disclaimer"""
+        styles = self.styles
         
-        return '''
-<div class="adsense-disclaimer" style="background: #fff3cd; border: 1px solid #ffeaa7; padding: 20px; border-radius: 8px; margin-bottom: 30px; font-size: 0.9em;">
-<h3 style="margin-top: 0; color: #856404;">📚 Educational & Informational Purpose</h3>
-<p style="margin: 10px 0; color: #856404;">
+        return f'''
+<div {styles.attrs('disclaimer')}>
+<h3 {styles.attrs('disclaimer-title')}>📚 Educational & Informational Purpose</h3>
+<p {styles.attrs('disclaimer-text')}>
 <strong>Important Notice:</strong> This article is created for <strong>educational and informational purposes only</strong>. 
 It does not constitute professional advice, endorsement, or promotion of any products, services, or activities 
 that may be restricted or prohibited by platform policies.
 </p>
-<p style="margin: 10px 0; color: #856404;">
+<p {styles.attrs('disclaimer-text')}>
 The content is intended to provide general information and foster discussion. 
 Always conduct your own research and consult with appropriate professionals 
 before making any decisions based on the information presented here.
@@ -1834,6 +1856,30 @@ before making any decisions based on the information presented here.
 class ProfitMachineV11:
     """Profit Machine v11.0 - The God Mode - Complete Digital Business Suite"""
     
+    # Schema migrations, applied on startup (PRAGMA user_version)
+    DB_MIGRATIONS = [
+        Migration(1, "Indexes for internal linking, recent articles and link/post lookups", [
+            "CREATE INDEX IF NOT EXISTS idx_articles_v11_category_published_created "
+            "ON articles_v11 (category, published, created_at)",
+            "CREATE INDEX IF NOT EXISTS idx_articles_v11_created_at ON articles_v11 (created_at)",
+            "CREATE INDEX IF NOT EXISTS idx_social_posts_article ON social_posts (article_id)",
+            "CREATE INDEX IF NOT EXISTS idx_internal_links_source ON internal_links (source_article_id)",
+            "CREATE INDEX IF NOT EXISTS idx_internal_links_target ON internal_links (target_article_id)"
+        ])
+    ]
+    
+    # Hot queries that must be served by an index (see check_indexes)
+    DB_HOT_QUERIES = {
+        'internal_linker': (
+            "SELECT id, title, content, category, created_at, revenue_estimate FROM articles_v11 "
+            "WHERE category = ? AND published = 1 ORDER BY created_at DESC LIMIT 50",
+            ('technology',)
+        ),
+        'recent_articles': ("SELECT * FROM articles_v11 ORDER BY created_at DESC LIMIT 20", ()),
+        'article_social_posts': ("SELECT * FROM social_posts WHERE article_id = ?", (1,)),
+        'article_internal_links': ("SELECT * FROM internal_links WHERE source_article_id = ?", (1,))
+    }
+    
     def __init__(self, config_path: str = 'config_v11.json'):
         print("=" * 80)
         print("🏆 PROFIT MACHINE v11.0 - THE GOD MODE")
@@ -1885,7 +1931,7 @@ class ProfitMachineV11:
         """Initialize core v10 components"""
         
         # Database
-        self.db = sqlite3.connect(self.config['DATABASE_PATH'])
+        self.db = get_connection(self.config['DATABASE_PATH'])
         self._init_database()
         
         # Groq AI client
@@ -1911,8 +1957,14 @@ class ProfitMachineV11:
     def _initialize_god_mode_components(self):
         """Initialize GOD MODE components"""
         
+        # Shared article styling (inline styles or classes + one stylesheet)
+        self.article_styles = get_article_styles(
+            self.god_mode_config.get('ARTICLE_STYLE_MODE', 'inline'),
+            embed_stylesheet=self.god_mode_config.get('EMBED_ARTICLE_STYLESHEET', True)
+        )
+        
         # Internal Linker
-        self.internal_linker = AIPoweredInternalLinker(self.db)
+        self.internal_linker = AIPoweredInternalLinker(self.db, self.article_styles)
         
         # Social Media Poster
         social_config = {
@@ -1935,84 +1987,91 @@ class ProfitMachineV11:
             self.content_verifier = None
         
         # AdSense Guard
-        self.adsense_guard = AdSenseSafeGuard()
+        self.adsense_guard = AdSenseSafeGuard(self.article_styles)
+        
+        # HTML minifier for exported articles
+        self.html_minifier = get_html_minifier() if self.god_mode_config.get('MINIFY_HTML', True) else None
         
         print("✅ GOD MODE components initialized")
     
     def _init_database(self):
         """Initialize database tables"""
         
-        cursor = self.db.cursor()
-        
-        # Articles table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS articles_v11 (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                content TEXT,
-                category TEXT,
-                word_count INTEGER,
-                images_count INTEGER DEFAULT 0,
-                internal_links_count INTEGER DEFAULT 0,
-                affiliate_links_count INTEGER DEFAULT 0,
-                has_video BOOLEAN DEFAULT 0,
-                has_audio BOOLEAN DEFAULT 0,
-                verification_score REAL,
-                adsense_risk_score REAL,
-                revenue_estimate REAL,
-                social_content_json TEXT,
-                published BOOLEAN DEFAULT 0,
-                publish_date TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Social media posts table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS social_posts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                article_id INTEGER,
-                platform TEXT,
-                content TEXT,
-                posted BOOLEAN DEFAULT 0,
-                post_date TEXT,
-                engagement_data TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (article_id) REFERENCES articles_v11 (id)
-            )
-        ''')
-        
-        # Internal links table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS internal_links (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                source_article_id INTEGER,
-                target_article_id INTEGER,
-                anchor_text TEXT,
-                relevance_score REAL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (source_article_id) REFERENCES articles_v11 (id),
-                FOREIGN KEY (target_article_id) REFERENCES articles_v11 (id)
-            )
-        ''')
-        
-        # Performance metrics
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS performance_metrics (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                execution_date TEXT,
-                articles_created INTEGER,
-                total_words INTEGER,
-                total_revenue_estimate REAL,
-                avg_verification_score REAL,
-                avg_adsense_risk_score REAL,
-                social_posts_scheduled INTEGER,
-                execution_time_seconds REAL
-            )
-        ''')
+        with self.db.transaction() as cursor:
+            # Articles table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS articles_v11 (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL,
+                    content TEXT,
+                    category TEXT,
+                    word_count INTEGER,
+                    images_count INTEGER DEFAULT 0,
+                    internal_links_count INTEGER DEFAULT 0,
+                    affiliate_links_count INTEGER DEFAULT 0,
+                    has_video BOOLEAN DEFAULT 0,
+                    has_audio BOOLEAN DEFAULT 0,
+                    verification_score REAL,
+                    adsense_risk_score REAL,
+                    revenue_estimate REAL,
+                    social_content_json TEXT,
+                    published BOOLEAN DEFAULT 0,
+                    publish_date TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+        
+            # Social media posts table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS social_posts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    article_id INTEGER,
+                    platform TEXT,
+                    content TEXT,
+                    posted BOOLEAN DEFAULT 0,
+                    post_date TEXT,
+                    engagement_data TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (article_id) REFERENCES articles_v11 (id)
+                )
+            ''')
         
-        self.db.commit()
+            # Internal links table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS internal_links (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    source_article_id INTEGER,
+                    target_article_id INTEGER,
+                    anchor_text TEXT,
+                    relevance_score REAL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (source_article_id) REFERENCES articles_v11 (id),
+                    FOREIGN KEY (target_article_id) REFERENCES articles_v11 (id)
+                )
+            ''')
+        
+            # Performance metrics
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS performance_metrics (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    execution_date TEXT,
+                    articles_created INTEGER,
+                    total_words INTEGER,
+                    total_revenue_estimate REAL,
+                    avg_verification_score REAL,
+                    avg_adsense_risk_score REAL,
+                    social_posts_scheduled INTEGER,
+                    execution_time_seconds REAL
+                )
+            ''')
+
+        
+        self.schema_version = apply_migrations(self.db, self.DB_MIGRATIONS)
+    
+    def check_indexes(self) -> Dict:
+        """EXPLAIN QUERY PLAN for the hot queries"""
+        return check_query_plans(self.db, self.DB_HOT_QUERIES)
     
     def execute_god_mode(self) -> Dict:
         """Execute GOD MODE - Complete automation"""
@@ -2087,8 +2146,11 @@ class ProfitMachineV11:
                 content, category, max_links=5
             )
             
+            # Internal links and the comparison table share one parsed document
+            document = ArticleDocument.parse(content)
+            
             if internal_links:
-                content = self.internal_linker.apply_internal_links(content, internal_links)
+                self.internal_linker.apply_internal_links_to_document(document, internal_links)
                 print(f"   Added {len(internal_links)} internal links")
             else:
                 print("   ⚠️  No relevant internal links found")
@@ -2103,10 +2165,12 @@ class ProfitMachineV11:
                 
                 if comparison_result:
                     # Insert comparison table
-                    content = self._insert_comparison_table(content, comparison_result['html_table'])
+                    self._insert_comparison_table_into_document(document, comparison_result['html_table'])
                     comparison_added = True
                     print(f"   Added product comparison with {len(comparison_result['products'])} products")
             
+            content = document.to_html()
+            
             # Step 7: Expand Content
             print("\n📈 Step 7: Expanding content for depth...")
             expanded_content = self.content_expander.expand_content(
@@ -2156,7 +2220,7 @@ class ProfitMachineV11:
             
             final_article = {
                 'title': topic,
-                'content': content_with_video,
+                'content': self.article_styles.attach_stylesheet(content_with_video),
                 'word_count': word_count,
                 'category': category,
                 'images_count': len(images),
@@ -2291,94 +2355,85 @@ class ProfitMachineV11:
                            social_content: Dict, internal_links: List[Dict]) -> int:
         """Save article to database"""
         
-        cursor = self.db.cursor()
-        
-        cursor.execute('''
-            INSERT INTO articles_v11 
-            (title, content, category, word_count, images_count, 
-             internal_links_count, affiliate_links_count, has_video,
-             verification_score, adsense_risk_score, revenue_estimate,
-             social_content_json, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            article['title'],
-            article['content'],
-            article['category'],
-            article['word_count'],
-            article['images_count'],
-            article.get('internal_links_count', 0),
-            article.get('affiliate_links_count', 0),
-            article.get('has_video', 0),
-            verification_score,
-            adsense_risk,
-            revenue['monthly_estimate'],
-            json.dumps(social_content),
-            datetime.now().isoformat()
-        ))
-        
-        article_id = cursor.lastrowid
-        
-        # Save internal links
-        for link in internal_links:
+        with self.db.transaction() as cursor:
             cursor.execute('''
+                INSERT INTO articles_v11 
+                (title, content, category, word_count, images_count, 
+                 internal_links_count, affiliate_links_count, has_video,
+                 verification_score, adsense_risk_score, revenue_estimate,
+                 social_content_json, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                article['title'],
+                article['content'],
+                article['category'],
+                article['word_count'],
+                article['images_count'],
+                article.get('internal_links_count', 0),
+                article.get('affiliate_links_count', 0),
+                article.get('has_video', 0),
+                verification_score,
+                adsense_risk,
+                revenue['monthly_estimate'],
+                json.dumps(social_content),
+                datetime.now().isoformat()
+            ))
+            
+            article_id = cursor.lastrowid
+            
+            # Save internal links
+            cursor.executemany('''
                 INSERT INTO internal_links 
                 (source_article_id, target_article_id, anchor_text, relevance_score)
                 VALUES (?, ?, ?, ?)
-            ''', (
-                article_id,
-                link.get('id', 0),
-                link.get('anchor_text', ''),
-                link.get('relevance_score', 0)
-            ))
+            ''', [
+                (
+                    article_id,
+                    link.get('id', 0),
+                    link.get('anchor_text', ''),
+                    link.get('relevance_score', 0)
+                )
+                for link in internal_links
+            ])
         
-        self.db.commit()
         return article_id
     
     def _save_social_posts(self, article_id: int, social_content: Dict):
         """Save social media posts to database"""
         
-        cursor = self.db.cursor()
-        
-        for platform, content in social_content.items():
-            if content:
-                cursor.execute('''
-                    INSERT INTO social_posts 
-                    (article_id, platform, content, post_date)
-                    VALUES (?, ?, ?, ?)
-                ''', (
-                    article_id,
-                    platform,
-                    content['text'],
-                    content.get('scheduled_time', datetime.now()).isoformat()
-                ))
-        
-        self.db.commit()
+        self.db.executemany('''
+            INSERT INTO social_posts 
+            (article_id, platform, content, post_date)
+            VALUES (?, ?, ?, ?)
+        ''', [
+            (
+                article_id,
+                platform,
+                content['text'],
+                content.get('scheduled_time', datetime.now()).isoformat()
+            )
+            for platform, content in social_content.items() if content
+        ])
     
     def _insert_comparison_table(self, content: str, table_html: str) -> str:
         """Insert comparison table into content"""
         
+        document = ArticleDocument.parse(content)
+        self._insert_comparison_table_into_document(document, table_html)
+        return document.to_html()
+    
+    def _insert_comparison_table_into_document(self, document: ArticleDocument, table_html: str):
+        """Insert comparison table before the conclusion heading (or the last 3 blocks)"""
+        
         # Find a good position (after main content, before conclusion)
-        if 'Conclusion' in content:
-            return content.replace(
-                '<h2>Conclusion</h2>',
-                f'{table_html}\n\n<h2>Conclusion</h2>'
-            )
-        elif 'conclusion' in content.lower():
-            # Find conclusion heading
-            lines = content.split('\n')
-            for i, line in enumerate(lines):
-                if 'conclusion' in line.lower() and any(tag in line.lower() for tag in ['<h2', '<h3']):
-                    lines.insert(i, table_html)
-                    return '\n'.join(lines)
-        
-        # Default: insert before last 3 paragraphs
-        paragraphs = content.split('\n\n')
-        if len(paragraphs) > 6:
-            insert_pos = len(paragraphs) - 3
-            paragraphs.insert(insert_pos, table_html)
-            return '\n\n'.join(paragraphs)
-        
-        return content + '\n\n' + table_html
+        conclusion_index = document.find_heading('conclusion')
+        if conclusion_index is not None:
+            document.insert(conclusion_index, table_html, source='comparison')
+        elif len(document) > 6:
+            # Default: insert before last 3 paragraphs
+            document.insert(len(document) - 3, table_html, source='comparison')
+        else:
+            document.append(table_html, source='comparison')
     
     def _export_article(self, article_id: int, article: Dict, social_content: Dict):
         """Export article to file"""
@@ -2389,13 +2444,19 @@ class ProfitMachineV11:
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
-        # Export article content
+        # Export article content (metadata header comments are kept as written)
+        content = article['content']
+        html_size = None
+        if self.html_minifier:
+            html_size = self.html_minifier.minify_report(content)
+            content = html_size['html']
+        
         article_file = f'exports/articles/article_{article_id}_{timestamp}.html'
         with open(article_file, 'w', encoding='utf-8') as f:
             f.write(f"<!-- Article ID: {article_id} -->\n")
             f.write(f"<!-- Generated: {timestamp} -->\n")
             f.write(f"<!-- Title: {article['title']} -->\n\n")
-            f.write(article['content'])
+            f.write(content)
         
         # Export social media content
         social_file = f'exports/social/social_{article_id}_{timestamp}.json'
@@ -2403,6 +2464,9 @@ class ProfitMachineV11:
             json.dump(social_content, f, indent=2)
         
         print(f"   📄 Article exported: {article_file}")
+        if html_size:
+            print(f"   🗜️  HTML minified: {html_size['original_bytes']:,} → {html_size['minified_bytes']:,} bytes "
+                  f"(-{html_size['saved_percent']}%)")
         print(f"   📱 Social content exported: {social_file}")
     
     def _backup_database(self):
@@ -2412,32 +2476,39 @@ class ProfitMachineV11:
         os.makedirs(backup_dir, exist_ok=True)
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_file = f'{backup_dir}/database_v11_{timestamp}.db'
         
-        # Copy database file
-        shutil.copy2(self.config['DATABASE_PATH'], backup_file)
+        # Consistent online copy via the SQLite backup API (gzip, keeps last 7)
+        result = DatabaseBackup(self.config['DATABASE_PATH'], backup_dir, prefix='database_v11').backup()
+        
+        if not result['success']:
+            print(f"   ⚠️  Database backup failed: {result.get('error')}")
+            return
+        
+        if result['skipped']:
+            print(f"   💾 Database unchanged since last backup: {result['path']}")
+            return
         
         # Also export to JSON
         json_file = f'{backup_dir}/database_v11_{timestamp}.json'
         self._export_database_to_json(json_file)
         
-        print(f"   💾 Database backed up: {backup_file}")
+        print(f"   💾 Database backed up: {result['path']}")
     
     def _export_database_to_json(self, json_file: str):
         """Export database to JSON"""
         
-        cursor = self.db.cursor()
-        
-        # Get recent articles
-        cursor.execute('SELECT * FROM articles_v11 ORDER BY created_at DESC LIMIT 20')
-        articles = [dict(row) for row in cursor.fetchall()]
-        
-        # Get statistics
-        cursor.execute('SELECT COUNT(*) as total_articles FROM articles_v11')
-        total_articles = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT SUM(word_count) as total_words FROM articles_v11')
-        total_words = cursor.fetchone()[0] or 0
+        # One read transaction so the articles and totals come from the same snapshot
+        with self.db.transaction(immediate=False) as cursor:
+            # Get recent articles
+            cursor.execute('SELECT * FROM articles_v11 ORDER BY created_at DESC LIMIT 20')
+            articles = [dict(row) for row in cursor.fetchall()]
+            
+            # Get statistics
+            cursor.execute('SELECT COUNT(*) as total_articles FROM articles_v11')
+            total_articles = cursor.fetchone()[0]
+            
+            cursor.execute('SELECT SUM(word_count) as total_words FROM articles_v11')
+            total_words = cursor.fetchone()[0] or 0
         
         data = {
             'export_date': datetime.now().isoformat(),
@@ -2450,6 +2521,10 @@ class ProfitMachineV11:
         with open(json_file, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, default=str)
     
+    def export_database_to_jsonl(self, since: Optional[str] = None, incremental: bool = False) -> List[Dict]:
+        """Stream the v11 tables to exports/database/*.jsonl.gz"""
+        return export_v11_database(self.config['DATABASE_PATH'], since, incremental)
+    
     def _save_report(self, report: Dict):
         """Save execution report"""
         
@@ -2627,6 +2702,22 @@ class SmartRevenueCalculator:
 
 # =================== MAIN EXECUTION ===================
 
+def export_v11_database(db_path: str, since: Optional[str] = None, incremental: bool = False) -> List[Dict]:
+    """Stream articles_v11 and social_posts to JSONL without loading them into memory"""
+    
+    export_dir = 'exports/database'
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    state_file = f'{export_dir}/export_state.json' if incremental else None
+    exporter = StreamingExporter(db_path)
+    
+    results = []
+    for table in ('articles_v11', 'social_posts'):
+        result = exporter.export_table(table, f'{export_dir}/{table}_{timestamp}.jsonl.gz', since, state_file)
+        print(f"   📦 {table}: {result['rows']} rows -> {result['path']}")
+        results.append(result)
+    
+    return results
+
 def main():
     """Main execution function"""
     
@@ -2708,11 +2799,18 @@ def main():
             traceback.print_exc()
             return 1
     
+    # Streaming database export (no engine initialization needed)
+    if len(sys.argv) > 1 and sys.argv[1] == '--export':
+        since = sys.argv[sys.argv.index('--since') + 1] if '--since' in sys.argv[2:-1] else None
+        export_v11_database('data/profit_machine_v11.db', since, '--incremental' in sys.argv)
+        return 0
+    
     # Interactive mode
     print("\n🎮 Interactive GOD MODE v11.0")
     print("\nAvailable commands:")
     print("  --setup     : Setup directories and config file")
     print("  --execute   : Execute GOD MODE (full automation)")
+    print("  --export    : Stream database to JSONL (--since YYYY-MM-DD, --incremental)")
     print("  --test      : Test individual components")
     print("  --help      : Show this help")
     